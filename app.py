@@ -3,71 +3,201 @@
 import dash
 from dash import html
 import dash_bootstrap_components as dbc
-from dash import dcc, Input, Output
+from dash import dcc, ctx, Input, Output, State, MATCH
 
-from src.config.config import CONTENT_STYLE, YEAR_TO_FILE, AVAILABLE_YEARS
-from src.components.layout import create_sidebar
-from src.utils.data_processing import load_data_file
+from src.config.config import (
+    AVAILABLE_YEARS,
+    CONTENT_STYLE,
+    METRICS_ENABLED,
+    METRICS_ROUTE,
+    METRICS_TOKEN,
+    PROGRESSIVE_LOADING,
+    YEAR_TO_FILE,
+)
+from src.components.layout import create_sidebar, style_chart_figure
+from src.components.charts import create_no_data_figure
+from src.components.progressive import CHART_GRAPH_TYPE, CHART_SPEC_TYPE, build_deferred_figure, get_emitted_chart
+from src.components.wordclouds import register_wordcloud_route
+from src.utils.bounded_cache import LRUCache
+from src.utils.data_processing import load_data_file, get_dataset_fingerprint
+from src.utils.logging_setup import configure_logging
+from src.utils.metrics import install_request_metrics, instrument_callback, set_request_name, stage
 from src.pages.demographics import build_demographics_page
 # from src.pages.experience import build_experience_page  # Experience page removed
 from src.pages.genai_usage import build_genai_usage_page
 from src.pages.barriers import build_barriers_page
 from src.pages.insights import build_insights_page
-from src.pages.open_ended import build_open_ended_page
+from src.pages.open_ended import (
+    PAGINATION_ID,
+    QUESTION_FILTER_ID,
+    RESULTS_ID,
+    SEARCH_INPUT_ID,
+    build_open_ended_page,
+    build_response_results,
+    get_page_count,
+)
+from src.utils.response_index import get_response_search_index
 # (Add more imports for new sections as needed)
 
+# Year shown before the user picks one in the sidebar
+DEFAULT_YEAR = 2025
+
+# Page builders per route
+PAGE_BUILDERS = {
+    "/": build_demographics_page,
+    "/genai-usage": build_genai_usage_page,
+    "/barriers": build_barriers_page,
+    "/insights": build_insights_page,
+    "/open-ended": build_open_ended_page,
+}
+
+# Routes whose page builders can defer their charts to the progressive chart callback
+PROGRESSIVE_ROUTES = {"/", "/genai-usage", "/barriers", "/insights"}
+
+# Maximum number of built pages kept in the page cache (every route of several survey years)
+PAGE_CACHE_MAX_ENTRIES = 64
+
+# Built page content per (year, pathname), stored with the fingerprint of the data it was built from
+_page_cache = LRUCache(PAGE_CACHE_MAX_ENTRIES)
+
+# Application log at LOG_LEVEL (per-module loggers, see src/utils/logging_setup.py)
+configure_logging()
+
 # Initialize the Dash app
 external_stylesheets = [dbc.themes.YETI, dbc.icons.BOOTSTRAP]
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets, suppress_callback_exceptions=True)
 app.title = "GenAI in RE Survey Dashboard"
 
+# Word-cloud PNGs are served as static files from the content-addressed cache
+register_wordcloud_route(app.server)
+
+# Per-callback timings (Server-Timing headers) and their percentiles at METRICS_ROUTE
+if METRICS_ENABLED:
+    install_request_metrics(app.server, METRICS_ROUTE, METRICS_TOKEN)
+
 # Create the app layout
+# The sidebar (year dropdown and NavLinks) is static: the dropdown keeps its own value and the
+# NavLinks highlight the active route client-side, so navigation only ships the page content.
 app.layout = dbc.Container([
     dcc.Location(id="url", refresh=False),
-    dcc.Dropdown(id="year-dropdown", style={"display": "none"}),  # Hidden placeholder for callback registration
-    html.Div(id="sidebar-container"),
+    html.Div(create_sidebar(selected_year=DEFAULT_YEAR), id="sidebar-container"),
     html.Div(id="page-content", style=CONTENT_STYLE),
 ], fluid=True, style={"min-height": "100vh", "background-color": "#f8f9fa"})
 
-# Callback to update sidebar and page content based on URL and year
+def build_not_found_page(pathname: str) -> dbc.Container:
+    """Build the 404 page for an unknown pathname."""
+    return dbc.Container(
+        [
+            html.H1("404: Not found", className="text-danger"),
+            html.Hr(),
+            html.P(f"The pathname {pathname} was not recognised..."),
+            dbc.Button("Go to Homepage", href="/", color="primary", className="mt-3")
+        ],
+        className="py-5 text-center",
+    )
+
+def get_page_content(selected_year: int, pathname: str) -> dbc.Container:
+    """
+    Get the page content for a route and year, building it only on the first request.
+    
+    Pages are cached per (year, pathname) together with the fingerprint of the
+    data file they were built from; a changed data file triggers a rebuild.
+    """
+    if pathname not in PAGE_BUILDERS:
+        return build_not_found_page(pathname)
+    data_file = YEAR_TO_FILE.get(selected_year)
+    with stage("load"):
+        df = load_data_file(data_file)
+    fingerprint = get_dataset_fingerprint(df)
+    key = (selected_year, pathname)
+    entry = _page_cache.get(key, valid=lambda entry: entry[0] == fingerprint)
+    if entry is not None:
+        return entry[1]
+    with stage("build"):
+        if PROGRESSIVE_LOADING and pathname in PROGRESSIVE_ROUTES:
+            page = PAGE_BUILDERS[pathname](df, progressive=True)
+        else:
+            page = PAGE_BUILDERS[pathname](df)
+        content = dbc.Container([page], fluid=True)
+    _page_cache.put(key, (fingerprint, content))
+    return content
+
+def get_page_cache_stats() -> dict:
+    """Get the hit, miss and eviction counters, size and max size of the page cache."""
+    return _page_cache.stats()
+
+# Callback to update the page content based on URL and year
 @app.callback(
-    [Output("sidebar-container", "children"), Output("page-content", "children")],
+    Output("page-content", "children"),
     [Input("url", "pathname"), Input("year-dropdown", "value")]
 )
-def render_page_and_sidebar(pathname: str, selected_year: int):
+@instrument_callback("page")
+def render_page_content(pathname: str, selected_year: int):
     """
-    Render the sidebar and appropriate page content based on the URL pathname and selected year.
+    Render the appropriate page content based on the URL pathname and selected year.
     """
-    # Default to 2025 if not set
-    if not selected_year:
-        selected_year = 2025
-    # Load data for the selected year
-    data_file = YEAR_TO_FILE.get(selected_year)
-    df = load_data_file(data_file)
-    # Sidebar with year selection
-    sidebar = create_sidebar(selected_year=selected_year)
-    # Route to the appropriate page
-    if pathname == "/":
-        content = dbc.Container([build_demographics_page(df)], fluid=True)
-    elif pathname == "/genai-usage":
-        content = dbc.Container([build_genai_usage_page(df)], fluid=True)
-    elif pathname == "/barriers":
-        content = dbc.Container([build_barriers_page(df)], fluid=True)
-    elif pathname == "/insights":
-        content = dbc.Container([build_insights_page(df)], fluid=True)
-    elif pathname == "/open-ended":
-        content = dbc.Container([build_open_ended_page(df)], fluid=True)
-    else:
-        content = dbc.Container(
-            [
-                html.H1("404: Not found", className="text-danger"),
-                html.Hr(),
-                html.P(f"The pathname {pathname} was not recognised..."),
-                dbc.Button("Go to Homepage", href="/", color="primary", className="mt-3")
-            ],
-            className="py-5 text-center",
-        )
-    return sidebar, content
+    # Metrics per known route; unknown pathnames share one name
+    set_request_name(f"page {pathname}" if pathname in PAGE_BUILDERS else "page not-found")
+    if not isinstance(selected_year, int) or selected_year not in YEAR_TO_FILE:
+        selected_year = DEFAULT_YEAR
+    # Route to the appropriate page (cached per year and route)
+    return get_page_content(selected_year, pathname)
+
+# Callback filling one progressive chart placeholder; every chart on a page is its own request
+@app.callback(
+    Output({"type": CHART_GRAPH_TYPE, "index": MATCH}, "figure"),
+    Input({"type": CHART_SPEC_TYPE, "index": MATCH}, "data")
+)
+@instrument_callback("chart")
+def render_progressive_chart(spec: dict):
+    """
+    Build the figure of a chart placeholder from the chart spec stored next to it.
+    """
+    if not spec:
+        raise dash.exceptions.PreventUpdate
+    year = spec.get("year") if isinstance(spec, dict) else None
+    # A forged spec can hold any JSON value (e.g. a list) as year; only an int is looked up
+    if PROGRESSIVE_LOADING and get_emitted_chart(spec) is None and isinstance(year, int) and year in YEAR_TO_FILE:
+        # Specs are recorded as pages are built; this process may not have built the year's pages yet
+        for pathname in PROGRESSIVE_ROUTES:
+            get_page_content(year, pathname)
+    with stage("build"):
+        fig = build_deferred_figure(spec)
+        return style_chart_figure(fig if fig is not None else create_no_data_figure())
+
+# Callback of the open-ended search view: only the requested page of matches is sent
+@app.callback(
+    [Output(RESULTS_ID, "children"), Output(PAGINATION_ID, "max_value"), Output(PAGINATION_ID, "active_page")],
+    [Input(SEARCH_INPUT_ID, "value"), Input(QUESTION_FILTER_ID, "value"), Input(PAGINATION_ID, "active_page")],
+    State("year-dropdown", "value"),
+    prevent_initial_call=True
+)
+@instrument_callback("open-ended-search")
+def render_open_ended_results(query: str, question: int, active_page: int, selected_year: int):
+    """
+    Search the open-ended responses of the selected year and render one page of matches.
+    
+    A new query or question filter starts again at the first page; an
+    unknown year shows the DEFAULT_YEAR responses.
+    """
+    if not isinstance(selected_year, int) or selected_year not in YEAR_TO_FILE:
+        selected_year = DEFAULT_YEAR
+    with stage("load"):
+        df = load_data_file(YEAR_TO_FILE[selected_year])
+        index = get_response_search_index(df)
+    with stage("search"):
+        matches = index.search(query, question)
+    page = active_page if ctx.triggered_id == PAGINATION_ID and active_page else 1
+    page = min(page, get_page_count(matches))
+    with stage("build"):
+        results = build_response_results(index, matches, page)
+    return results, get_page_count(matches), page
+
+def prepare_text_views() -> None:
+    """Build the open-ended search index of every survey year."""
+    for data_file in YEAR_TO_FILE.values():
+        get_response_search_index(load_data_file(data_file))
 
 if __name__ == "__main__":
+    prepare_text_views()
     app.run(debug=True, port=8053)
@@ -0,0 +1,138 @@
+"""Allocation check of the page builders: peak memory per page build must stay bounded.
+
+Usage:
+    python -m benchmarks.allocations [--scales 1 10 100] [--output PATH]
+
+Builds every dashboard page on synthetic datasets of growing size (see
+src.utils.synthetic_data) and records the tracemalloc peak of each build
+(figure cache cleared, so every chart is built). The transient peak is
+the peak minus what the built page retains (e.g. the open-ended page holds
+every response). A chart pipeline that copies the survey frame allocates
+at least the frame's size per copy, so the check fails if, between the
+smallest and the largest dataset, the transient peak of a page grows by
+more than MAX_PEAK_GROWTH_RATIO times the growth of the frame itself. It
+also fails if a page build modifies the shared frame.
+
+Exits with status 1 on failure, so it can gate a release. The report is
+written as JSON, to benchmarks/results/allocations.json by default.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import List
+
+import pandas as pd
+
+from benchmarks.common import RESULTS_DIR, get_environment, write_report
+from src.config.config import YEAR_TO_FILE
+from src.components.figure_cache import clear_figure_cache
+from src.utils.data_processing import _read_data_file, clear_dataset_cache, load_data_file
+from src.utils.synthetic_data import generate_survey_file
+from src.pages.demographics import build_demographics_page
+from src.pages.genai_usage import build_genai_usage_page
+from src.pages.barriers import build_barriers_page
+from src.pages.insights import build_insights_page
+from src.pages.open_ended import build_open_ended_page
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "allocations.json")
+
+# Allowed growth of a page build's transient peak per byte of frame growth (a full copy is >= 1)
+MAX_PEAK_GROWTH_RATIO = 0.5
+
+# Pages served by the dashboard
+PAGE_BUILDERS = {
+    "demographics": build_demographics_page,
+    "genai_usage": build_genai_usage_page,
+    "barriers": build_barriers_page,
+    "insights": build_insights_page,
+    "open_ended": build_open_ended_page,
+}
+
+def measure_page_allocations(build_page, df: pd.DataFrame) -> dict:
+    """
+    Measure one cold build of a page with tracemalloc.
+
+    Returns:
+        Dictionary with the peak, the bytes retained by the built page and
+        the transient peak (peak minus retained), in bytes
+    """
+    clear_figure_cache()
+    tracemalloc.start()
+    try:
+        page = build_page(df)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del page
+    return {"peak": peak, "retained": retained, "transient": peak - retained}
+
+def run_check(scales: List[int] = None) -> dict:
+    """
+    Measure the page build peaks per dataset size and check them against the budget.
+
+    Returns:
+        The report: environment, settings, measurements per scale and the failures found
+    """
+    scales = sorted(DEFAULT_SCALES if scales is None else scales)
+    base_file = YEAR_TO_FILE[sorted(YEAR_TO_FILE)[0]]
+    base_rows = len(_read_data_file(base_file))
+    measurements = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        for factor in scales:
+            data_file = generate_survey_file(base_file, os.path.join(directory, f"x{factor}.csv"), base_rows * factor)
+            df = load_data_file(data_file)
+            # Warm up lazily built state (column index, task scale map, plotly validators)
+            for build_page in PAGE_BUILDERS.values():
+                build_page(df)
+            before = pd.util.hash_pandas_object(df.astype(object), index=True).sum()
+            entry = {"rows": int(len(df)), "frame_bytes": int(df.memory_usage(deep=True).sum()), "pages": {}}
+            for name, build_page in PAGE_BUILDERS.items():
+                entry["pages"][name] = measure_page_allocations(build_page, df)
+            if pd.util.hash_pandas_object(df.astype(object), index=True).sum() != before:
+                failures.append(f"a page build modified the survey frame ({factor}x)")
+            measurements[str(factor)] = entry
+            clear_dataset_cache()
+    smallest, largest = measurements[str(scales[0])], measurements[str(scales[-1])]
+    frame_growth = largest["frame_bytes"] - smallest["frame_bytes"]
+    for name in PAGE_BUILDERS:
+        peak_growth = largest["pages"][name]["transient"] - smallest["pages"][name]["transient"]
+        if frame_growth > 0 and peak_growth > MAX_PEAK_GROWTH_RATIO * frame_growth:
+            failures.append(
+                f"{name}: transient peak grew by {peak_growth} bytes for {frame_growth} bytes of data "
+                f"(budget {MAX_PEAK_GROWTH_RATIO:.0%})"
+            )
+    return {
+        "environment": get_environment(),
+        "settings": {"scales": scales, "max_peak_growth_ratio": MAX_PEAK_GROWTH_RATIO},
+        "measurements": measurements,
+        "failures": failures,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that page builds do not allocate per-chart frame copies.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Row multipliers of the synthetic datasets")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_check(args.scales)
+    for factor, entry in report["measurements"].items():
+        print(f"{factor}x ({entry['rows']} rows, frame {entry['frame_bytes'] / 2**20:.1f} MiB):")
+        for name, allocations in entry["pages"].items():
+            print(f"  {name:<14} peak {allocations['peak'] / 2**20:>8.2f} MiB   "
+                  f"retained {allocations['retained'] / 2**20:>8.2f} MiB   "
+                  f"transient {allocations['transient'] / 2**20:>8.2f} MiB")
+    print(f"Report written to {write_report(report, args.output)}")
+    for failure in report["failures"]:
+        print(f"FAIL {failure}")
+    if report["failures"]:
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
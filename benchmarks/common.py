@@ -0,0 +1,90 @@
+"""Shared helpers of the benchmark scripts: timing, percentiles and JSON reports."""
+
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Percentiles reported for every timed operation
+PERCENTILES = (50, 90, 95, 99)
+
+# Directory the benchmark reports are written to by default (git-ignored)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize timing samples (in seconds) as milliseconds.
+
+    Args:
+        samples: Wall-clock durations of the individual runs
+
+    Returns:
+        Dictionary with runs, min, mean, max and the PERCENTILES in ms
+    """
+    values = np.asarray(samples, dtype=float) * 1000.0
+    summary = {
+        "runs": int(values.size),
+        "min_ms": float(values.min()),
+        "mean_ms": float(values.mean()),
+        "max_ms": float(values.max()),
+    }
+    for p in PERCENTILES:
+        summary[f"p{p}_ms"] = float(np.percentile(values, p))
+    return summary
+
+def time_call(func: Callable, repeat: int, setup: Callable = None) -> Dict[str, float]:
+    """
+    Time repeat calls of func, running setup (untimed) before every call.
+
+    Returns:
+        The summarize() of the call durations, or {"error": ...} if func raises
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+def get_environment() -> dict:
+    """Describe the interpreter and library versions the benchmark ran with."""
+    import plotly
+    import dash
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "plotly": plotly.__version__,
+        "dash": dash.__version__,
+    }
+
+def write_report(report: dict, output: str) -> str:
+    """Write a benchmark report as JSON and return its path."""
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    return output
+
+def print_report(results: Dict[str, Dict[str, dict]]) -> None:
+    """Print the p50/p95 of every benchmark, grouped by dataset."""
+    for dataset, entries in results.items():
+        print(f"{dataset}:")
+        for name, summary in entries.items():
+            if "error" in summary:
+                print(f"  {name:<48} {summary['error']}")
+            elif "p50_ms" in summary:
+                print(f"  {name:<48} p50 {summary['p50_ms']:>9.2f} ms   p95 {summary['p95_ms']:>9.2f} ms")
@@ -0,0 +1,84 @@
+"""Check that frames derived from a loaded survey year never share its cached results.
+
+Usage:
+    python -m benchmarks.derived_frames [--year 2025]
+
+pandas copies DataFrame.attrs, and with it the dataset fingerprint, to
+every derived frame. The caches keyed by the fingerprint (figures,
+aggregates, correlations, profiles, text indexes) must only serve the
+frame returned by load_data_file. For every derivation in DERIVATIONS the
+check verifies that the derived frame has no fingerprint, and that a
+chart built from a filtered frame shows the filtered answers rather than
+the cached figure of the whole year.
+
+Exits with status 1 on failure.
+"""
+
+import argparse
+import sys
+
+import pandas as pd
+
+from src.components.charts import make_bar_chart
+from src.components.figure_cache import clear_figure_cache
+from src.config.config import YEAR_TO_FILE
+from src.utils.data_processing import get_dataset_aggregates, get_dataset_fingerprint, load_data_file
+
+# Ways chart code derives frames from the shared survey frame
+DERIVATIONS = {
+    "mask": lambda df: df[df.index % 2 == 0],
+    "columns": lambda df: df[list(df.columns[:5])],
+    "head": lambda df: df.head(10),
+    "dropna": lambda df: df.dropna(how="all"),
+    "copy": lambda df: df.copy(),
+    "sample": lambda df: df.sample(frac=0.5, random_state=0),
+}
+
+def get_bar_counts(fig) -> list:
+    """Return the counts shown by a bar chart, in ascending order."""
+    return sorted(int(count) for count in fig.data[0].y)
+
+def run_checks(year: int) -> list:
+    """Run the checks on a survey year and return the failures."""
+    failures = []
+    df = load_data_file(YEAR_TO_FILE[year])
+    if get_dataset_fingerprint(df) is None:
+        failures.append("the loaded frame has no fingerprint")
+    for name, derive in DERIVATIONS.items():
+        if get_dataset_fingerprint(derive(df)) is not None:
+            failures.append(f"{name}: the derived frame shares the fingerprint of the loaded frame")
+
+    # Chart a column whose answers differ between the halves of the respondents
+    clear_figure_cache()
+    subset = df.iloc[: len(df) // 2]
+    col = next(
+        c for c in df.columns
+        if not pd.api.types.is_numeric_dtype(df[c]) and 1 < df[c].nunique() <= 10
+        and not subset[c].value_counts().equals(df[c].value_counts())
+    )
+    full_counts = get_bar_counts(make_bar_chart(df, col))
+    subset_counts = get_bar_counts(make_bar_chart(subset, col))
+    # Unanswered rows are shown as "N/A"
+    expected = sorted(int(count) for count in subset[col].value_counts(dropna=False) if count > 0)
+    if subset_counts == full_counts:
+        failures.append(f"a chart of a filtered frame shows the whole year ({col!r})")
+    if subset_counts != expected:
+        failures.append(f"a chart of a filtered frame does not show the filtered answers ({col!r})")
+    if get_dataset_aggregates(subset).total != len(subset):
+        failures.append("a filtered frame is counted with the aggregates of the whole year")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that derived frames bypass the dataset caches.")
+    parser.add_argument("--year", type=int, default=sorted(YEAR_TO_FILE)[0], help="Survey year to check")
+    args = parser.parse_args()
+
+    failures = run_checks(args.year)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark experience parsing: per-value parse_experience vs the column-wide parse_experience_column.
+
+Usage:
+    python -m benchmarks.experience [--repeat 3] [--rows 10000 100000 1000000] [--output PATH]
+
+Times Series.apply(parse_experience) against parse_experience_column on
+the years-of-experience answers of the first survey year, repeated to the
+requested number of respondents, both as plain strings and as encoded at
+load time (categoricals). All variants must return the same values.
+
+The report is written as JSON, to benchmarks/results/experience.json by default.
+"""
+
+import argparse
+import os
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import RESULTS_DIR, get_environment, time_call, write_report
+from src.config.config import YEAR_TO_FILE
+from src.utils.column_index import get_column_index
+from src.utils.data_processing import load_data_file, parse_experience, parse_experience_column
+
+DEFAULT_REPEAT = 3
+DEFAULT_ROWS = [10000, 100000, 1000000]
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "experience.json")
+
+# Question text of the experience column parsed in the benchmark
+EXPERIENCE_COLUMN = "How many years of professional experience do you have"
+
+def build_answers(rows: int) -> pd.Series:
+    """Repeat the experience answers of the first survey year (as strings) to rows respondents."""
+    df = load_data_file(YEAR_TO_FILE[sorted(YEAR_TO_FILE)[0]])
+    col = get_column_index(df.columns).resolve(EXPERIENCE_COLUMN)
+    if col is None:
+        raise KeyError(f"No column matching {EXPERIENCE_COLUMN!r}")
+    answers = df[col].astype(object).to_numpy()
+    return pd.Series(np.resize(answers, rows), name=col, dtype=object)
+
+def run_benchmarks(repeat: int = DEFAULT_REPEAT, row_counts: List[int] = None) -> dict:
+    """
+    Time the parsing variants for every row count.
+
+    Returns:
+        The report: environment, settings and, per row count, the timings and speedups
+    """
+    row_counts = DEFAULT_ROWS if row_counts is None else row_counts
+    results = {}
+    for rows in row_counts:
+        strings = build_answers(rows)
+        encoded = strings.astype("category")
+        expected = pd.to_numeric(strings.apply(parse_experience), errors="coerce").to_numpy(dtype=float)
+        for values in (strings, encoded):
+            if not np.array_equal(parse_experience_column(values).to_numpy(), expected, equal_nan=True):
+                raise AssertionError("parse_experience_column differs from parse_experience")
+        entry = {
+            "apply": time_call(lambda: strings.apply(parse_experience), repeat),
+            "vectorized_strings": time_call(lambda: parse_experience_column(strings), repeat),
+            "vectorized_encoded": time_call(lambda: parse_experience_column(encoded), repeat),
+        }
+        for variant in ("vectorized_strings", "vectorized_encoded"):
+            entry[f"speedup_{variant}"] = entry["apply"]["p50_ms"] / entry[variant]["p50_ms"]
+        results[str(rows)] = entry
+    return {
+        "environment": get_environment(),
+        "settings": {"repeat": repeat, "rows": row_counts},
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark experience parsing.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Respondent counts to test")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.repeat, args.rows)
+    for rows, entry in report["results"].items():
+        print(f"{rows:>8} respondents: apply {entry['apply']['p50_ms']:>9.2f} ms   "
+              f"strings {entry['vectorized_strings']['p50_ms']:>8.2f} ms "
+              f"(x{entry['speedup_vectorized_strings']:.0f})   "
+              f"encoded {entry['vectorized_encoded']['p50_ms']:>8.2f} ms "
+              f"(x{entry['speedup_vectorized_encoded']:.0f})")
+    print(f"Report written to {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Import-time benchmark of the app: its share of the cold start must stay within a budget.
+
+Usage:
+    python -m benchmarks.import_time [--repeat 10] [--top 15] [--output PATH]
+
+Imports app.py in `repeat` fresh interpreters. Every run first imports
+FRAMEWORK_MODULES, then the app, and times both: the cold start is their
+sum, and the app's own share (its modules and the further packages they
+import) is the second part. Another `repeat` imports run with
+`python -X importtime` (which slows the import down, so they are not
+timed) for a breakdown: the median self and cumulative time of the
+modules the app imports (the packages imported directly by app.py and
+every module of this project), slowest first.
+
+Exits with status 1 if the median app share exceeds APP_IMPORT_BUDGET_MS,
+or if one of DEFERRED_MODULES is loaded by the import: these are only
+needed by some charts and must be imported on first use. The report is written
+as JSON, to benchmarks/results/import_time.json by default.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.common import RESULTS_DIR, get_environment, summarize, write_report
+
+DEFAULT_REPEAT = 10
+DEFAULT_TOP = 15
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "import_time.json")
+
+# Libraries every request needs; their import time is the floor of the cold start
+FRAMEWORK_MODULES = ("numpy", "pandas", "flask", "plotly.graph_objects", "dash", "dash_bootstrap_components")
+
+# Allowed median import time of the app on top of FRAMEWORK_MODULES, in milliseconds
+APP_IMPORT_BUDGET_MS = 150
+
+# Heavy modules that importing the app must not load
+DEFERRED_MODULES = ("wordcloud", "matplotlib", "plotly.express")
+
+# Project root, the working directory of the imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in every fresh interpreter: time the imports and list the deferred modules loaded
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for module in {frameworks!r}:
+    importlib.import_module(module)
+frameworks = time.perf_counter()
+import app
+end = time.perf_counter()
+print(json.dumps({{"framework_s": frameworks - start, "app_s": end - frameworks,
+                   "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+def parse_importtime(output: str) -> List[dict]:
+    """
+    Parse the `-X importtime` lines of stderr.
+
+    Returns:
+        List of {module, depth, self_us, cumulative_us}; depth 0 is the imported module itself
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append({
+            "module": name.strip(),
+            "depth": depth,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return entries
+
+def run_import(importtime: bool = False) -> dict:
+    """
+    Import the app in a fresh interpreter.
+
+    Returns:
+        Dictionary with the import wall times of FRAMEWORK_MODULES and of the
+        app, the DEFERRED_MODULES loaded and, with importtime, the parsed
+        import times of all modules
+    """
+    options = ["-X", "importtime"] if importtime else []
+    script = IMPORT_SCRIPT.format(frameworks=FRAMEWORK_MODULES, deferred=DEFERRED_MODULES)
+    result = subprocess.run(
+        [sys.executable, *options, "-c", script],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return {**json.loads(result.stdout.strip().splitlines()[-1]), "modules": parse_importtime(result.stderr)}
+
+def get_breakdown(runs: List[dict], top: int) -> List[dict]:
+    """Median self and cumulative time of the direct imports of app and of the project modules, slowest first."""
+    samples: Dict[str, Dict[str, list]] = defaultdict(lambda: {"self_us": [], "cumulative_us": []})
+    for run in runs:
+        depth = None
+        for entry in reversed(run["modules"]):
+            # importtime lists a module after its imports, so walking backwards from the app
+            # visits its imports until the next module at the app's depth
+            if entry["module"] == "app":
+                depth = entry["depth"]
+                continue
+            if depth is None:
+                continue
+            if entry["depth"] <= depth:
+                break
+            if entry["depth"] == depth + 1 or entry["module"].split(".")[0] == "src":
+                samples[entry["module"]]["self_us"].append(entry["self_us"])
+                samples[entry["module"]]["cumulative_us"].append(entry["cumulative_us"])
+    breakdown = [
+        {
+            "module": module,
+            "self_ms": float(np.median(times["self_us"])) / 1000,
+            "cumulative_ms": float(np.median(times["cumulative_us"])) / 1000,
+        }
+        for module, times in samples.items()
+    ]
+    breakdown.sort(key=lambda entry: entry["cumulative_ms"], reverse=True)
+    return breakdown[:top]
+
+def run_benchmark(repeat: int = DEFAULT_REPEAT, top: int = DEFAULT_TOP) -> dict:
+    """
+    Import the app repeat times and check the import budget.
+
+    Returns:
+        The report: environment, settings, import wall times, module breakdown and failures
+    """
+    runs = [run_import() for _ in range(repeat)]
+    profiled = [run_import(importtime=True) for _ in range(repeat)]
+    timings = {
+        "cold_start": summarize([run["framework_s"] + run["app_s"] for run in runs]),
+        "frameworks": summarize([run["framework_s"] for run in runs]),
+        "app": summarize([run["app_s"] for run in runs]),
+    }
+    loaded = sorted({module for run in runs + profiled for module in run["loaded"]})
+    failures = []
+    if timings["app"]["p50_ms"] > APP_IMPORT_BUDGET_MS:
+        failures.append(f"median app import {timings['app']['p50_ms']:.1f} ms exceeds {APP_IMPORT_BUDGET_MS} ms")
+    for module in loaded:
+        failures.append(f"importing the app loads {module}")
+    return {
+        "environment": get_environment(),
+        "settings": {
+            "repeat": repeat,
+            "framework_modules": list(FRAMEWORK_MODULES),
+            "app_import_budget_ms": APP_IMPORT_BUDGET_MS,
+            "deferred_modules": list(DEFERRED_MODULES),
+        },
+        "import": timings,
+        "breakdown": get_breakdown(profiled, top),
+        "failures": failures,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import time of the app.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Fresh interpreters to import the app in")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Modules listed in the breakdown")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.repeat, args.top)
+    for name, timing in report["import"].items():
+        print(f"{name:<12} p50 {timing['p50_ms']:>7.1f} ms   p90 {timing['p90_ms']:>7.1f} ms")
+    print(f"Budget of the app import: {APP_IMPORT_BUDGET_MS} ms")
+    print(f"  {'module':<40} {'self ms':>9} {'cumulative ms':>14}")
+    for entry in report["breakdown"]:
+        print(f"  {entry['module']:<40} {entry['self_ms']:>9.1f} {entry['cumulative_ms']:>14.1f}")
+    print(f"Report written to {write_report(report, args.output)}")
+    for failure in report["failures"]:
+        print(f"FAIL {failure}")
+    if report["failures"]:
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
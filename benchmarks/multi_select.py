@@ -0,0 +1,110 @@
+"""Benchmark multi-select option counting: per-cell apply vs the batched count_multi_select.
+
+Usage:
+    python -m benchmarks.multi_select [--repeat 3] [--rows 10000 100000 1000000] [--output PATH]
+
+For every GROUPED_QUESTIONS group, times the former per-cell
+apply(lambda ...) counting of make_multi_select_bar against
+count_multi_select on the answers as parsed (strings) and as encoded at
+load time (categoricals), on synthetic respondents generated from the
+first survey year. All three must return the same counts.
+
+The report is written as JSON, to benchmarks/results/multi_select.json by default.
+"""
+
+import argparse
+import os
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import RESULTS_DIR, get_environment, time_call, write_report
+from src.config.config import GROUPED_QUESTIONS, YEAR_TO_FILE
+from src.utils.column_index import get_column_index
+from src.utils.data_processing import count_multi_select, encode_survey_frame
+from src.utils.synthetic_data import generate_chunk, learn_survey_model
+
+DEFAULT_REPEAT = 3
+DEFAULT_ROWS = [10000, 100000, 1000000]
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "multi_select.json")
+
+# Respondents generated at most; larger frames repeat them
+MAX_GENERATED_ROWS = 100000
+
+def legacy_counts(df: pd.DataFrame, cols: List[str]) -> List[int]:
+    """Count the selected options the way make_multi_select_bar did before count_multi_select."""
+    return [
+        int(df[col].apply(lambda x: str(x).strip().lower() in ["selected", "yes", "1", "true"]).sum())
+        for col in cols if col in df
+    ]
+
+def build_option_frame(data_file: str, rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generate rows synthetic respondents, keeping the GROUPED_QUESTIONS option columns only."""
+    model = learn_survey_model(data_file)
+    rng = np.random.default_rng(seed)
+    generated = generate_chunk(model, min(rows, MAX_GENERATED_ROWS), 0, rng, {})
+    generated.columns = model["names"]
+    column_index = get_column_index(generated.columns)
+    resolved = (column_index.resolve(col) for group in GROUPED_QUESTIONS.values() for col in group["columns"])
+    option_cols = [col for col in dict.fromkeys(resolved) if col is not None]
+    options = generated[option_cols]
+    repeats = -(-rows // len(options))
+    return pd.concat([options] * repeats, ignore_index=True).iloc[:rows]
+
+def run_benchmarks(repeat: int = DEFAULT_REPEAT, row_counts: List[int] = None) -> dict:
+    """
+    Time the three counting variants for every group and row count.
+
+    Returns:
+        The report: environment, settings and, per row count and group, the timings and speedups
+    """
+    row_counts = DEFAULT_ROWS if row_counts is None else row_counts
+    data_file = YEAR_TO_FILE[sorted(YEAR_TO_FILE)[0]]
+    results = {}
+    for rows in row_counts:
+        raw = build_option_frame(data_file, rows)
+        encoded = encode_survey_frame(raw.copy())
+        column_index = get_column_index(raw.columns)
+        results[str(rows)] = {}
+        for key, group in GROUPED_QUESTIONS.items():
+            cols = [col for col in (column_index.resolve(col) for col in group["columns"]) if col is not None]
+            expected = legacy_counts(raw, cols)
+            for frame in (raw, encoded):
+                if count_multi_select(frame, cols)["count"].tolist() != expected:
+                    raise AssertionError(f"count_multi_select differs from the per-cell counts for {key}")
+            entry = {
+                "options": len(cols),
+                "legacy_apply": time_call(lambda: legacy_counts(raw, cols), repeat),
+                "vectorized_strings": time_call(lambda: count_multi_select(raw, cols), repeat),
+                "vectorized_encoded": time_call(lambda: count_multi_select(encoded, cols), repeat),
+            }
+            for variant in ("vectorized_strings", "vectorized_encoded"):
+                entry[f"speedup_{variant}"] = entry["legacy_apply"]["p50_ms"] / entry[variant]["p50_ms"]
+            results[str(rows)][key] = entry
+    return {
+        "environment": get_environment(),
+        "settings": {"repeat": repeat, "rows": row_counts},
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-select option counting.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Respondent counts to test")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.repeat, args.rows)
+    for rows, groups in report["results"].items():
+        print(f"{rows} respondents:")
+        for key, entry in groups.items():
+            print(f"  {key:<24} apply {entry['legacy_apply']['p50_ms']:>9.2f} ms   "
+                  f"strings {entry['vectorized_strings']['p50_ms']:>8.2f} ms "
+                  f"(x{entry['speedup_vectorized_strings']:.0f})   "
+                  f"encoded {entry['vectorized_encoded']['p50_ms']:>8.2f} ms "
+                  f"(x{entry['speedup_vectorized_encoded']:.0f})")
+    print(f"Report written to {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
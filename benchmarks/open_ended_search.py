@@ -0,0 +1,121 @@
+"""Benchmark keyword search over the open-ended responses: must stay sub-millisecond at 100k responses.
+
+Usage:
+    python -m benchmarks.open_ended_search [--responses 100000] [--repeat 200] [--output PATH]
+
+Generates a synthetic survey (see src.utils.synthetic_data) with about the
+requested number of listed open-ended responses, builds its
+ResponseSearchIndex and times typical searches: the most and least
+frequent words, two frequent words together, a word within one question
+and a word that does not occur. Every result is checked against a scan of
+the responses.
+
+Exits with status 1 if the p50 of a search exceeds SEARCH_BUDGET_MS. The
+report is written as JSON, to benchmarks/results/open_ended_search.json by default.
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import RESULTS_DIR, get_environment, time_call, write_report
+from src.config.config import YEAR_TO_FILE
+from src.utils.data_processing import _read_data_file, load_data_file
+from src.utils.response_index import ResponseSearchIndex, get_open_ended_columns, get_listed_responses
+from src.utils.synthetic_data import generate_survey_file
+from src.utils.text_index import TOKEN_PATTERN
+
+DEFAULT_RESPONSES = 100000
+DEFAULT_REPEAT = 200
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "open_ended_search.json")
+
+# Allowed median duration of one search, in milliseconds
+SEARCH_BUDGET_MS = 1.0
+
+def scan_matches(index: ResponseSearchIndex, query: str, question: int = None) -> list:
+    """Find the responses containing every keyword of a query by scanning them all."""
+    keywords = set(re.findall(TOKEN_PATTERN, query.lower()))
+    return [
+        position for position, response in enumerate(index.responses)
+        if (question is None or index.questions[position] == question)
+        and keywords <= set(re.findall(TOKEN_PATTERN, response.lower()))
+    ]
+
+def get_queries(index: ResponseSearchIndex) -> dict:
+    """Pick the benchmark queries from the words of the indexed responses."""
+    counts = index.corpus.document_frequencies
+    ranked = np.argsort(-counts, kind="stable")
+    frequent, second = index.corpus.vocabulary[ranked[0]], index.corpus.vocabulary[ranked[1]]
+    busiest_question = int(np.bincount(index.questions).argmax())
+    return {
+        "frequent_word": (frequent, None),
+        "rare_word": (index.corpus.vocabulary[ranked[-1]], None),
+        "two_words": (f"{frequent} {second}", None),
+        "word_in_question": (frequent, busiest_question),
+        "missing_word": ("zzzzzz", None),
+    }
+
+def run_benchmark(responses: int = DEFAULT_RESPONSES, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Build the search index of a synthetic survey and time the searches.
+
+    Returns:
+        The report: environment, settings, index size and build time, timings per query and failures
+    """
+    base_file = YEAR_TO_FILE[sorted(YEAR_TO_FILE)[0]]
+    base = _read_data_file(base_file)
+    per_row = sum(len(get_listed_responses(base[col])) for col in get_open_ended_columns(base)) / len(base)
+    rows = math.ceil(responses / per_row)
+    with tempfile.TemporaryDirectory() as directory:
+        df = load_data_file(generate_survey_file(base_file, os.path.join(directory, "survey.csv"), rows))
+        start = time.perf_counter()
+        index = ResponseSearchIndex(df, get_open_ended_columns(df))
+        build_s = time.perf_counter() - start
+
+    results = {}
+    failures = []
+    for name, (query, question) in get_queries(index).items():
+        matches = index.search(query, question)
+        if matches.tolist() != scan_matches(index, query, question):
+            failures.append(f"{name}: search results differ from a scan of the responses")
+        timing = time_call(lambda: index.search(query, question), repeat)
+        results[name] = {"query": query, "question": question, "matches": int(len(matches)), **timing}
+        if timing["p50_ms"] > SEARCH_BUDGET_MS:
+            failures.append(f"{name}: p50 {timing['p50_ms']:.3f} ms exceeds {SEARCH_BUDGET_MS} ms")
+    return {
+        "environment": get_environment(),
+        "settings": {"responses": responses, "repeat": repeat, "search_budget_ms": SEARCH_BUDGET_MS},
+        "index": {"rows": int(rows), "responses": len(index), "terms": int(len(index.corpus.vocabulary)),
+                  "build_s": build_s},
+        "results": results,
+        "failures": failures,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword search over the open-ended responses.")
+    parser.add_argument("--responses", type=int, default=DEFAULT_RESPONSES, help="Approximate number of responses")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per query")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.responses, args.repeat)
+    index = report["index"]
+    print(f"{index['responses']} responses ({index['rows']} respondents, {index['terms']} terms), "
+          f"index built in {index['build_s']:.2f} s")
+    for name, entry in report["results"].items():
+        print(f"  {name:<18} {entry['matches']:>7} matches   p50 {entry['p50_ms']:.3f} ms   p99 {entry['p99_ms']:.3f} ms")
+    print(f"Report written to {write_report(report, args.output)}")
+    for failure in report["failures"]:
+        print(f"FAIL {failure}")
+    if report["failures"]:
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Benchmark the load -> build page -> serialize pipeline of the dashboard.
+
+Usage:
+    python -m benchmarks.pipeline [--repeat 5] [--scales 10 100] [--output PATH]
+
+Times load_data_file, generate_chart per chart type, generate_grouped_bar_chart,
+make_task_scale_chart, every build_*_page in src/pages and the JSON
+serialization of figures and pages. It runs against every file in
+YEAR_TO_FILE and against synthetic datasets generated from the first year,
+scaled up by --scales. Chart builders are timed cold (figure cache bypassed or
+cleared), so the numbers reflect the actual build cost.
+
+The report is written as JSON with per-benchmark percentiles (see
+benchmarks.common), to benchmarks/results/pipeline.json by default.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import tempfile
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+import plotly
+
+from benchmarks.common import RESULTS_DIR, get_environment, print_report, time_call, write_report
+from src.config.config import DEMOGRAPHIC_COLS, GROUPED_QUESTIONS, GROUPED_TASK_SCALES, YEAR_TO_FILE
+from src.components.charts import generate_chart, generate_grouped_bar_chart
+from src.components.figure_cache import clear_figure_cache
+from src.pages.insights import make_task_scale_chart
+from src.utils.data_processing import _read_data_file, clear_dataset_cache, load_data_file
+from src.utils.synthetic_data import generate_survey_file
+import src.pages
+
+# Chart types accepted by generate_chart
+CHART_TYPES = ['auto', 'bar', 'bar_h', 'histogram', 'pie', 'donut', 'map']
+
+DEFAULT_REPEAT = 5
+DEFAULT_SCALES = [10, 100]
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "pipeline.json")
+
+def _uncached(builder: Callable) -> Callable:
+    """
+    Return the undecorated chart builder, bypassing the figure cache.
+
+    Builders such as generate_chart call other memoized builders, so the
+    timings also clear the figure cache before every run.
+    """
+    return getattr(builder, "__wrapped__", builder)
+
+def get_page_builders() -> Tuple[Dict[str, Callable], Dict[str, str]]:
+    """
+    Find every build_*_page function in the src/pages modules.
+
+    Returns:
+        Tuple of the builders keyed by "<module>.<function>" and the import errors keyed by module
+    """
+    builders, errors = {}, {}
+    for module_info in pkgutil.iter_modules(src.pages.__path__):
+        try:
+            module = importlib.import_module(f"src.pages.{module_info.name}")
+        except Exception as e:
+            errors[module_info.name] = f"{type(e).__name__}: {e}"
+            continue
+        for name in dir(module):
+            func = getattr(module, name)
+            if (name.startswith("build_") and name.endswith("_page") and callable(func)
+                    and func.__module__ == module.__name__):
+                builders[f"{module_info.name}.{name}"] = func
+    return builders, errors
+
+def write_scaled_dataset(data_file: str, factor: int, directory: str, seed: int = 0) -> str:
+    """
+    Write a synthetic survey CSV with factor times the rows of data_file.
+
+    The respondents are generated from the answer distributions of
+    data_file (see src.utils.synthetic_data); free-text answers are
+    generated and never equal a real answer, so no real answers are copied.
+
+    Returns:
+        Path of the written CSV
+    """
+    rows = len(_read_data_file(data_file)) * factor
+    path = os.path.join(directory, f"{os.path.splitext(os.path.basename(data_file))[0]}_x{factor}.csv")
+    return generate_survey_file(data_file, path, rows, seed=seed)
+
+def _chart_columns(df: pd.DataFrame) -> Tuple[str, str]:
+    """Pick a single-choice column and a numeric column of the dataset to chart."""
+    choice_col = next(col for col in DEMOGRAPHIC_COLS if col in df.columns)
+    numeric_cols = [col for col in df.select_dtypes("number").columns if df[col].notna().any()]
+    return choice_col, (numeric_cols[0] if numeric_cols else choice_col)
+
+def benchmark_dataset(data_file: str, repeat: int) -> dict:
+    """
+    Run every pipeline benchmark against one survey file.
+
+    Returns:
+        Dictionary with the row count and the timing summary per benchmark
+    """
+    results = {}
+    results["load_data_file[cold]"] = time_call(lambda: load_data_file(data_file), repeat, setup=clear_dataset_cache)
+    results["load_data_file[cached]"] = time_call(lambda: load_data_file(data_file), repeat)
+    df = load_data_file(data_file)
+
+    figures = {}
+    choice_col, numeric_col = _chart_columns(df)
+    for chart_type in CHART_TYPES:
+        col = numeric_col if chart_type == 'histogram' else choice_col
+        name = f"generate_chart[{chart_type}]"
+        results[name] = time_call(
+            lambda: _uncached(generate_chart)(df, col, None, chart_type), repeat, setup=clear_figure_cache
+        )
+        if "error" not in results[name]:
+            figures[name] = _uncached(generate_chart)(df, col, None, chart_type)
+
+    for key, group in GROUPED_QUESTIONS.items():
+        name = f"generate_grouped_bar_chart[{key}]"
+        results[name] = time_call(
+            lambda: _uncached(generate_grouped_bar_chart)(df, group['columns'], None), repeat, setup=clear_figure_cache
+        )
+        if "error" not in results[name]:
+            figures[name] = _uncached(generate_grouped_bar_chart)(df, group['columns'], None)
+
+    for phase_key in GROUPED_TASK_SCALES:
+        name = f"make_task_scale_chart[{phase_key}]"
+        results[name] = time_call(lambda: _uncached(make_task_scale_chart)(df, phase_key), repeat, setup=clear_figure_cache)
+        if "error" not in results[name]:
+            figures[name] = _uncached(make_task_scale_chart)(df, phase_key)
+
+    for name, fig in figures.items():
+        results[f"figure.to_json[{name}]"] = time_call(fig.to_json, repeat)
+
+    builders, import_errors = get_page_builders()
+    for module_name, error in import_errors.items():
+        results[f"build_page[{module_name}]"] = {"error": error}
+    for name, build_page in builders.items():
+        results[f"build_page[{name}]"] = time_call(lambda: build_page(df), repeat, setup=clear_figure_cache)
+        if "error" in results[f"build_page[{name}]"]:
+            continue
+        page = build_page(df)
+        results[f"page_json[{name}]"] = time_call(
+            lambda: json.dumps(page, cls=plotly.utils.PlotlyJSONEncoder), repeat
+        )
+    return {"rows": int(len(df)), "columns": int(df.shape[1]), "benchmarks": results}
+
+def run_benchmarks(repeat: int = DEFAULT_REPEAT, scales: List[int] = None) -> dict:
+    """
+    Benchmark the shipped survey years and the synthetic datasets scaled from the first year.
+
+    Returns:
+        The report: environment, settings and results per dataset
+    """
+    scales = DEFAULT_SCALES if scales is None else scales
+    datasets = {}
+    for year, data_file in sorted(YEAR_TO_FILE.items()):
+        if os.path.exists(data_file):
+            datasets[str(year)] = benchmark_dataset(data_file, repeat)
+    base_year, base_file = sorted(YEAR_TO_FILE.items())[0]
+    with tempfile.TemporaryDirectory() as directory:
+        for factor in scales:
+            scaled_file = write_scaled_dataset(base_file, factor, directory)
+            datasets[f"{base_year}x{factor}"] = benchmark_dataset(scaled_file, repeat)
+            clear_dataset_cache()
+            clear_figure_cache()
+    return {
+        "environment": get_environment(),
+        "settings": {"repeat": repeat, "scales": scales},
+        "datasets": datasets,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the load -> build page -> serialize pipeline.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--scales", type=int, nargs="*", default=DEFAULT_SCALES,
+                        help="Row multipliers of the synthetic datasets (none to skip them)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.repeat, args.scales)
+    print_report({name: dataset["benchmarks"] for name, dataset in report["datasets"].items()})
+    print(f"Report written to {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Memory per worker of the production entry point (wsgi.py) under gunicorn.
+
+Usage:
+    python -m benchmarks.wsgi_memory [--workers 1 4 16] [--rounds 2] [--output PATH]
+
+For every worker count, starts gunicorn with gunicorn.conf.py (the data is
+preloaded in the master and shared with the forked workers), sends every
+page of every year and every chart of the progressive pages `rounds` times,
+and reads the memory of the master and the workers from
+/proc/<pid>/smaps_rollup (Linux only):
+
+    rss  resident memory, counting pages shared with other processes in full
+    pss  proportional set size: shared pages divided among their sharers
+    uss  unique set size: pages private to the process (what a worker adds)
+
+The total PSS of all processes is the memory the server actually uses.
+The report is written as JSON, to benchmarks/results/wsgi_memory.json by default.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.common import RESULTS_DIR, get_environment, write_report
+
+DEFAULT_WORKERS = [1, 4, 16]
+DEFAULT_ROUNDS = 2
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "wsgi_memory.json")
+
+# Seconds to wait for gunicorn to preload and start serving
+STARTUP_TIMEOUT = 300
+
+# Project root, the working directory of the server
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def get_free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def read_memory(pid: int) -> Dict[str, float]:
+    """Read the RSS, PSS and USS of a process in MiB."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss_mib": fields["Rss"],
+        "pss_mib": fields["Pss"],
+        "uss_mib": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+def get_children(pid: int) -> List[int]:
+    """Return the pids of the child processes of a process."""
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+def post_callback(base_url: str, body: dict) -> dict:
+    """Send a Dash callback request and return the decoded response."""
+    request = urllib.request.Request(
+        f"{base_url}/_dash-update-component",
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return json.loads(response.read())
+
+def find_chart_specs(node, specs: list) -> list:
+    """Collect the (id, spec) of the progressive chart placeholders in serialized page content."""
+    from src.components.progressive import CHART_SPEC_TYPE
+    if isinstance(node, dict):
+        props = node.get("props", {})
+        if node.get("type") == "Store" and isinstance(props.get("id"), dict) \
+                and props["id"].get("type") == CHART_SPEC_TYPE:
+            specs.append((props["id"], props["data"]))
+        for value in node.values():
+            find_chart_specs(value, specs)
+    elif isinstance(node, list):
+        for value in node:
+            find_chart_specs(value, specs)
+    return specs
+
+def send_traffic(base_url: str) -> int:
+    """Request every page of every year and the charts of the progressive pages; return the request count."""
+    from app import PAGE_BUILDERS
+    from src.components.progressive import CHART_GRAPH_TYPE
+    from src.config.config import YEAR_TO_FILE
+    requests = 0
+    chart_output = json.dumps({"index": ["MATCH"], "type": CHART_GRAPH_TYPE}, separators=(",", ":")) + ".figure"
+    for year in YEAR_TO_FILE:
+        for pathname in PAGE_BUILDERS:
+            page = post_callback(base_url, {
+                "output": "page-content.children",
+                "outputs": {"id": "page-content", "property": "children"},
+                "inputs": [{"id": "url", "property": "pathname", "value": pathname},
+                           {"id": "year-dropdown", "property": "value", "value": year}],
+                "changedPropIds": ["url.pathname"],
+            })
+            requests += 1
+            for spec_id, spec in find_chart_specs(page, []):
+                post_callback(base_url, {
+                    "output": chart_output,
+                    "outputs": {"id": {**spec_id, "type": CHART_GRAPH_TYPE}, "property": "figure"},
+                    "inputs": [{"id": spec_id, "property": "data", "value": spec}],
+                    "changedPropIds": [],
+                })
+                requests += 1
+    return requests
+
+def measure_workers(workers: int, rounds: int) -> dict:
+    """
+    Start gunicorn with a number of workers, send the traffic and measure its processes.
+
+    Returns:
+        Dictionary with the startup time, requests sent, master memory,
+        per-worker memory (mean and max) and the total PSS
+    """
+    port = get_free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(port)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "wsgi:server"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        start = time.perf_counter()
+        while True:
+            try:
+                with urllib.request.urlopen(f"{base_url}/", timeout=5):
+                    break
+            except OSError:
+                if server.poll() is not None or time.perf_counter() - start > STARTUP_TIMEOUT:
+                    raise RuntimeError(f"gunicorn with {workers} workers did not start")
+                time.sleep(0.5)
+        startup_s = time.perf_counter() - start
+        requests = sum(send_traffic(base_url) for _ in range(rounds))
+
+        master = read_memory(server.pid)
+        worker_memory = [read_memory(pid) for pid in get_children(server.pid)]
+        summary = {
+            field: {
+                "mean": float(np.mean([m[field] for m in worker_memory])),
+                "max": float(np.max([m[field] for m in worker_memory])),
+            }
+            for field in ("rss_mib", "pss_mib", "uss_mib")
+        }
+        return {
+            "workers": len(worker_memory),
+            "startup_s": startup_s,
+            "requests": requests,
+            "master": master,
+            "per_worker": summary,
+            "total_pss_mib": master["pss_mib"] + sum(m["pss_mib"] for m in worker_memory),
+        }
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+def run_benchmark(workers: List[int] = None, rounds: int = DEFAULT_ROUNDS) -> dict:
+    """Measure the server memory for every worker count."""
+    return {
+        "environment": get_environment(),
+        "settings": {"workers": workers or DEFAULT_WORKERS, "rounds": rounds},
+        "results": [measure_workers(count, rounds) for count in (workers or DEFAULT_WORKERS)],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory per worker of the WSGI entry point.")
+    parser.add_argument("--workers", type=int, nargs="+", default=DEFAULT_WORKERS, help="Worker counts to measure")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Times every page and chart is requested")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.workers, args.rounds)
+    for entry in report["results"]:
+        worker = entry["per_worker"]
+        print(f"{entry['workers']:>3} workers: master RSS {entry['master']['rss_mib']:.0f} MiB; per worker "
+              f"RSS {worker['rss_mib']['mean']:.0f} MiB, PSS {worker['pss_mib']['mean']:.0f} MiB, "
+              f"USS {worker['uss_mib']['mean']:.0f} MiB (max {worker['uss_mib']['max']:.0f}); "
+              f"total PSS {entry['total_pss_mib']:.0f} MiB")
+    print(f"Report written to {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
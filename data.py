@@ -1,33 +1,7 @@
 import pandas as pd
-import re
 from rename_config import rename_mapping
-
-def parse_experience(val):
-    """
-    Parse years of experience from various formats:
-    - Numeric (e.g., "5")
-    - Range (e.g., "5-10")
-    - "10+" or "10 or more"
-    Returns a float or None.
-    """
-    if pd.isna(val):
-        return None
-    val = str(val).strip()
-    # If already a number
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    # If range like "5-10"
-    match = re.match(r"(\d+)\s*-\s*(\d+)", val)
-    if match:
-        low, high = map(int, match.groups())
-        return (low + high) / 2
-    # If "10+" or "10 or more"
-    match = re.match(r"(\d+)\s*\+|(\d+)\s*or more", val)
-    if match:
-        return float(match.group(1) or match.group(2))
-    return None
+# parse_experience used to be defined here and stays importable from this module
+from src.utils.data_processing import parse_experience, parse_experience_column
 
 def clean_column_names(df):
     """
@@ -41,12 +15,12 @@ def load_data(csv_path):
     Load and preprocess survey data from a CSV file.
     - Cleans column names
     - Renames columns using rename_mapping
-    - Applies parse_experience to 'years_of_experience' if present
+    - Parses 'years_of_experience' if present (see parse_experience_column)
     Returns a pandas DataFrame.
     """
     df = pd.read_csv(csv_path)
     df = clean_column_names(df)
     df = df.rename(columns=rename_mapping)
     if "years_of_experience" in df.columns:
-        df["years_of_experience"] = df["years_of_experience"].apply(parse_experience)
+        df["years_of_experience"] = parse_experience_column(df["years_of_experience"])
     return df
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""Gunicorn settings for the production entry point (wsgi.py).
+
+Usage:
+    gunicorn --config gunicorn.conf.py wsgi:server
+
+WEB_CONCURRENCY sets the number of worker processes, PORT the port.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8050')}"
+
+# Import wsgi (and preload every year) in the master, so the workers share the data copy-on-write
+preload_app = True
+
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+
+# Threads per worker, so the chart callbacks of a progressive page are served in parallel
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# The first chart requests of a page can take a few seconds on a cold figure cache
+timeout = 60
@@ -1,21 +1,32 @@
-"""Chart creation components for the dashboard."""
+"""Chart creation components for the dashboard.
 
+plotly.express takes longer to import than the rest of this module, so the
+builders using it import it on first call; importing the app stays fast
+(see benchmarks/import_time.py).
+"""
+
+import logging
 from typing import List, Optional
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from wordcloud import WordCloud, STOPWORDS
-import collections
-import re
-import unicodedata
 
-from src.config.config import PRIMARY_COLOR, STYLE_VARS
+from src.config.config import PRIMARY_COLOR, STYLE_VARS, GROUPED_TASK_SCALES
+from src.components.figure_cache import memoize_figure
+from src.components.progressive import register_chart_builder
+from src.components.wordclouds import get_wordcloud_url, request_wordcloud, wait_for_wordcloud
+from src.utils.column_index import get_column_index
+from src.utils.task_scales import get_task_scale_columns
+from src.utils.text_index import get_corpus_index
+from src.utils.data_processing import count_multi_select, get_checkbox_flags, get_dataset_aggregates
 
 # Font size configurations
 TITLE_FONT_SIZE = STYLE_VARS["FONT_SIZE"] + 2  # Slightly larger for titles
 LABEL_FONT_SIZE = STYLE_VARS["FONT_SIZE"]  # Base size for labels
 ANNOTATION_FONT_SIZE = STYLE_VARS["FONT_SIZE"]  # Base size for annotations
 
+logger = logging.getLogger(__name__)
+
 def create_no_data_figure(title: Optional[str] = None) -> go.Figure:
     """Create a placeholder figure when no data is available."""
     fig = go.Figure()
@@ -109,6 +120,7 @@ def simplify_label(col: str) -> str:
     
     return text
 
+@memoize_figure
 def make_bar_chart(
     df: pd.DataFrame,
     col: str,
@@ -116,17 +128,20 @@ def make_bar_chart(
     horizontal: bool = False
 ) -> go.Figure:
     """Create a bar chart for a categorical column."""
-    if df[col].notna().sum() == 0:
+    import plotly.express as px
+
+    aggregates = get_dataset_aggregates(df)
+    if aggregates.non_null_count(col) == 0:
         return create_no_data_figure(title)
     
-    counts = df[col].value_counts(dropna=False).reset_index()
+    counts = aggregates.value_counts(col).reset_index()
     counts.columns = [col, "count"]
     
     if counts.shape[0] == 0 or (counts.shape[0] == 1 and pd.isna(counts[col].iloc[0])):
         return create_no_data_figure(title)
     
     # Simplify the labels for display
-    counts['display_label'] = counts[col].apply(simplify_label)
+    counts['display_label'] = counts[col].astype(object).apply(simplify_label)
     
     # Determine if we need to rotate x-axis labels
     rotate = False
@@ -198,12 +213,16 @@ def make_bar_chart(
         )
     return fig
 
+@memoize_figure
 def make_pie_chart(df: pd.DataFrame, col: str, title: Optional[str] = None) -> go.Figure:
     """Create a pie chart for a categorical column."""
-    if df[col].notna().sum() == 0:
+    import plotly.express as px
+
+    aggregates = get_dataset_aggregates(df)
+    if aggregates.non_null_count(col) == 0:
         return create_no_data_figure(title)
     
-    counts = df[col].value_counts(dropna=False).reset_index()
+    counts = aggregates.value_counts(col).reset_index()
     counts.columns = [col, "count"]
     
     if counts.shape[0] == 0 or (counts.shape[0] == 1 and pd.isna(counts[col].iloc[0])):
@@ -259,12 +278,16 @@ def make_pie_chart(df: pd.DataFrame, col: str, title: Optional[str] = None) -> g
     )
     return fig
 
+@memoize_figure
 def make_donut_chart(df: pd.DataFrame, col: str, title: Optional[str] = None) -> go.Figure:
     """Create a donut chart for a categorical column."""
-    if df[col].notna().sum() == 0:
+    import plotly.express as px
+
+    aggregates = get_dataset_aggregates(df)
+    if aggregates.non_null_count(col) == 0:
         return create_no_data_figure(title)
     
-    counts = df[col].value_counts(dropna=False)
+    counts = aggregates.value_counts(col)
     
     fig = px.pie(
         names=counts.index.astype(str),
@@ -316,6 +339,7 @@ def make_donut_chart(df: pd.DataFrame, col: str, title: Optional[str] = None) ->
     
     return fig
 
+@memoize_figure
 def make_histogram(
     df: pd.DataFrame,
     col: str,
@@ -324,6 +348,8 @@ def make_histogram(
     kde: bool = True
 ) -> go.Figure:
     """Create a histogram for a numeric column with option for KDE curve."""
+    import plotly.express as px
+
     numeric_values = pd.to_numeric(df[col], errors='coerce')
     valid_data_count = numeric_values.notna().sum()
     
@@ -388,12 +414,16 @@ def make_histogram(
         )
     return fig
 
+@memoize_figure
 def make_world_map(df: pd.DataFrame, col: str, title: Optional[str] = None) -> go.Figure:
     """Create a choropleth map for countries or continents."""
-    if df[col].notna().sum() == 0:
+    import plotly.express as px
+
+    aggregates = get_dataset_aggregates(df)
+    if aggregates.non_null_count(col) == 0:
         return create_no_data_figure(title)
     
-    counts = df[col].value_counts(dropna=False)
+    counts = aggregates.value_counts(col)
     
     fig = px.choropleth(
         locations=counts.index,
@@ -421,37 +451,20 @@ def make_world_map(df: pd.DataFrame, col: str, title: Optional[str] = None) -> g
     
     return fig
 
+@memoize_figure
 def make_multi_select_bar(df: pd.DataFrame, cols: list, title: str = None) -> go.Figure:
     """Create a horizontal bar chart for multiple-select questions."""
     if not cols or df.empty:
         return create_no_data_figure(title)
 
-    # Count responses for each option (robust to various selection values)
-    counts = []
-    for col in cols:
-        if col in df:
-            # Count as selected if value is in ['selected', 'yes', '1', 'true'] (case-insensitive)
-            count = df[col].apply(lambda x: str(x).strip().lower() in ["selected", "yes", "1", "true"]).sum()
-            total = len(df)
-            if total > 0:
-                percentage = (count / total) * 100
-                # Extract text within brackets if present, otherwise use full text
-                label = col
-                if '[' in col and ']' in col:
-                    start = col.find('[') + 1
-                    end = col.rfind(']')
-                    label = col[start:end].strip()
-                counts.append({
-                    'option': label,
-                    'count': count,
-                    'percentage': percentage
-                })
+    # Count responses for each option (robust to various selection values), all options in one pass
+    counts = count_multi_select(df, cols)
 
-    if not counts:
+    if counts.empty:
         return create_no_data_figure(title)
 
     # Sort by count in descending order
-    counts_df = pd.DataFrame(counts).sort_values('count', ascending=True)
+    counts_df = counts.sort_values('count', ascending=True)
 
     # Create the horizontal bar chart
     fig = go.Figure()
@@ -496,26 +509,13 @@ def make_multi_select_bar(df: pd.DataFrame, cols: list, title: str = None) -> go
 
     return fig
 
-def normalize_colname_for_match(name):
-    # Remove all whitespace, punctuation, and lowercase
-    name = unicodedata.normalize('NFKD', name)
-    name = name.replace('\xa0', ' ')
-    name = re.sub(r'\s+', ' ', name)
-    name = name.translate(str.maketrans('', '', r'"\'!@#$%^&*()[]{};:,./<>?\\|`~-=+'))
-    return name.strip().lower()
-
 def get_best_column_match(target, columns):
     """Return the best matching column from columns for the given target string."""
-    norm_target = normalize_colname_for_match(target)
-    for col in columns:
-        if normalize_colname_for_match(col) == norm_target:
-            return col
-    # Fallback: partial match
-    for col in columns:
-        if norm_target in normalize_colname_for_match(col):
-            return col
-    return None
+    # Exact normalized match first, then partial match, resolved through the shared column index
+    return get_column_index(columns).resolve(target)
 
+@register_chart_builder
+@memoize_figure
 def generate_grouped_bar_chart(df: pd.DataFrame, cols: List[str], title: Optional[str] = None) -> go.Figure:
     """
     Create a horizontal bar chart for grouped multi-column questions (e.g., regions, barriers).
@@ -523,17 +523,17 @@ def generate_grouped_bar_chart(df: pd.DataFrame, cols: List[str], title: Optiona
     """
     if not cols or df.empty:
         return create_no_data_figure(None)
-    counts = []
-    for col in cols:
-        match_col = get_best_column_match(col, df.columns)
-        if match_col:
-            count = (df[match_col].fillna('').astype(str).str.strip().str.lower() == 'yes').sum()
-            # Extract label from column name
-            label = simplify_label(col)
-            counts.append({'option': label, 'count': count})
-    if not counts:
+    matches = [(col, get_best_column_match(col, df.columns)) for col in cols]
+    matches = [(col, match_col) for col, match_col in matches if match_col]
+    if not matches:
         return create_no_data_figure(None)
-    counts_df = pd.DataFrame(counts).sort_values('count', ascending=False)
+    # 'Yes' counts of all options at once, read from the category codes without copying the columns
+    yes_counts = get_checkbox_flags(df, [match_col for _, match_col in matches]).sum(axis=0, dtype=np.int64)
+    # Extract labels from column names
+    counts_df = pd.DataFrame({
+        'option': [simplify_label(col) for col, _ in matches],
+        'count': yes_counts,
+    }).sort_values('count', ascending=False)
     # Determine if we need to rotate y-axis labels (not needed for horizontal)
     fig = go.Figure()
     fig.add_trace(go.Bar(
@@ -564,6 +564,8 @@ def generate_grouped_bar_chart(df: pd.DataFrame, cols: List[str], title: Optiona
     fig.update_yaxes(showgrid=False)
     return fig
 
+@register_chart_builder
+@memoize_figure
 def generate_chart(
     df: pd.DataFrame,
     col: str,
@@ -571,63 +573,79 @@ def generate_chart(
     chart_type: str = 'auto'
 ) -> go.Figure:
     """Automatically generate an appropriate chart based on data type."""
-    df_copy = df.copy()
-
-    if df_copy[col].count() == 0:
+    # Chart builders only read columns of the (shared, read-only) survey frame, so no copy is needed
+    aggregates = get_dataset_aggregates(df)
+    if aggregates.non_null_count(col) == 0:
         return create_no_data_figure(title)
 
     if chart_type == 'auto':
-        if pd.api.types.is_numeric_dtype(df_copy[col]):
-            return make_histogram(df_copy, col, title, kde=True)
+        if pd.api.types.is_numeric_dtype(df[col]):
+            return make_histogram(df, col, title, kde=True)
         elif "continent" in col.lower() or "country" in col.lower():
             try:
-                return make_world_map(df_copy, col, title)
+                return make_world_map(df, col, title)
             except Exception as e:
                 # Fall back to bar chart if map creation fails
-                return make_bar_chart(df_copy, col, title, horizontal=True)
+                return make_bar_chart(df, col, title, horizontal=True)
         else:
-            unique_count = df_copy[col].nunique()
+            unique_count = aggregates.nunique(col)
             if unique_count <= 5:
-                return make_donut_chart(df_copy, col, title)
+                return make_donut_chart(df, col, title)
             else:
-                return make_bar_chart(df_copy, col, title, horizontal=True)
+                return make_bar_chart(df, col, title, horizontal=True)
     elif chart_type == 'bar':
-        return make_bar_chart(df_copy, col, title, horizontal=True)  # Force horizontal
+        return make_bar_chart(df, col, title, horizontal=True)  # Force horizontal
     elif chart_type == 'bar_h':
-        return make_bar_chart(df_copy, col, title, horizontal=True)
+        return make_bar_chart(df, col, title, horizontal=True)
     elif chart_type == 'histogram':
-        if pd.api.types.is_numeric_dtype(df_copy[col]):
-            return make_histogram(df_copy, col, title)
+        if pd.api.types.is_numeric_dtype(df[col]):
+            return make_histogram(df, col, title)
         else:
-            return make_bar_chart(df_copy, col, title, horizontal=True)
+            return make_bar_chart(df, col, title, horizontal=True)
     elif chart_type == 'pie':
-        return make_pie_chart(df_copy, col, title)
+        return make_pie_chart(df, col, title)
     elif chart_type == 'donut':
-        return make_donut_chart(df_copy, col, title)
+        return make_donut_chart(df, col, title)
     elif chart_type == 'map':
-        return make_world_map(df_copy, col, title)
+        return make_world_map(df, col, title)
     else:
-        return make_bar_chart(df_copy, col, title, horizontal=True)
+        return make_bar_chart(df, col, title, horizontal=True)
 
-def make_wordcloud(responses, title=None, width=800, height=400):
-    # Combine all responses into a single string
-    text = ' '.join([str(r) for r in responses if isinstance(r, str) and r.strip()])
-    if not text:
+def make_wordcloud(df, col, title=None, width=800, height=400, wait=False):
+    """
+    Create a word cloud figure of the responses to a free-text column.
+    
+    The word frequencies come from the column's shared corpus index (see
+    get_corpus_index). The image comes from the word-cloud service (see src.components.wordclouds)
+    and is referenced by URL. Until the background render is done, the figure
+    shows a notice instead, unless wait is set.
+    """
+    frequencies = get_corpus_index(df, col).frequencies()
+    if not frequencies:
         return create_no_data_figure(title)
     
-    wc = WordCloud(width=width, height=height, background_color='white').generate(text)
-    img = wc.to_image()
+    digest, ready = request_wordcloud(frequencies, width, height)
+    if not ready and wait:
+        ready = wait_for_wordcloud(digest)
     
     fig = go.Figure()
-    fig.add_layout_image(
-        dict(
-            source=img,  # Pass the PIL Image directly
-            xref="paper", yref="paper",
-            x=0, y=1, sizex=1, sizey=1,
-            sizing="stretch",
-            layer="below"
+    if ready:
+        fig.add_layout_image(
+            dict(
+                source=get_wordcloud_url(digest),
+                xref="paper", yref="paper",
+                x=0, y=1, sizex=1, sizey=1,
+                sizing="stretch",
+                layer="below"
+            )
+        )
+    else:
+        fig.add_annotation(
+            text="The word cloud is being generated, please reload in a moment",
+            x=0.5, y=0.5, xref="paper", yref="paper",
+            font=dict(size=ANNOTATION_FONT_SIZE),
+            showarrow=False
         )
-    )
     
     fig.update_layout(
         title=title,
@@ -641,16 +659,10 @@ def make_wordcloud(responses, title=None, width=800, height=400):
     
     return fig
 
-def make_word_freq_bar(responses, title=None, top_n=15, width=800, height=400):
-    # Combine all responses into a single string
-    text = ' '.join([str(r) for r in responses if isinstance(r, str) and r.strip()])
-    if not text:
-        return create_no_data_figure(title)
-    # Tokenize and clean
-    words = re.findall(r'\b\w+\b', text.lower())
-    words = [w for w in words if w not in STOPWORDS and len(w) > 2]
-    counter = collections.Counter(words)
-    most_common = counter.most_common(top_n)
+@memoize_figure
+def make_word_freq_bar(df, col, title=None, top_n=15, width=800, height=400):
+    """Create a bar chart of the most frequent words in the responses to a free-text column (see get_corpus_index)."""
+    most_common = get_corpus_index(df, col).most_common(top_n)
     if not most_common:
         return create_no_data_figure(title)
     labels, values = zip(*most_common)
@@ -674,12 +686,14 @@ def make_word_freq_bar(responses, title=None, top_n=15, width=800, height=400):
     )
     return fig
 
+@memoize_figure
 def generate_task_scale_chart(df: pd.DataFrame, grouped_task_scales: dict) -> go.Figure:
     """Generate a comprehensive task scale chart for all RE phases."""
     from plotly.colors import qualitative
     
     # Collect data from all phases
     all_data = []
+    column_index = get_column_index(df.columns)
     
     for phase_key, phase_data in grouped_task_scales.items():
         tasks = phase_data['tasks']
@@ -690,15 +704,7 @@ def generate_task_scale_chart(df: pd.DataFrame, grouped_task_scales: dict) -> go
             task_data = {}
             for scale in scales:
                 # Try to find a column for this (task, scale)
-                match = None
-                for df_col in df.columns:
-                    norm_df_col = normalize_colname_for_match(df_col)
-                    phase_match = normalize_colname_for_match(f"requirements {phase_key}") in norm_df_col
-                    task_match = normalize_colname_for_match(task) in norm_df_col
-                    scale_match = normalize_colname_for_match(scale) in norm_df_col
-                    if phase_match and task_match and scale_match:
-                        match = df_col
-                        break
+                match = column_index.find_containing(f"requirements {phase_key}", task, scale)
                 
                 if match and match in df.columns:
                     # Count positive usefulness responses
@@ -762,67 +768,25 @@ def generate_task_scale_chart(df: pd.DataFrame, grouped_task_scales: dict) -> go
     
     return fig
 
+@memoize_figure
 def make_task_scale_chart(df, phase_key):
     phase = GROUPED_TASK_SCALES[phase_key]
     tasks = phase['tasks']
     
-    def normalize_string(s):
-        """Improved normalization function that handles HTML entities and extra formatting."""
-        if pd.isna(s):
-            return ""
-        
-        s = str(s)
-        # Replace HTML entities
-        s = s.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&#39;', "'")
-        # Remove extra whitespace and normalize
-        s = re.sub(r'\s+', ' ', s)
-        # Remove punctuation and special characters
-        s = re.sub(r'[^\w\s]', '', s)
-        # Convert to lowercase
-        return s.strip().lower()
-    
-    task_scale_cols = {task: {'Scale 1': None, 'Scale 2': None} for task in tasks}
+    # Task -> (Scale 1, Scale 2) columns are resolved once per dataset schema
+    task_scale_cols = get_task_scale_columns(df.columns)[phase_key]
     
-    for task in tasks:
-        norm_task = normalize_string(task)
-        for scale_tag in ['Scale 1', 'Scale 2']:
-            norm_scale = normalize_string(scale_tag)
-            norm_phase = normalize_string(phase_key)
-            
-            # Try exact match first
-            for col in df.columns:
-                norm_col = normalize_string(col)
-                if (norm_task in norm_col and 
-                    norm_phase in norm_col and 
-                    norm_scale in norm_col):
-                    task_scale_cols[task][scale_tag] = col
-                    break
-            
-            # If no exact match, try partial matching
-            if task_scale_cols[task][scale_tag] is None:
-                for col in df.columns:
-                    norm_col = normalize_string(col)
-                    # Check if all components are present (more flexible matching)
-                    task_present = any(word in norm_col for word in norm_task.split() if len(word) > 3)
-                    phase_present = norm_phase in norm_col
-                    scale_present = norm_scale in norm_col
-                    
-                    if task_present and phase_present and scale_present:
-                        task_scale_cols[task][scale_tag] = col
-                        break
-        
-        # Debug print for each task
-        print(f"[DEBUG] Phase: {phase_key}, Task: {task}")
-        print(f"  Normalized task: '{norm_task}'")
-        print(f"  Matched Scale 1 column: {task_scale_cols[task]['Scale 1']}")
-        print(f"  Matched Scale 2 column: {task_scale_cols[task]['Scale 2']}")
-        
-        # Print unique values in matched columns for debugging
-        for scale_tag in ['Scale 1', 'Scale 2']:
-            col = task_scale_cols[task][scale_tag]
-            if col and col in df.columns:
-                unique_vals = df[col].dropna().unique()
-                print(f"  {scale_tag} unique values: {unique_vals}")
+    # Matched columns and their unique values, only computed when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        for task in tasks:
+            logger.debug(
+                "Phase: %s, Task: %s, matched Scale 1 column: %s, matched Scale 2 column: %s",
+                phase_key, task, task_scale_cols[task]['Scale 1'], task_scale_cols[task]['Scale 2']
+            )
+            for scale_tag in ['Scale 1', 'Scale 2']:
+                col = task_scale_cols[task][scale_tag]
+                if col and col in df.columns:
+                    logger.debug("%s / %s unique values: %s", task, scale_tag, df[col].dropna().unique())
     
     data = {task: {'Useful': 0, 'Harmful': 0} for task in tasks}
     
@@ -839,17 +803,17 @@ def make_task_scale_chart(df, phase_key):
             col_values = df[col1].dropna().astype(str).str.strip().str.lower()
             useful_count = sum(col_values.isin(useful_values))
             data[task]['Useful'] = useful_count
-            print(f"[DEBUG] {task} - Scale 1: found {useful_count} useful responses out of {len(col_values)} total")
+            logger.debug("%s - Scale 1: found %d useful responses out of %d total", task, useful_count, len(col_values))
         
         if col2 and col2 in df.columns:
             # Normalize values for comparison
             col_values = df[col2].dropna().astype(str).str.strip().str.lower()
             harmful_count = sum(col_values.isin(harmful_values))
             data[task]['Harmful'] = harmful_count
-            print(f"[DEBUG] {task} - Scale 2: found {harmful_count} harmful responses out of {len(col_values)} total")
+            logger.debug("%s - Scale 2: found %d harmful responses out of %d total", task, harmful_count, len(col_values))
     
     if all(v['Useful'] == 0 and v['Harmful'] == 0 for v in data.values()):
-        print("[DEBUG] No data found for any task in this phase")
+        logger.debug("No data found for any task in phase %s", phase_key)
         return create_no_data_figure("No data available for this phase.")
     
     fig = go.Figure()
@@ -0,0 +1,91 @@
+"""Memoization of Plotly figures built from the (static) survey datasets."""
+
+import functools
+import json
+from contextvars import ContextVar
+from typing import Callable
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.utils.bounded_cache import LRUCache
+from src.utils.data_processing import get_dataset_fingerprint
+from src.utils.metrics import record_figure
+
+# Maximum number of serialized figures kept in the figure cache
+FIGURE_CACHE_MAX_ENTRIES = 512
+
+_figure_cache = LRUCache(FIGURE_CACHE_MAX_ENTRIES, counters=("uncacheable",))
+
+# Set while a memoized builder runs, so figures built inside another builder are not counted twice
+_building: ContextVar[bool] = ContextVar("figure_building", default=False)
+
+def _freeze(value):
+    """Turn list/dict arguments into hashable tuples so they can be part of a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    hash(value)
+    return value
+
+def _figure_from_json(figure_json: str) -> go.Figure:
+    """Rebuild a private Figure copy from its cached JSON (already validated when it was built)."""
+    return go.Figure(json.loads(figure_json), _validate=False)
+
+def memoize_figure(builder: Callable) -> Callable:
+    """
+    Cache the figures returned by a chart builder whose first argument is a DataFrame.
+
+    Figures are keyed by (dataset fingerprint, builder, remaining arguments)
+    and stored as serialized JSON, so every caller gets its own Figure and
+    cannot corrupt the cached entry (e.g. build_chart_card updating the
+    layout). Frames without a fingerprint (see get_dataset_fingerprint: any
+    frame other than the one cached by load_data_file, including filtered
+    or copied subframes of it) and unhashable arguments bypass the cache. Every
+    outermost call is counted in the request metrics (see record_figure).
+    """
+    def build(df: pd.DataFrame, *args, **kwargs) -> go.Figure:
+        outermost = not _building.get()
+        token = _building.set(True)
+        try:
+            return builder(df, *args, **kwargs)
+        finally:
+            _building.reset(token)
+            if outermost:
+                record_figure(cached=False)
+
+    @functools.wraps(builder)
+    def wrapper(df: pd.DataFrame, *args, **kwargs):
+        fingerprint = get_dataset_fingerprint(df) if isinstance(df, pd.DataFrame) else None
+        key = None
+        if fingerprint is not None:
+            try:
+                key = (fingerprint, builder.__module__, builder.__qualname__, _freeze(args), _freeze(kwargs))
+            except TypeError:
+                key = None
+        if key is None:
+            _figure_cache.count("uncacheable")
+            return build(df, *args, **kwargs)
+        figure_json = _figure_cache.get(key)
+        if figure_json is not None:
+            if not _building.get():
+                record_figure(cached=True)
+            return _figure_from_json(figure_json)
+        fig = build(df, *args, **kwargs)
+        _figure_cache.put(key, fig.to_json())
+        return fig
+    return wrapper
+
+def get_figure_cache_stats() -> dict:
+    """
+    Get the counters of the figure cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, uncacheable calls, current size and max size
+    """
+    return _figure_cache.stats()
+
+def clear_figure_cache() -> None:
+    """Drop all cached figures and reset the cache counters."""
+    _figure_cache.clear()
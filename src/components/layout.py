@@ -5,6 +5,18 @@ import dash_bootstrap_components as dbc
 from dash import html, dcc
 
 from src.config.config import *
+from src.components.progressive import DeferredChart, CHART_GRAPH_TYPE, CHART_SPEC_TYPE
+
+# Figure shown by a progressive chart placeholder until its chart callback returns
+PLACEHOLDER_FIGURE = {
+    "data": [],
+    "layout": {
+        "xaxis": {"visible": False},
+        "yaxis": {"visible": False},
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "paper_bgcolor": "rgba(0,0,0,0)",
+    },
+}
 
 def clean_title(title: str) -> str:
     """Clean and standardize title text for consistent display."""
@@ -36,24 +48,48 @@ def build_stat_card(
     ]
     return dbc.Card(card_content, className="shadow-sm h-100 border-0")
 
+def style_chart_figure(fig: object) -> object:
+    """Apply the dashboard font to a chart figure shown in a chart card."""
+    # Memoized chart builders hand out a private Figure per call, so updating its layout here
+    # cannot leak into the figure cache
+    fig.update_layout(
+        font=dict(family=STYLE_VARS["FONT_FAMILY"], size=STYLE_VARS["FONT_SIZE"]),
+    )
+    return fig
+
 def build_chart_card(
     title: str,
     fig: object,
     column_width: int = 12,
     className: str = "mb-4"
 ) -> dbc.Col:
-    """Wraps a plotly figure in a Bootstrap card with custom styling."""
+    """
+    Wraps a plotly figure in a Bootstrap card with custom styling.
+    A DeferredChart is rendered as a placeholder graph that the progressive chart callback fills in.
+    """
     # If the chart has no title or the title is the same as the section/question header, don't show the card header
     show_header = bool(title and title.strip())
-    fig.update_layout(
-        font=dict(family=STYLE_VARS["FONT_FAMILY"], size=STYLE_VARS["FONT_SIZE"]),
-    )
+    if isinstance(fig, DeferredChart):
+        graph = html.Div([
+            dcc.Store(id={"type": CHART_SPEC_TYPE, "index": fig.index}, data=fig.spec),
+            dcc.Loading(
+                dcc.Graph(
+                    id={"type": CHART_GRAPH_TYPE, "index": fig.index},
+                    figure=PLACEHOLDER_FIGURE,
+                    config={'displayModeBar': False}
+                ),
+                type="circle",
+                color=PRIMARY_COLOR
+            ),
+        ])
+    else:
+        graph = dcc.Graph(figure=style_chart_figure(fig), config={'displayModeBar': False})
     card_content = []
     if show_header:
         card_content.append(dbc.CardHeader(title, style={"background": PRIMARY_COLOR, "color": "white", "font-weight": "bold"}))
     card_content.append(
         dbc.CardBody(
-            dcc.Graph(figure=fig, config={'displayModeBar': False}),
+            graph,
             style={"background": STYLE_VARS["BACKGROUND_COLOR"]}
         )
     )
@@ -157,7 +193,10 @@ def build_chart_grid(
     return rows
 
 def create_sidebar(selected_year=None):
-    """Create the sidebar with navigation for GenAI RE survey sections and year selection."""
+    """
+    Create the sidebar with navigation for GenAI RE survey sections and year selection.
+    Rendered once into the app layout; routing callbacks only update the page content.
+    """
     return html.Div([
         html.H2("GenAI in RE Survey", className="display-7 mb-4"),
         dcc.Dropdown(
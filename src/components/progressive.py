@@ -0,0 +1,118 @@
+"""Skeleton-first (progressive) page rendering.
+
+In progressive mode a page is sent with chart placeholders only. Every
+placeholder carries a JSON spec of the chart (year, builder, arguments) in a
+dcc.Store, and a pattern-matching callback builds each chart on its own
+request, so the server can fill them in parallel. The spec comes back from
+the browser, so only specs recorded when a page emitted them are built
+(see get_emitted_chart).
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from src.config.config import YEAR_TO_FILE
+from src.utils.data_processing import get_dataset_fingerprint, load_data_file
+
+# Component id types of the chart placeholders and their specs
+CHART_GRAPH_TYPE = "progressive-chart"
+CHART_SPEC_TYPE = "progressive-chart-spec"
+
+# Chart builders that may be referenced by a spec, keyed by "<module>.<name>"
+_chart_builders: Dict[str, Callable] = {}
+
+# Canonical JSON of every spec emitted by a page, keyed by placeholder index
+_emitted_specs: Dict[str, str] = {}
+
+def register_chart_builder(builder: Callable) -> Callable:
+    """Allow a chart builder (taking the survey DataFrame first) to be deferred to a chart callback."""
+    _chart_builders[f"{builder.__module__}.{builder.__qualname__}"] = builder
+    return builder
+
+def _canonical_spec(spec) -> Optional[str]:
+    """Serialize a spec canonically, or return None if it is not JSON-serializable."""
+    try:
+        return json.dumps(spec, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+class DeferredChart:
+    """A chart whose figure is built later by the progressive chart callback."""
+
+    def __init__(self, year: int, builder: Callable, args: tuple, kwargs: dict):
+        self.spec = {
+            "year": year,
+            "builder": f"{builder.__module__}.{builder.__qualname__}",
+            "args": list(args),
+            "kwargs": kwargs,
+        }
+        self.index = hashlib.md5(_canonical_spec(self.spec).encode("utf-8")).hexdigest()[:16]
+
+def get_dataset_year(df: pd.DataFrame) -> Optional[int]:
+    """Return the survey year a DataFrame was loaded for, based on its source fingerprint."""
+    fingerprint = get_dataset_fingerprint(df)
+    if fingerprint is None:
+        return None
+    for year, data_file in YEAR_TO_FILE.items():
+        if os.path.abspath(data_file) == fingerprint[0]:
+            return year
+    return None
+
+def make_figure(df: pd.DataFrame, builder: Callable, *args, progressive: bool = False, **kwargs):
+    """
+    Build a chart figure, or defer it to the chart callback in progressive mode.
+
+    Args:
+        df: Survey DataFrame loaded through load_data_file
+        builder: Registered chart builder called as builder(df, *args, **kwargs)
+        progressive: Return a DeferredChart placeholder instead of building the figure
+
+    Returns:
+        The figure, or a DeferredChart for build_chart_card to render as a placeholder
+    """
+    if progressive:
+        year = get_dataset_year(df)
+        key = f"{builder.__module__}.{builder.__qualname__}"
+        if year is not None and _chart_builders.get(key) is builder:
+            chart = DeferredChart(year, builder, args, kwargs)
+            _emitted_specs[chart.index] = _canonical_spec(chart.spec)
+            return chart
+    return builder(df, *args, **kwargs)
+
+def get_emitted_chart(spec) -> Optional[dict]:
+    """
+    Check a spec sent back by the browser against the specs emitted by the pages.
+
+    Returns:
+        The spec if a page of this process emitted exactly this spec, otherwise None
+    """
+    canonical = _canonical_spec(spec)
+    if canonical is None or not isinstance(spec, dict):
+        return None
+    index = hashlib.md5(canonical.encode("utf-8")).hexdigest()[:16]
+    if _emitted_specs.get(index) != canonical:
+        return None
+    return spec
+
+def build_deferred_figure(spec: dict):
+    """
+    Build the figure described by a DeferredChart spec sent back by the browser.
+
+    Only specs emitted by a page (see get_emitted_chart) for a configured
+    year and a registered builder are built.
+
+    Returns:
+        The figure, or None for any other spec
+    """
+    if get_emitted_chart(spec) is None:
+        return None
+    builder = _chart_builders.get(spec.get("builder"))
+    data_file = YEAR_TO_FILE.get(spec.get("year"))
+    if builder is None or data_file is None:
+        return None
+    df = load_data_file(data_file)
+    return builder(df, *spec.get("args", []), **spec.get("kwargs", {}))
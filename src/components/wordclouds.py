@@ -0,0 +1,228 @@
+"""Word-cloud images rendered off the request path into a content-addressed PNG cache.
+
+Laying out and rasterizing a word cloud takes up to a second, so requests
+never render one. They ask for the image of a set of word frequencies (see
+src.utils.text_index) and size, and get back its digest and whether the
+PNG is already on disk. Missing images are rendered by a background worker
+pool; the wordcloud package (and its matplotlib and PIL dependencies) is
+only imported by the first render. Finished images are served as static
+files from WORDCLOUD_ROUTE (see register_wordcloud_route) or embedded as
+base64 (see get_wordcloud_data_uri).
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from flask import abort, send_from_directory
+
+from src.config.config import WORDCLOUD_CACHE_DIR, WORDCLOUD_ROUTE, WORDCLOUD_WORKERS
+from src.utils.bounded_cache import LRUCache
+
+# Default image size in pixels
+WORDCLOUD_WIDTH = 800
+WORDCLOUD_HEIGHT = 400
+
+# Part of every image digest; bump it when the rendering parameters change
+WORDCLOUD_RENDER_VERSION = 1
+
+# Fixed layout seed, so the same frequencies and size always render the same image
+WORDCLOUD_RANDOM_STATE = 0
+
+# Maximum number of base64-encoded images kept in memory
+WORDCLOUD_DATA_URI_MAX_ENTRIES = 32
+
+# Seconds browsers may cache a served image; a digest never changes content
+WORDCLOUD_MAX_AGE = 365 * 24 * 3600
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Dict[str, Future] = {}
+_data_uris = LRUCache(WORDCLOUD_DATA_URI_MAX_ENTRIES)
+_lock = threading.Lock()
+_stats = {"hits": 0, "renders": 0, "failures": 0}
+
+def get_wordcloud_digest(
+    frequencies: Dict[str, int],
+    width: int = WORDCLOUD_WIDTH,
+    height: int = WORDCLOUD_HEIGHT
+) -> str:
+    """Return the content address (SHA-256 hex digest) of the word cloud of word frequencies at a size."""
+    key = f"{WORDCLOUD_RENDER_VERSION}:{width}x{height}\n" + json.dumps(list(frequencies.items()), ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+def get_wordcloud_path(digest: str) -> str:
+    """Return the path of the cached PNG of a digest."""
+    return os.path.join(WORDCLOUD_CACHE_DIR, f"{digest}.png")
+
+def is_wordcloud_ready(digest: str) -> bool:
+    """Return True if the PNG of a digest is in the disk cache."""
+    return os.path.exists(get_wordcloud_path(digest))
+
+def render_wordcloud_file(frequencies: Dict[str, int], width: int, height: int, path: str) -> str:
+    """
+    Render the word cloud of word frequencies as a PNG file.
+
+    The image is written to a temporary file first and moved into place, so
+    readers never see a partial PNG.
+
+    Returns:
+        The path of the written file
+    """
+    from wordcloud import WordCloud
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    image = WordCloud(
+        width=width,
+        height=height,
+        background_color='white',
+        random_state=WORDCLOUD_RANDOM_STATE,
+    ).generate_from_frequencies(frequencies).to_image()
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        image.save(temporary, format="PNG")
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return path
+
+def _render_job(digest: str, frequencies: Dict[str, int], width: int, height: int) -> None:
+    """Render one queued word cloud unless another job already did."""
+    try:
+        if not is_wordcloud_ready(digest):
+            render_wordcloud_file(frequencies, width, height, get_wordcloud_path(digest))
+            with _lock:
+                _stats["renders"] += 1
+    except Exception as e:
+        with _lock:
+            _stats["failures"] += 1
+        logger.warning("Word cloud %s could not be rendered: %s", digest[:12], e)
+        raise
+    finally:
+        with _lock:
+            _pending.pop(digest, None)
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the worker pool, starting it on first use (call with _lock held)."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=WORDCLOUD_WORKERS, thread_name_prefix="wordcloud")
+    return _executor
+
+def request_wordcloud(
+    frequencies: Dict[str, int],
+    width: int = WORDCLOUD_WIDTH,
+    height: int = WORDCLOUD_HEIGHT
+) -> Tuple[str, bool]:
+    """
+    Get the word cloud of word frequencies without waiting for it to be rendered.
+
+    Args:
+        frequencies: Non-empty word counts, most frequent first (see CorpusIndex.frequencies)
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Tuple of (digest, ready). If the image is not cached yet, it is
+        queued for rendering (once) and ready is False.
+    """
+    digest = get_wordcloud_digest(frequencies, width, height)
+    if is_wordcloud_ready(digest):
+        with _lock:
+            _stats["hits"] += 1
+        return digest, True
+    with _lock:
+        future = _pending.get(digest)
+        # A done future here was cancelled by shutdown_wordcloud_workers before it ran
+        if future is None or future.done():
+            _pending[digest] = _get_executor().submit(_render_job, digest, frequencies, width, height)
+    return digest, False
+
+def wait_for_wordcloud(digest: str, timeout: Optional[float] = None) -> bool:
+    """
+    Wait until a queued word cloud is rendered.
+
+    Returns:
+        True if the image is in the disk cache
+    """
+    with _lock:
+        future = _pending.get(digest)
+    if future is not None:
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass
+    return is_wordcloud_ready(digest)
+
+def get_wordcloud_url(digest: str) -> str:
+    """Return the URL the image of a digest is served from (see register_wordcloud_route)."""
+    return f"{WORDCLOUD_ROUTE}/{digest}.png"
+
+def get_wordcloud_data_uri(digest: str) -> Optional[str]:
+    """
+    Return the image of a digest as a base64 data URI, for embedding without the image route.
+
+    Encoded images are kept in a small in-memory LRU cache.
+
+    Returns:
+        The data URI, or None if the image is not rendered yet
+    """
+    uri = _data_uris.get(digest)
+    if uri is not None:
+        return uri
+    if not is_wordcloud_ready(digest):
+        return None
+    with open(get_wordcloud_path(digest), "rb") as f:
+        uri = "data:image/png;base64," + base64.b64encode(f.read()).decode("ascii")
+    return _data_uris.put(digest, uri)
+
+def register_wordcloud_route(server) -> None:
+    """
+    Serve the cached word-cloud PNGs from WORDCLOUD_ROUTE on a Flask server.
+
+    Images are immutable (the URL is the content digest), so they are sent
+    with a long cache lifetime; unknown or unrendered digests get a 404.
+    """
+    def serve_wordcloud(digest: str):
+        if not _DIGEST_PATTERN.match(digest) or not is_wordcloud_ready(digest):
+            abort(404)
+        return send_from_directory(
+            os.path.abspath(WORDCLOUD_CACHE_DIR),
+            f"{digest}.png",
+            mimetype="image/png",
+            max_age=WORDCLOUD_MAX_AGE,
+        )
+
+    server.add_url_rule(f"{WORDCLOUD_ROUTE}/<digest>.png", "wordcloud", serve_wordcloud)
+
+def get_wordcloud_stats() -> dict:
+    """
+    Get the counters of the word-cloud service.
+
+    Returns:
+        Dictionary with cache hits, renders, failures, queued renders and cached data URIs
+    """
+    with _lock:
+        return {
+            **_stats,
+            "pending": len(_pending),
+            "data_uris": len(_data_uris),
+        }
+
+def shutdown_wordcloud_workers(wait: bool = True) -> None:
+    """Stop the worker pool; without wait, queued renders are cancelled."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -42,6 +42,30 @@ YEAR_TO_FILE = {
 }
 AVAILABLE_YEARS = sorted(YEAR_TO_FILE.keys())
 
+# Send chart pages as headers and chart placeholders first and fill every chart
+# through its own callback (set to False to build all figures before sending a page)
+PROGRESSIVE_LOADING = True
+
+# Word-cloud images are rendered by a background worker pool into a content-addressed
+# PNG cache (relative to the working directory, like the data files) and served from WORDCLOUD_ROUTE
+WORDCLOUD_CACHE_DIR = "cache/wordclouds"
+WORDCLOUD_ROUTE = "/wordclouds"
+WORDCLOUD_WORKERS = 2
+
+# Record per-stage timings, payload size and figure counts of every callback request
+# (Server-Timing headers) and serve rolling percentiles at METRICS_ROUTE
+METRICS_ENABLED = True
+METRICS_ROUTE = "/_metrics"
+
+# Secret that clients must send (X-Metrics-Token header) to read METRICS_ROUTE; when None, the
+# summary is only served by the debug server (python app.py) to local clients
+METRICS_TOKEN = None
+
+# Level and format of the application log (see src.utils.logging_setup); modules log to
+# loggers named after themselves, e.g. set "DEBUG" for the chart engine diagnostics
+LOG_LEVEL = "WARNING"
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
 # Demographic columns (actual column names from CSV)
 DEMOGRAPHIC_COLS = [
     "Which of the following organization / business types best describes your organization?",
@@ -404,4 +428,29 @@ GROUPED_TASK_SCALES = {
             "Not harmful at all",
         ]
     },
-} 
\ No newline at end of file
+} 
+# Phase key mapping to column phase strings
+PHASE_KEY_TO_COLUMN_PHASE = {
+    "Elicitation": "requirements elicitation",
+    "Analysis & Negotiation": "requirements analysis & negotiation", 
+    "Specification / Modeling": "requirements specification / requirements modeling",
+    "Validation / Quality Assurance": "requirements validation / quality assurance",
+    "Management": "requirements management"
+}
+
+# Ordered answer scales (lowest to highest) used to encode Likert-type columns as ordered categoricals
+LIKERT_SCALES = {
+    "usefulness": ["Not useful at all", "Slightly useful", "Moderately useful", "Very useful", "Extremely useful"],
+    "harmfulness": ["Not harmful at all", "Slightly harmful", "Moderately harmful", "Very harmful", "Extremely harmful"],
+    "re_discipline_experience": ["No Experience", "Beginner", "Intermediate", "Advanced", "Expert"],
+    "re_experience_years": ["none / new to RE", "< 2 years", "3-5 years", "6-10 years", "> 10 years"],
+    "genai_experience_years": ["No Experience at all", "Less than 1 year", "1-2 years", "3-4 years", "More than 4 years"],
+    "chatbot_frequency": ["Never used", "Tried once", "At least once a month", "At least once a week", "Daily"],
+}
+
+# Answers to Likert-type questions that are not a level of any scale. Columns with one of them are
+# encoded as unordered categoricals, so ordered operations never rank a non-answer as a level.
+LIKERT_NON_ANSWERS = ["I don't know"]
+
+# Answer labels of multi-select checkbox columns, in code order (code 1 means the option was selected)
+CHECKBOX_CATEGORIES = ["No", "Yes"]
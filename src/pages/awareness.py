@@ -6,7 +6,7 @@ from dash import html
 
 from src.components.charts import generate_chart, make_donut_chart, make_histogram
 from src.components.layout import build_stat_card, build_chart_card
-from src.utils.data_processing import process_numeric_column
+from src.utils.data_processing import get_dataset_aggregates, process_numeric_column
 
 def build_awareness_page(df: pd.DataFrame) -> html.Div:
     """Build the general awareness page layout."""
@@ -19,13 +19,14 @@ def build_awareness_page(df: pd.DataFrame) -> html.Div:
         definition_col = None
     
     # Calculate key statistics
-    heard_of_def_count = df[definition_col].value_counts().get("Yes", 0)
-    total_valid_responses = df[definition_col].notna().sum()
+    aggregates = get_dataset_aggregates(df)
+    heard_of_def_count = aggregates.value_counts(definition_col).get("Yes", 0)
+    total_valid_responses = aggregates.non_null_count(definition_col)
     heard_of_def_percentage = round((heard_of_def_count / total_valid_responses * 100) if total_valid_responses > 0 else 0)
     
     training_col = "Have you participated in one or more training or educational programs on digital sustainability?"
-    training_participation = df[training_col].value_counts().get("Yes", 0)
-    training_total = df[training_col].notna().sum()
+    training_participation = aggregates.value_counts(training_col).get("Yes", 0)
+    training_total = aggregates.non_null_count(training_col)
     training_percentage = round((training_participation / training_total * 100) if training_total > 0 else 0)
     
     num_trainings_col = "How many times training(s) or educational program(s) on digital sustainability did you participate in?"
@@ -2,6 +2,7 @@ from dash import html
 from src.config.config import GROUPED_QUESTIONS
 from src.components.charts import generate_grouped_bar_chart
 from src.components.layout import build_chart_card
+from src.components.progressive import make_figure
 
 PRIMARY_COLOR = "#831E82"
 SECTION_HEADER_STYLE = {
@@ -15,10 +16,10 @@ SECTION_HEADER_STYLE = {
 }
 CARD_ROW_STYLE = "mb-4 g-4"
 
-def build_barriers_page(df):
-    """Build the Barriers page layout for GenAI RE survey."""
+def build_barriers_page(df, progressive=False):
+    """Build the Barriers page layout for GenAI RE survey (charts as placeholders if progressive)."""
     group = GROUPED_QUESTIONS["barriers"]
-    fig = generate_grouped_bar_chart(df, group['columns'], None)  # horizontal by default
+    fig = make_figure(df, generate_grouped_bar_chart, group['columns'], None, progressive=progressive)  # horizontal by default
     return html.Div([
         html.H3("Barriers to GenAI in RE", className="mb-4 mt-2", style=SECTION_HEADER_STYLE),
         html.H5(group['question'], className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 600, "fontSize": "1.25rem"}),
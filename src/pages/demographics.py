@@ -5,6 +5,7 @@ from dash import html
 from src.config.config import DEMOGRAPHIC_COLS, GROUPED_QUESTIONS
 from src.components.charts import generate_chart, generate_grouped_bar_chart
 from src.components.layout import build_chart_card
+from src.components.progressive import make_figure
 
 PRIMARY_COLOR = "#831E82"
 SECTION_HEADER_STYLE = {
@@ -18,8 +19,8 @@ SECTION_HEADER_STYLE = {
 }
 CARD_ROW_STYLE = "mb-4 g-4"
 
-def build_demographics_page(df: pd.DataFrame) -> html.Div:
-    """Build the demographics page layout for GenAI RE survey."""
+def build_demographics_page(df: pd.DataFrame, progressive: bool = False) -> html.Div:
+    """Build the demographics page layout for GenAI RE survey (charts as placeholders if progressive)."""
     region_cols = set(GROUPED_QUESTIONS["regions"]["columns"])
     chart_info = []
     for col in DEMOGRAPHIC_COLS:
@@ -40,7 +41,7 @@ def build_demographics_page(df: pd.DataFrame) -> html.Div:
         question_text = col.strip()
         if question_text.endswith('?'):
             question_text = question_text[:-1]
-        fig = generate_chart(df, col, chart_type='bar_h')
+        fig = make_figure(df, generate_chart, col, chart_type='bar_h', progressive=progressive)
         chart_info.append(html.Div([
             html.H5(question_text, className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 600, "fontSize": "1.25rem"}),
             build_chart_card("", fig, 12)
@@ -50,7 +51,7 @@ def build_demographics_page(df: pd.DataFrame) -> html.Div:
     grouped_cards = []
     # Regions as a single grouped chart with a large header
     region_group = GROUPED_QUESTIONS["regions"]
-    region_fig = generate_grouped_bar_chart(df, region_group['columns'], None)
+    region_fig = make_figure(df, generate_grouped_bar_chart, region_group['columns'], None, progressive=progressive)
     grouped_cards.append(html.Div([
         html.H5(region_group['question'], className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 600, "fontSize": "1.25rem"}),
         build_chart_card("", region_fig, 12)
@@ -58,7 +59,7 @@ def build_demographics_page(df: pd.DataFrame) -> html.Div:
     # Roles and application domains
     for key, label in zip(["roles", "application_domains"], ["Roles", "Application Domains"]):
         group = GROUPED_QUESTIONS[key]
-        fig = generate_grouped_bar_chart(df, group['columns'], None)
+        fig = make_figure(df, generate_grouped_bar_chart, group['columns'], None, progressive=progressive)
         grouped_cards.append(html.Div([
             html.H5(label, className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 600, "fontSize": "1.25rem"}),
             build_chart_card("", fig, 12)
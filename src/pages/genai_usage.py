@@ -2,6 +2,7 @@ from dash import html
 from src.config.config import GENAI_USAGE_COLS, GENAI_RE_DISCIPLINE_COLS, GROUPED_QUESTIONS
 from src.components.charts import generate_chart, generate_grouped_bar_chart
 from src.components.layout import build_chart_card
+from src.components.progressive import make_figure
 
 PRIMARY_COLOR = "#831E82"
 SECTION_HEADER_STYLE = {
@@ -39,8 +40,8 @@ CARD_STYLE = {
     "padding": "1.2rem 1.5rem 1.2rem 1.5rem"
 }
 
-def build_genai_usage_page(df):
-    """Build the GenAI usage page layout for GenAI RE survey."""
+def build_genai_usage_page(df, progressive=False):
+    """Build the GenAI usage page layout for GenAI RE survey (charts as placeholders if progressive)."""
     usage_info = []
     for col in GENAI_USAGE_COLS:
         if col not in df.columns:
@@ -58,14 +59,14 @@ def build_genai_usage_page(df):
         question_text = col.strip()
         if question_text.endswith('?'):
             question_text = question_text[:-1]
-        fig = generate_chart(df, col, chart_type='bar_h')
+        fig = make_figure(df, generate_chart, col, chart_type='bar_h', progressive=progressive)
         usage_info.append(html.Div([
             html.H5(question_text, className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 700, "fontSize": "1.25rem"}),
             build_chart_card("", fig, 12)
         ]))
     # Grouped chart for RE disciplines
     group = GROUPED_QUESTIONS["genai_re_disciplines"]
-    discipline_fig = generate_grouped_bar_chart(df, group['columns'], None)
+    discipline_fig = make_figure(df, generate_grouped_bar_chart, group['columns'], None, progressive=progressive)
     discipline_card = html.Div([
         html.H5("For which RE disciplines did you use GenAI?", className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 700, "fontSize": "1.25rem"}),
         build_chart_card("", discipline_fig, 12)
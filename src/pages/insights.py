@@ -3,10 +3,7 @@
 import pandas as pd
 import dash_bootstrap_components as dbc
 from dash import html, dcc
-import plotly.express as px
 import plotly.graph_objects as go
-import numpy as np
-from plotly.colors import qualitative
 import re
 from collections import defaultdict
 import string
@@ -17,21 +14,17 @@ from src.components.charts import (
     make_multi_select_bar,
     make_bar_chart,
     create_no_data_figure,
-    make_wordcloud,
     generate_grouped_bar_chart,
     generate_task_scale_chart
 )
+from src.components.figure_cache import memoize_figure
+from src.components.progressive import make_figure, register_chart_builder
 from src.components.layout import build_stat_card, build_chart_card
 from src.config.config import PRIMARY_COLOR, GROUPED_TASK_SCALES, GROUPED_QUESTIONS, INSIGHTS_CHARTS
-
-# Phase key mapping to column phase strings
-PHASE_KEY_TO_COLUMN_PHASE = {
-    "Elicitation": "requirements elicitation",
-    "Analysis & Negotiation": "requirements analysis & negotiation", 
-    "Specification / Modeling": "requirements specification / requirements modeling",
-    "Validation / Quality Assurance": "requirements validation / quality assurance",
-    "Management": "requirements management"
-}
+from src.utils.correlations import get_selection_correlations
+from src.utils.crosstab import get_grouped_selection_percentages
+from src.utils.data_processing import get_selection_flags
+from src.utils.task_scales import get_task_scale_columns
 
 SECTION_HEADER_STYLE = {
     "color": PRIMARY_COLOR,
@@ -51,6 +44,7 @@ def normalize_colname(name):
     name = name.translate(str.maketrans('', '', string.punctuation))
     return name.strip().lower()
 
+@memoize_figure
 def create_awareness_implementation_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing relationship between definition awareness and implementation."""
     # Find awareness column by partial match
@@ -93,6 +87,7 @@ def create_awareness_implementation_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_training_implementation_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing relationship between training participation and implementation."""
     # Cross-tabulate training participation with implementation
@@ -130,6 +125,7 @@ def create_training_implementation_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_discussion_implementation_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing relationship between discussion frequency and implementation."""
     # Cross-tabulate discussion frequency with implementation
@@ -167,6 +163,7 @@ def create_discussion_implementation_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_org_type_sustainability_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing sustainability practices by organization type."""
     org_type_col = "Which of the following organizational types best describes your organization?"
@@ -204,6 +201,7 @@ def create_org_type_sustainability_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_org_goals_practices_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing relationship between sustainability goals and practices."""
     goals_col = "Does your organization have specific digital sustainability goals or benchmarks for software development projects?"
@@ -240,6 +238,7 @@ def create_org_goals_practices_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_org_csr_practices_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing relationship between having CSR team and practices."""
     csr_col = "Does your organization have a dedicated sustainability or Corporate Social Responsibility (CSR) expert, team or department?"
@@ -276,6 +275,7 @@ def create_org_csr_practices_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_role_implementation_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing sustainability implementation by role."""
     role_col = "Which of the following best describes your current role in the organization?"
@@ -313,6 +313,7 @@ def create_role_implementation_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_role_drivers_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing sustainability drivers by role."""
     role_col = "Which of the following best describes your current role in the organization?"
@@ -358,24 +359,11 @@ def create_role_drivers_chart(df: pd.DataFrame) -> go.Figure:
         'Legal requirements ': 'Legal Requirements'
     }
     
-    # Calculate percentage of each driver by role
-    driver_percentages = {}
-    for driver_col in available_driver_cols:
-        try:
-            # Create contingency table for this driver
-            contingency = pd.crosstab(
-                df[role_col],
-                df[driver_col],
-                normalize='index'
-            ) * 100
-            # Get the percentage of "Selected" responses
-            if "Selected" in contingency.columns:
-                driver_name = driver_col.split('[')[-1].split(']')[0].strip()
-                driver_percentages[driver_labels.get(driver_name, driver_name)] = contingency["Selected"]
-        except Exception as e:
-            continue
+    # Calculate percentage of each driver by role, keeping the drivers selected at least once
+    driver_percentages = get_grouped_selection_percentages(df, role_col, available_driver_cols)
+    driver_percentages = driver_percentages.loc[:, (driver_percentages > 0).any()]
     
-    if not driver_percentages:
+    if driver_percentages.empty:
         fig = go.Figure()
         fig.update_layout(
             title="No driver data available",
@@ -393,9 +381,9 @@ def create_role_drivers_chart(df: pd.DataFrame) -> go.Figure:
         return fig
     
     # Create heatmap
-    roles = list(driver_percentages[list(driver_percentages.keys())[0]].index)
-    drivers = list(driver_percentages.keys())
-    z_values = [[driver_percentages[driver][role] for driver in drivers] for role in roles]
+    roles = list(driver_percentages.index)
+    drivers = [driver_labels.get(name, name) for name in (col.split('[')[-1].split(']')[0].strip() for col in driver_percentages.columns)]
+    z_values = driver_percentages.fillna(0).values.tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
@@ -404,8 +392,7 @@ def create_role_drivers_chart(df: pd.DataFrame) -> go.Figure:
         colorscale="Viridis",
         text=[[f"{val:.1f}%" for val in row] for row in z_values],
         texttemplate="%{text}",
-        textfont={"size": 10},
-        textcolor="white",
+        textfont={"size": 10, "color": "white"},
         showscale=True
     ))
     
@@ -420,6 +407,7 @@ def create_role_drivers_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_role_barriers_chart(df: pd.DataFrame) -> go.Figure:
     """Create a chart showing sustainability barriers by role."""
     role_col = "Which of the following best describes your current role in the organization?"
@@ -465,24 +453,11 @@ def create_role_barriers_chart(df: pd.DataFrame) -> go.Figure:
         'Complexity or uncertainty of sustainability solutions (e.g., difficulty measuring impact or navigating standards)': 'Solution Complexity'
     }
     
-    # Calculate percentage of each barrier by role
-    barrier_percentages = {}
-    for barrier_col in available_barrier_cols:
-        try:
-            # Create contingency table for this barrier
-            contingency = pd.crosstab(
-                df[role_col],
-                df[barrier_col],
-                normalize='index'
-            ) * 100
-            # Get the percentage of "Selected" responses
-            if "Selected" in contingency.columns:
-                barrier_name = barrier_col.split('[')[-1].split(']')[0].strip()
-                barrier_percentages[barrier_labels.get(barrier_name, barrier_name)] = contingency["Selected"]
-        except Exception as e:
-            continue
+    # Calculate percentage of each barrier by role, keeping the barriers selected at least once
+    barrier_percentages = get_grouped_selection_percentages(df, role_col, available_barrier_cols)
+    barrier_percentages = barrier_percentages.loc[:, (barrier_percentages > 0).any()]
     
-    if not barrier_percentages:
+    if barrier_percentages.empty:
         fig = go.Figure()
         fig.update_layout(
             title="No barrier data available",
@@ -500,9 +475,9 @@ def create_role_barriers_chart(df: pd.DataFrame) -> go.Figure:
         return fig
     
     # Create heatmap
-    roles = list(barrier_percentages[list(barrier_percentages.keys())[0]].index)
-    barriers = list(barrier_percentages.keys())
-    z_values = [[barrier_percentages[barrier][role] for barrier in barriers] for role in roles]
+    roles = list(barrier_percentages.index)
+    barriers = [barrier_labels.get(name, name) for name in (col.split('[')[-1].split(']')[0].strip() for col in barrier_percentages.columns)]
+    z_values = barrier_percentages.fillna(0).values.tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
@@ -511,8 +486,7 @@ def create_role_barriers_chart(df: pd.DataFrame) -> go.Figure:
         colorscale="Viridis",
         text=[[f"{val:.1f}%" for val in row] for row in z_values],
         texttemplate="%{text}",
-        textfont={"size": 10},
-        textcolor="white",
+        textfont={"size": 10, "color": "white"},
         showscale=True
     ))
     
@@ -527,6 +501,7 @@ def create_role_barriers_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_barriers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
     """Create a heatmap showing barriers by organization type."""
     org_type_col = "Which of the following organizational types best describes your organization?"
@@ -549,30 +524,17 @@ def create_barriers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
         'Complexity or uncertainty of sustainability solutions (e.g., difficulty measuring impact or navigating standards)': 'Solution Complexity'
     }
     
-    # Calculate percentage of each barrier by organization type
-    barrier_percentages = {}
-    for barrier_col in barrier_cols:
-        try:
-            # Create contingency table for this barrier
-            contingency = pd.crosstab(
-                df[org_type_col],
-                df[barrier_col],
-                normalize='index'
-            ) * 100
-            # Get the percentage of "Selected" responses
-            if "Selected" in contingency.columns:
-                barrier_name = barrier_col.split('[')[-1].split(']')[0].strip()
-                barrier_percentages[barrier_labels.get(barrier_name, barrier_name)] = contingency["Selected"]
-        except Exception as e:
-            continue
+    # Calculate percentage of each barrier by organization type, keeping the barriers selected at least once
+    barrier_percentages = get_grouped_selection_percentages(df, org_type_col, barrier_cols)
+    barrier_percentages = barrier_percentages.loc[:, (barrier_percentages > 0).any()]
     
-    if not barrier_percentages:
+    if barrier_percentages.empty:
         return create_no_data_figure("No barrier data available")
     
     # Create heatmap
-    org_types = list(barrier_percentages[list(barrier_percentages.keys())[0]].index)
-    barriers = list(barrier_percentages.keys())
-    z_values = [[barrier_percentages[barrier][org_type] for barrier in barriers] for org_type in org_types]
+    org_types = list(barrier_percentages.index)
+    barriers = [barrier_labels.get(name, name) for name in (col.split('[')[-1].split(']')[0].strip() for col in barrier_percentages.columns)]
+    z_values = barrier_percentages.fillna(0).values.tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
@@ -581,8 +543,7 @@ def create_barriers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
         colorscale="Viridis",
         text=[[f"{val:.1f}%" for val in row] for row in z_values],
         texttemplate="%{text}",
-        textfont={"size": 10},
-        textcolor="white",
+        textfont={"size": 10, "color": "white"},
         showscale=True
     ))
     
@@ -597,6 +558,7 @@ def create_barriers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_drivers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
     """Create a heatmap showing drivers by organization type."""
     org_type_col = "Which of the following organizational types best describes your organization?"
@@ -619,30 +581,17 @@ def create_drivers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
         'Legal requirements ': 'Legal Requirements'
     }
     
-    # Calculate percentage of each driver by organization type
-    driver_percentages = {}
-    for driver_col in driver_cols:
-        try:
-            # Create contingency table for this driver
-            contingency = pd.crosstab(
-                df[org_type_col],
-                df[driver_col],
-                normalize='index'
-            ) * 100
-            # Get the percentage of "Selected" responses
-            if "Selected" in contingency.columns:
-                driver_name = driver_col.split('[')[-1].split(']')[0].strip()
-                driver_percentages[driver_labels.get(driver_name, driver_name)] = contingency["Selected"]
-        except Exception as e:
-            continue
+    # Calculate percentage of each driver by organization type, keeping the drivers selected at least once
+    driver_percentages = get_grouped_selection_percentages(df, org_type_col, driver_cols)
+    driver_percentages = driver_percentages.loc[:, (driver_percentages > 0).any()]
     
-    if not driver_percentages:
+    if driver_percentages.empty:
         return create_no_data_figure("No driver data available")
     
     # Create heatmap
-    org_types = list(driver_percentages[list(driver_percentages.keys())[0]].index)
-    drivers = list(driver_percentages.keys())
-    z_values = [[driver_percentages[driver][org_type] for driver in drivers] for org_type in org_types]
+    org_types = list(driver_percentages.index)
+    drivers = [driver_labels.get(name, name) for name in (col.split('[')[-1].split(']')[0].strip() for col in driver_percentages.columns)]
+    z_values = driver_percentages.fillna(0).values.tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
@@ -651,8 +600,7 @@ def create_drivers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
         colorscale="Viridis",
         text=[[f"{val:.1f}%" for val in row] for row in z_values],
         texttemplate="%{text}",
-        textfont={"size": 10},
-        textcolor="white",
+        textfont={"size": 10, "color": "white"},
         showscale=True
     ))
     
@@ -667,6 +615,7 @@ def create_drivers_by_org_type_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@memoize_figure
 def create_barriers_drivers_correlation_chart(df: pd.DataFrame) -> go.Figure:
     """Create a correlation heatmap between barriers and drivers."""
     # Get barrier and driver columns
@@ -676,16 +625,8 @@ def create_barriers_drivers_correlation_chart(df: pd.DataFrame) -> go.Figure:
     if not barrier_cols or not driver_cols:
         return create_no_data_figure("No barrier/driver data available")
     
-    # Create binary matrices for barriers and drivers
-    barrier_matrix = df[barrier_cols].fillna(0).astype(bool).astype(int)
-    driver_matrix = df[driver_cols].fillna(0).astype(bool).astype(int)
-    
-    # Calculate correlation matrix
-    correlation_matrix = pd.DataFrame(index=barrier_cols, columns=driver_cols)
-    for barrier in barrier_cols:
-        for driver in driver_cols:
-            correlation = np.corrcoef(barrier_matrix[barrier], driver_matrix[driver])[0, 1]
-            correlation_matrix.loc[barrier, driver] = correlation
+    # Phi correlation of every (barrier selected, driver selected) pair in one matrix product
+    correlation_matrix = get_selection_correlations(df, barrier_cols, driver_cols)
     
     # Simplify labels
     barrier_labels = [col.split('[')[-1].split(']')[0].strip() for col in barrier_cols]
@@ -715,59 +656,28 @@ def create_barriers_drivers_correlation_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@register_chart_builder
+@memoize_figure
 def make_task_scale_chart(df, phase_key):
     phase = GROUPED_TASK_SCALES[phase_key]
     tasks = phase['tasks']
     
-    def normalize_string(s):
-        if pd.isna(s):
-            return ""
-        s = str(s)
-        s = s.replace('and goals ', '')
-        s = s.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&#39;', "'")
-        s = re.sub(r'\s+', ' ', s)
-        s = re.sub(r'[^\w\s]', '', s)
-        return s.strip().lower()
-    
-    task_scale_cols = {task: {'Scale 1': None, 'Scale 2': None} for task in tasks}
-    
-    for task in tasks:
-        norm_task = normalize_string(task)
-        for scale_tag in ['Scale 1', 'Scale 2']:
-            norm_scale = normalize_string(scale_tag)
-            norm_phase = normalize_string(PHASE_KEY_TO_COLUMN_PHASE.get(phase_key, phase_key))
-            for col in df.columns:
-                norm_col = normalize_string(col)
-                if (norm_task in norm_col and 
-                    norm_phase in norm_col and 
-                    norm_scale in norm_col):
-                    task_scale_cols[task][scale_tag] = col
-                    break
-            if task_scale_cols[task][scale_tag] is None:
-                for col in df.columns:
-                    norm_col = normalize_string(col)
-                    task_present = any(word in norm_col for word in norm_task.split() if len(word) > 3)
-                    phase_present = norm_phase in norm_col
-                    scale_present = norm_scale in norm_col
-                    if task_present and phase_present and scale_present:
-                        task_scale_cols[task][scale_tag] = col
-                        break
+    # Task -> (Scale 1, Scale 2) columns are resolved once per dataset schema
+    task_scale_cols = get_task_scale_columns(df.columns)[phase_key]
     
     data = {task: {'Useful': 0, 'Harmful': 0} for task in tasks}
     useful_values = ['very useful', 'extremely useful', 'moderately useful', 'slightly useful']
     harmful_values = ['very harmful', 'extremely harmful', 'moderately harmful', 'slightly harmful']
     
-    for task in tasks:
-        col1 = task_scale_cols[task]['Scale 1']
-        col2 = task_scale_cols[task]['Scale 2']
-        if col1 and col1 in df.columns:
-            col_values = df[col1].dropna().astype(str).str.strip().str.lower()
-            useful_count = sum(col_values.isin(useful_values))
-            data[task]['Useful'] = useful_count
-        if col2 and col2 in df.columns:
-            col_values = df[col2].dropna().astype(str).str.strip().str.lower()
-            harmful_count = sum(col_values.isin(harmful_values))
-            data[task]['Harmful'] = harmful_count
+    # Count all tasks of a scale at once; answers are matched per category, not per cell
+    for scale_tag, label, values in (('Scale 1', 'Useful', useful_values), ('Scale 2', 'Harmful', harmful_values)):
+        scale_cols = [(task, task_scale_cols[task][scale_tag]) for task in tasks]
+        scale_cols = [(task, col) for task, col in scale_cols if col and col in df.columns]
+        if not scale_cols:
+            continue
+        counts = get_selection_flags(df, [col for _, col in scale_cols], tuple(values)).sum(axis=0)
+        for (task, _), count in zip(scale_cols, counts):
+            data[task][label] = int(count)
     
     if all(v['Useful'] == 0 and v['Harmful'] == 0 for v in data.values()):
         return create_no_data_figure("No data available for this phase.")
@@ -816,14 +726,14 @@ def make_task_scale_chart(df, phase_key):
     
     return fig
 
-def build_insights_page(df: pd.DataFrame) -> html.Div:
-    """Build the insights page layout with cross-question analysis."""
+def build_insights_page(df: pd.DataFrame, progressive: bool = False) -> html.Div:
+    """Build the insights page layout with cross-question analysis (charts as placeholders if progressive)."""
     # Single-value insight charts
     single_charts = []
     for col in INSIGHTS_CHARTS:
         if col not in df.columns:
             continue
-        fig = generate_chart(df, col, chart_type='bar_h')  # Force horizontal
+        fig = make_figure(df, generate_chart, col, chart_type='bar_h', progressive=progressive)  # Force horizontal
         question_text = col.strip()
         if question_text.endswith('?'):
             question_text = question_text[:-1]
@@ -834,12 +744,12 @@ def build_insights_page(df: pd.DataFrame) -> html.Div:
 
     # Grouped training preferences
     training_group = GROUPED_QUESTIONS["training_preferences"]
-    training_fig = generate_grouped_bar_chart(df, training_group['columns'], None)  # horizontal by default
+    training_fig = make_figure(df, generate_grouped_bar_chart, training_group['columns'], None, progressive=progressive)  # horizontal by default
 
     # Task scale charts for each phase
     task_scale_charts = []
     for phase_key in GROUPED_TASK_SCALES.keys():
-        fig = make_task_scale_chart(df, phase_key)
+        fig = make_figure(df, make_task_scale_chart, phase_key, progressive=progressive)
         phase_name = phase_key.replace('_', ' ').title()
         task_scale_charts.append(html.Div([
             html.H5(f"Usefulness/Harmfulness for {phase_name}", className="mb-3", style={"color": PRIMARY_COLOR, "fontWeight": 600, "fontSize": "1.25rem"}),
@@ -8,19 +8,21 @@ from src.components.charts import (
     make_multi_select_bar
 )
 from src.components.layout import build_stat_card, build_chart_card
+from src.utils.data_processing import get_dataset_aggregates
 from src.config.config import *
 
 def build_job_tasks_page(df: pd.DataFrame) -> html.Div:
     """Build the job tasks page layout."""
     # Calculate key statistics
+    aggregates = get_dataset_aggregates(df)
     tasks_col = "Do you incorporate digital sustainability considerations in your role-specific tasks?"
-    incorporates_in_tasks = df[tasks_col].value_counts().get("Yes", 0)
-    total_tasks_responses = df[tasks_col].notna().sum()
+    incorporates_in_tasks = aggregates.value_counts(tasks_col).get("Yes", 0)
+    total_tasks_responses = aggregates.non_null_count(tasks_col)
     incorporate_percentage = round((incorporates_in_tasks / total_tasks_responses * 100) if total_tasks_responses > 0 else 0)
     
     tools_col = "Are there specific tools, software, or frameworks that help you incorporate sustainability into your tasks? (E.g., gathering and managing requirements, writing sustainability-focused tests, optimizing code for less energy consumption.)"
-    uses_tools = df[tools_col].value_counts().get("Yes", 0)
-    total_tools_responses = df[tools_col].notna().sum()
+    uses_tools = aggregates.value_counts(tools_col).get("Yes", 0)
+    total_tools_responses = aggregates.non_null_count(tools_col)
     tools_percentage = round((uses_tools / total_tools_responses * 100) if total_tools_responses > 0 else 0)
     
     # Top statistics row
@@ -1,5 +1,9 @@
-from dash import html
-from src.config.open_ended import OPEN_ENDED_COLS
+import math
+
+import dash_bootstrap_components as dbc
+from dash import dcc, html
+
+from src.utils.response_index import get_response_search_index
 
 PRIMARY_COLOR = "#831E82"
 SECTION_HEADER_STYLE = {
@@ -31,6 +35,8 @@ QUESTION_HEADER_STYLE = {
     "letterSpacing": "-0.5px"
 }
 
+RESPONSE_ITEM_STYLE = {"marginBottom": "0.7rem", "fontSize": "1.13rem", "lineHeight": "1.6"}
+
 CARD_STYLE = {
     "boxShadow": "0 2px 8px rgba(131,30,130,0.08)",
     "border": f"1px solid {PRIMARY_COLOR}",
@@ -40,25 +46,94 @@ CARD_STYLE = {
     "padding": "1.2rem 1.5rem 1.2rem 1.5rem"
 }
 
+# Responses shown per results page
+RESPONSES_PER_PAGE = 20
+
+# Component ids of the search view (see render_open_ended_results in app.py)
+SEARCH_INPUT_ID = "open-ended-search"
+QUESTION_FILTER_ID = "open-ended-question"
+RESULTS_ID = "open-ended-results"
+PAGINATION_ID = "open-ended-pagination"
+
+def get_question_text(col):
+    """Strip the comment markers and the trailing question mark off a column name."""
+    question_text = col.replace('[Comment]', '').replace('[Other comment]', '').replace('[Other]', '').strip()
+    if question_text.endswith('?'):
+        question_text = question_text[:-1]
+    return question_text
+
+def get_page_count(matches):
+    """Return the number of results pages for a list of matches (at least one)."""
+    return max(1, math.ceil(len(matches) / RESPONSES_PER_PAGE))
+
+def build_response_results(index, matches, page):
+    """
+    Build one page of search results: the matching responses, grouped in a card per question.
+
+    Only the responses of the requested page are rendered.
+    """
+    page = min(max(1, page), get_page_count(matches))
+    start = (page - 1) * RESPONSES_PER_PAGE
+    shown = matches[start:start + RESPONSES_PER_PAGE]
+    if not len(shown):
+        return html.P("No responses match your search.", className="text-muted")
+    cards = []
+    group_start = 0
+    for i in range(1, len(shown) + 1):
+        if i == len(shown) or index.questions[shown[i]] != index.questions[shown[group_start]]:
+            question = index.questions[shown[group_start]]
+            cards.append(
+                html.Div([
+                    html.H4(get_question_text(index.columns[question]), style=QUESTION_HEADER_STYLE),
+                    html.Ul([
+                        html.Li(index.responses[position], style=RESPONSE_ITEM_STYLE)
+                        for position in shown[group_start:i]
+                    ], style=RESPONSE_LIST_STYLE)
+                ], style=CARD_STYLE)
+            )
+            group_start = i
+    return html.Div([
+        html.P(
+            f"Showing {start + 1}-{start + len(shown)} of {len(matches)} responses",
+            className="text-muted mb-3"
+        ),
+        *cards
+    ])
+
 def build_open_ended_page(df):
-    sections = []
-    for col in OPEN_ENDED_COLS + [c for c in df.columns if ('[Comment]' in c or '[Other comment]' in c) and c not in OPEN_ENDED_COLS]:
-        if col in df.columns:
-            responses = [r for r in df[col].dropna().astype(str).tolist() if r.strip() and r.strip().lower() != 'n/a']
-            if responses:
-                question_text = col.replace('[Comment]', '').replace('[Other comment]', '').replace('[Other]', '').strip()
-                if question_text.endswith('?'):
-                    question_text = question_text[:-1]
-                sections.append(
-                    html.Div([
-                        html.H4(question_text, style=QUESTION_HEADER_STYLE),
-                        html.Ul([
-                            html.Li(r, style={"marginBottom": "0.7rem", "fontSize": "1.13rem", "lineHeight": "1.6"}) for r in responses
-                        ], style=RESPONSE_LIST_STYLE)
-                    ], style=CARD_STYLE)
-                )
+    index = get_response_search_index(df)
+    matches = index.search()
+    question_options = [
+        {"label": get_question_text(col), "value": position}
+        for position, col in enumerate(index.columns)
+        if (index.questions == position).any()
+    ]
     return html.Div([
         html.H3("Open-Ended Responses & Comments", className="mb-4 pt-3", style=SECTION_HEADER_STYLE),
-        html.P("This page summarizes all open-ended survey responses as a styled list for each question.", className="lead mb-5", style={"color": "#666", "fontSize": "1.1rem"}),
-        *sections
-    ]) 
\ No newline at end of file
+        html.P("Search the open-ended survey responses by keyword, or browse them question by question.", className="lead mb-5", style={"color": "#666", "fontSize": "1.1rem"}),
+        dbc.Row([
+            dbc.Col(dcc.Input(
+                id=SEARCH_INPUT_ID,
+                type="search",
+                placeholder="Search responses (all keywords must match)",
+                debounce=True,
+                className="form-control"
+            ), md=6),
+            dbc.Col(dcc.Dropdown(
+                id=QUESTION_FILTER_ID,
+                options=question_options,
+                placeholder="All questions",
+                clearable=True
+            ), md=6),
+        ], className=CARD_ROW_STYLE),
+        html.Div(build_response_results(index, matches, 1), id=RESULTS_ID),
+        dbc.Pagination(
+            id=PAGINATION_ID,
+            max_value=get_page_count(matches),
+            active_page=1,
+            fully_expanded=False,
+            first_last=True,
+            previous_next=True,
+            className="mt-3"
+        )
+    ])
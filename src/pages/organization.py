@@ -6,6 +6,7 @@ from dash import html
 
 from src.components.charts import generate_chart
 from src.components.layout import build_stat_card, build_chart_card
+from src.utils.data_processing import get_dataset_aggregates
 from src.config.config import *
 
 def build_organization_page(df: pd.DataFrame) -> html.Div:
@@ -28,11 +29,12 @@ def build_organization_page(df: pd.DataFrame) -> html.Div:
     coordination_col = "Do different departments in your organization coordinate on sustainability for software development projects?"
     
     # Calculate statistics
-    total_orgs = len(df)
-    has_sustainability_goals = df[goals_col].value_counts().get("Yes", 0)
-    has_csr_team = df[csr_col].value_counts().get("Yes", 0)
-    has_practices = df[practices_col].value_counts().get("Yes", 0)
-    has_coordination = df[coordination_col].value_counts().get("Yes", 0)
+    aggregates = get_dataset_aggregates(df)
+    total_orgs = aggregates.total
+    has_sustainability_goals = aggregates.value_counts(goals_col).get("Yes", 0)
+    has_csr_team = aggregates.value_counts(csr_col).get("Yes", 0)
+    has_practices = aggregates.value_counts(practices_col).get("Yes", 0)
+    has_coordination = aggregates.value_counts(coordination_col).get("Yes", 0)
     
     # Calculate percentages
     goals_pct = round((has_sustainability_goals / total_orgs) * 100)
@@ -91,7 +93,7 @@ def build_organization_page(df: pd.DataFrame) -> html.Div:
             'Technical'
         ],
         'Percentage': [
-            (df[col].value_counts().get("Selected", 0) / total_orgs) * 100
+            (aggregates.value_counts(col).get("Selected", 0) / total_orgs) * 100
             for col in dimension_cols
         ]
     })
@@ -0,0 +1,107 @@
+"""Thread-safe, size-bounded LRU cache shared by the in-process caches of the dashboard."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+_MISSING = object()
+
+class LRUCache:
+    """
+    Mapping that keeps at most max_entries values, evicting the least recently used.
+
+    Every operation holds the cache's own lock, so the cache can be shared
+    between request threads. Hits, misses and evictions are counted (plus
+    any extra counters given, see count) for the get_*_stats helpers of the
+    modules owning a cache.
+    """
+
+    def __init__(self, max_entries: int, counters: Iterable[str] = ()):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("hits", "misses", "evictions", *counters), 0)
+
+    def get(self, key: Hashable, valid: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the value of a key and mark it as recently used, counting a hit or a miss.
+
+        Args:
+            key: Cache key
+            valid: Optional check of the cached value; a value failing it counts as a miss
+
+        Returns:
+            The cached value, or None
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING or (valid is not None and not valid(value)):
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Return the value of a key (or None) without counting it or changing its recency."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store a value as the most recently used, evicting the oldest entries beyond max_entries."""
+        with self._lock:
+            self._store(key, value)
+        return value
+
+    def setdefault(self, key: Hashable, value: Any, valid: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Store a value unless the key already holds one (passing valid); return the value kept.
+
+        Lets threads that built the same value concurrently share the first one stored.
+        """
+        with self._lock:
+            current = self._entries.get(key, _MISSING)
+            if current is not _MISSING and (valid is None or valid(current)):
+                self._entries.move_to_end(key)
+                return current
+            self._store(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove a key; return its value, or None if it was not cached."""
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def count(self, counter: str) -> None:
+        """Increment one of the counters of the cache."""
+        with self._lock:
+            self._stats[counter] += 1
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the cache.
+
+        Returns:
+            Dictionary with the counters, current size and max size
+        """
+        with self._lock:
+            return {**self._stats, "size": len(self._entries), "max_size": self.max_entries}
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            for counter in self._stats:
+                self._stats[counter] = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Store a value and evict beyond max_entries (call with the lock held)."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
@@ -0,0 +1,29 @@
+"""Compile the survey CSV files into columnar snapshots.
+
+Usage:
+    python -m src.utils.build_snapshots
+
+Writes data/<year>.feather next to every file in YEAR_TO_FILE. The loaders
+use a snapshot only while it matches the size and mtime of its CSV and the
+current encoding (see read_snapshot), and rebuild an outdated one.
+"""
+
+import os
+
+from src.config.config import YEAR_TO_FILE
+from src.utils.data_processing import write_snapshot
+
+def build_snapshots() -> list:
+    """Build a snapshot for every configured survey year and return the written paths."""
+    written = []
+    for year, data_file in sorted(YEAR_TO_FILE.items()):
+        if not os.path.exists(data_file):
+            print(f"Skipping {year}: {data_file} not found")
+            continue
+        snapshot_file = write_snapshot(data_file)
+        print(f"{year}: {data_file} -> {snapshot_file} ({os.path.getsize(snapshot_file)} bytes)")
+        written.append(snapshot_file)
+    return written
+
+if __name__ == "__main__":
+    build_snapshots()
@@ -0,0 +1,108 @@
+"""Precompiled column-name index for resolving configured question texts to DataFrame columns."""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.utils.bounded_cache import LRUCache
+
+# Maximum number of distinct column layouts (one per loaded survey year) kept indexed
+COLUMN_INDEX_MAX_ENTRIES = 8
+
+_PUNCTUATION_TABLE = str.maketrans('', '', r'"\'!@#$%^&*()[]{};:,./<>?\\|`~-=+')
+
+def normalize_colname_for_match(name):
+    # Remove all whitespace, punctuation, and lowercase
+    name = unicodedata.normalize('NFKD', name)
+    name = name.replace('\xa0', ' ')
+    name = re.sub(r'\s+', ' ', name)
+    name = name.translate(_PUNCTUATION_TABLE)
+    return name.strip().lower()
+
+class ColumnIndex:
+    """
+    Index of the normalized names of a fixed list of columns.
+
+    Exact lookups are a dictionary hit. Partial (substring) lookups only
+    verify the columns that contain every whole token of the target, and
+    every resolved target is memoized, so repeat lookups are O(1).
+    """
+
+    def __init__(self, columns: Iterable[str]):
+        self.columns: List[str] = list(columns)
+        self.normalized: List[str] = [normalize_colname_for_match(col) for col in self.columns]
+        self._exact: Dict[str, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        for position, (col, norm) in enumerate(zip(self.columns, self.normalized)):
+            self._exact.setdefault(norm, col)
+            for token in norm.split():
+                self._postings.setdefault(token, set()).add(position)
+        self._resolved: Dict[str, Optional[str]] = {}
+        self._containing: Dict[tuple, Optional[str]] = {}
+        # Schema-level lookups derived from these columns (e.g. task scale maps), computed once
+        self.derived: Dict[str, object] = {}
+
+    def _candidates(self, norm_target: str) -> Iterable[int]:
+        """Positions of columns that may contain norm_target as a substring, in column order."""
+        tokens = norm_target.split()
+        # The first and last tokens may match only part of a column token; inner tokens must match whole
+        inner = tokens[1:-1]
+        if not inner:
+            return range(len(self.columns))
+        positions = None
+        for token in inner:
+            postings = self._postings.get(token, set())
+            positions = postings if positions is None else positions & postings
+            if not positions:
+                return []
+        return sorted(positions)
+
+    def resolve(self, target: str) -> Optional[str]:
+        """Return the column matching target exactly after normalization, else the first column containing it."""
+        if target in self._resolved:
+            return self._resolved[target]
+        norm_target = normalize_colname_for_match(target)
+        match = self._exact.get(norm_target)
+        if match is None:
+            for position in self._candidates(norm_target):
+                if norm_target in self.normalized[position]:
+                    match = self.columns[position]
+                    break
+        self._resolved[target] = match
+        return match
+
+    def find_containing(self, *fragments: str) -> Optional[str]:
+        """Return the first column whose normalized name contains every normalized fragment."""
+        if fragments in self._containing:
+            return self._containing[fragments]
+        norm_fragments = [normalize_colname_for_match(fragment) for fragment in fragments]
+        positions = None
+        for norm_fragment in norm_fragments:
+            candidates = set(self._candidates(norm_fragment))
+            positions = candidates if positions is None else positions & candidates
+        match = None
+        for position in sorted(positions or []):
+            norm_col = self.normalized[position]
+            if all(norm_fragment in norm_col for norm_fragment in norm_fragments):
+                match = self.columns[position]
+                break
+        self._containing[fragments] = match
+        return match
+
+_column_indexes = LRUCache(COLUMN_INDEX_MAX_ENTRIES)
+
+def get_column_index(columns: Iterable[str]) -> ColumnIndex:
+    """
+    Get the shared ColumnIndex for a list of columns, building it on first use.
+
+    Args:
+        columns: Column names, e.g. df.columns
+
+    Returns:
+        ColumnIndex for exactly these columns
+    """
+    key = tuple(columns)
+    index = _column_indexes.get(key)
+    if index is not None:
+        return index
+    return _column_indexes.setdefault(key, ColumnIndex(key))
@@ -0,0 +1,110 @@
+"""Correlation (phi / Pearson) matrices between multi-select question groups."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import GROUPED_QUESTIONS
+from src.utils.bounded_cache import LRUCache
+from src.utils.column_index import get_column_index
+from src.utils.data_processing import get_dataset_fingerprint, get_selection_flags
+
+# Maximum number of correlation matrices kept in the correlation cache
+CORRELATION_CACHE_MAX_ENTRIES = 64
+
+_correlation_cache = LRUCache(CORRELATION_CACHE_MAX_ENTRIES)
+
+def standardize_columns(matrix: np.ndarray) -> np.ndarray:
+    """
+    Center every column of a matrix and scale it to unit (population) standard deviation.
+
+    Constant columns have no defined correlation and become all NaN.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    centered = matrix - matrix.mean(axis=0)
+    std = np.sqrt((centered ** 2).mean(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return centered / np.where(std > 0, std, np.nan)
+
+def correlation_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation of every column of a with every column of b.
+
+    For 0/1 indicator matrices this is the phi coefficient. The whole matrix
+    is one product of the standardized matrices, equal to np.corrcoef of
+    every column pair.
+
+    Args:
+        a: Array of shape (rows, n)
+        b: Array of shape (rows, m)
+
+    Returns:
+        Array of shape (n, m); NaN for constant columns
+    """
+    rows = a.shape[0]
+    if rows == 0:
+        return np.full((a.shape[1], b.shape[1]), np.nan)
+    return standardize_columns(a).T @ standardize_columns(b) / rows
+
+def get_selection_correlations(df: pd.DataFrame, row_cols: List[str], col_cols: List[str]) -> pd.DataFrame:
+    """
+    Get the phi correlations between the options of two multi-select questions.
+
+    Options are selected as read by get_selection_flags. Results are cached
+    per dataset fingerprint and column lists; frames without a fingerprint
+    are computed every time.
+
+    Args:
+        df: Survey DataFrame
+        row_cols: Option columns of the first question (rows of the result)
+        col_cols: Option columns of the second question (columns of the result)
+
+    Returns:
+        DataFrame indexed by row_cols with col_cols as columns
+    """
+    fingerprint = get_dataset_fingerprint(df)
+    key = (fingerprint, tuple(row_cols), tuple(col_cols))
+    if fingerprint is not None:
+        result = _correlation_cache.get(key)
+        if result is not None:
+            return result.copy()
+    result = pd.DataFrame(
+        correlation_matrix(get_selection_flags(df, row_cols), get_selection_flags(df, col_cols)),
+        index=row_cols,
+        columns=col_cols,
+    )
+    if fingerprint is not None:
+        _correlation_cache.put(key, result)
+        return result.copy()
+    return result
+
+def get_grouped_question_correlations(df: pd.DataFrame, row_key: str, col_key: str) -> pd.DataFrame:
+    """
+    Get the phi correlations between the options of two GROUPED_QUESTIONS groups.
+
+    Args:
+        df: Survey DataFrame
+        row_key: GROUPED_QUESTIONS key of the first group (rows of the result)
+        col_key: GROUPED_QUESTIONS key of the second group (columns of the result)
+
+    Returns:
+        DataFrame of the options found in df (see get_selection_correlations)
+    """
+    column_index = get_column_index(df.columns)
+    row_cols = [col for col in (column_index.resolve(c) for c in GROUPED_QUESTIONS[row_key]["columns"]) if col]
+    col_cols = [col for col in (column_index.resolve(c) for c in GROUPED_QUESTIONS[col_key]["columns"]) if col]
+    return get_selection_correlations(df, row_cols, col_cols)
+
+def get_correlation_cache_stats() -> dict:
+    """
+    Get the counters of the correlation cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, current size and max size
+    """
+    return _correlation_cache.stats()
+
+def clear_correlation_cache() -> None:
+    """Drop all cached correlation matrices and reset the cache counters."""
+    _correlation_cache.clear()
@@ -0,0 +1,63 @@
+"""Grouped ("X by Y") breakdowns of multi-select questions."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import GROUPED_QUESTIONS
+from src.utils.column_index import get_column_index
+from src.utils.data_processing import get_selection_flags
+
+def get_grouped_selection_percentages(df: pd.DataFrame, group_col: str, option_cols: List[str]) -> pd.DataFrame:
+    """
+    Get the percentage of respondents selecting each option, per answer of a grouping question.
+
+    All options are aggregated at once, as one groupby-mean over the
+    selection matrix (see get_selection_flags). As with
+    pd.crosstab(..., normalize='index') per option, a respondent counts for
+    an option only if they answered it, and respondents without an answer
+    to group_col are left out.
+
+    Args:
+        df: Survey DataFrame
+        group_col: Single-choice column to break down by (e.g. role or organization type)
+        option_cols: Option columns of a multi-select question; columns missing from df are skipped
+
+    Returns:
+        DataFrame indexed by the answers of group_col with one column per option,
+        holding percentages (NaN where nobody in the group answered the option).
+        Empty if group_col or all option columns are missing.
+    """
+    option_cols = [col for col in option_cols if col in df.columns]
+    if group_col not in df.columns or not option_cols:
+        return pd.DataFrame()
+    answered = df[option_cols].notna().to_numpy()
+    selected = np.where(answered, get_selection_flags(df, option_cols), np.nan)
+    groups = df[group_col]
+    if not (isinstance(groups.dtype, pd.CategoricalDtype) and groups.cat.ordered):
+        # Unordered answers are sorted by value, like pd.crosstab
+        groups = groups.astype(object)
+    percentages = (
+        pd.DataFrame(selected, columns=option_cols, index=df.index)
+        .groupby(groups, observed=True, sort=True)
+        .mean()
+    ) * 100
+    percentages.index.name = group_col
+    return percentages
+
+def get_grouped_question_percentages(df: pd.DataFrame, group_col: str, question_key: str) -> pd.DataFrame:
+    """
+    Get the option percentages of a GROUPED_QUESTIONS group per answer of a grouping question.
+
+    Args:
+        df: Survey DataFrame
+        group_col: Single-choice column to break down by
+        question_key: GROUPED_QUESTIONS key of the multi-select question
+
+    Returns:
+        DataFrame as returned by get_grouped_selection_percentages
+    """
+    column_index = get_column_index(df.columns)
+    option_cols = [col for col in (column_index.resolve(c) for c in GROUPED_QUESTIONS[question_key]["columns"]) if col]
+    return get_grouped_selection_percentages(df, column_index.resolve(group_col) or group_col, option_cols)
@@ -1,10 +1,64 @@
 """Data processing utilities for the dashboard."""
 
+import hashlib
+import html
+import json
+import logging
+import numpy as np
 import pandas as pd
 import re
-from typing import Optional, Union, List
+from typing import Dict, Optional, Union, List, Tuple
 import os
 
+from src.config.config import LIKERT_NON_ANSWERS, LIKERT_SCALES, CHECKBOX_CATEGORIES
+from src.config.open_ended import OPEN_ENDED_COLS
+from src.utils.bounded_cache import LRUCache
+from src.utils.column_index import get_column_index
+
+# Maximum number of parsed survey files kept in the in-process dataset cache
+DATASET_CACHE_MAX_ENTRIES = 4
+
+# Key under DataFrame.attrs holding the (path, size, mtime) fingerprint of the source file
+DATASET_FINGERPRINT_ATTR = "dataset_fingerprint"
+
+# (fingerprint, frame, per-column aggregates) of the loaded datasets, keyed by path; an entry is
+# replaced when its file changes, so the aggregates never outlive their frame
+_dataset_cache = LRUCache(DATASET_CACHE_MAX_ENTRIES)
+
+# File extension of the columnar (Arrow IPC / Feather) snapshots compiled from the survey CSVs
+SNAPSHOT_EXTENSION = ".feather"
+
+# Version of the snapshot contents; bump it when encode_survey_frame or the header cleaning change
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Schema metadata key of a snapshot: its encoding digest and the size and mtime of its source CSV
+SNAPSHOT_METADATA_KEY = b"survey_snapshot"
+
+# Object columns with at most this many distinct answers are encoded as pandas Categoricals
+CATEGORICAL_MAX_UNIQUE = 20
+
+# Answers (lower-cased, stripped) counted as a selected option of a multi-select question
+MULTI_SELECT_SELECTED_VALUES = ("selected", "yes", "1", "true")
+
+logger = logging.getLogger(__name__)
+
+# Experience answers given as a range ("5-10") or a minimum ("10+" / "10 or more"), matched at the start
+EXPERIENCE_RANGE_PATTERN = r"^(\d+)\s*-\s*(\d+)"
+EXPERIENCE_MINIMUM_PATTERN = r"^(?:(\d+)\s*\+|(\d+)\s*or more)"
+
+# Columns summarized as numbers (mean/median/min/max) besides the int64/float64 ones
+NUMERIC_SUMMARY_COLUMNS = ("years_of_experience", "num_sustainability_trainings")
+
+# Column name markers of free-text answers, which always stay plain strings
+FREE_TEXT_MARKERS = ("[Comment]", "[Other]", "[Other comment]")
+
+def is_free_text_column(col: str) -> bool:
+    """Return True if the column holds free-text answers rather than fixed choices."""
+    if any(marker in col for marker in FREE_TEXT_MARKERS):
+        return True
+    # Survey exports HTML-escape "&" in headers, the configured question texts do not
+    return col in OPEN_ENDED_COLS or html.unescape(col) in OPEN_ENDED_COLS
+
 def dedup_column_names(columns: List[str]) -> List[str]:
     """
     Deduplicate column names by adding a suffix for duplicates.
@@ -54,18 +108,10 @@ def load_single_year_data(data_folder: str, year: int) -> pd.DataFrame:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Data file for year {year} not found at {file_path}")
     
-    # Read CSV with specific parameters to handle formatting issues
-    df = pd.read_csv(
-        file_path,
-        encoding='utf-8',
-        on_bad_lines='skip',  # Skip problematic lines
-        low_memory=False,     # Avoid mixed type inference issues
-        quoting=1,           # Handle quoted fields
-        escapechar='\\',     # Handle escaped characters
-    )
-    
-    # Clean up column names
-    df.columns = [clean_column_name(col) for col in df.columns]
+    # Prefer the compiled columnar snapshot when it is up to date
+    df = read_snapshot(file_path)
+    if df is None:
+        df = encode_survey_frame(_read_data_file(file_path))
     
     # Handle duplicate column names with our own function
     df.columns = dedup_column_names(list(df.columns))
@@ -94,18 +140,64 @@ def parse_experience(val: Union[str, float, None]) -> Optional[float]:
         pass
         
     # If range like "5-10"
-    match = re.match(r"(\d+)\s*-\s*(\d+)", val)
+    match = re.match(EXPERIENCE_RANGE_PATTERN, val)
     if match:
         low, high = map(int, match.groups())
         return (low + high) / 2
         
     # If "10+" or "10 or more"
-    match = re.match(r"(\d+)\s*\+|(\d+)\s*or more", val)
+    match = re.match(EXPERIENCE_MINIMUM_PATTERN, val)
     if match:
         return float(match.group(1) or match.group(2))
         
     return None
 
+def _to_float(text: str) -> float:
+    """Convert a string with float(), or return NaN if it is not a number."""
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+def parse_experience_column(values: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of experience answers, as parse_experience does per value.
+    
+    Plain numbers, "5-10" ranges (their midpoint) and "10+" / "10 or more"
+    answers are parsed in a few column-wide string operations, run on the
+    distinct answers only (the categories of a Categorical). Plain numbers
+    are read with float(), so answers such as "1_000" or full-width and
+    other Unicode digits ("３") parse as they do in parse_experience.
+    
+    Args:
+        values: Column of experience answers
+        
+    Returns:
+        Float Series with the same index and name; NaN where parsing fails
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pd.Series(values.to_numpy(dtype=float, na_value=np.nan), index=values.index, name=values.name)
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        # Mixed objects (e.g. 1, 1.0 and True) would factorize together but stringify differently
+        values = values.astype(str).where(values.notna())
+    codes, uniques = pd.factorize(values)
+    
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    parsed = text.map(_to_float).astype(float)
+    
+    # Ranges like "5-10"
+    bounds = text.str.extract(EXPERIENCE_RANGE_PATTERN).astype(float)
+    parsed = parsed.fillna((bounds[0] + bounds[1]) / 2)
+    
+    # "10+" or "10 or more"
+    minimum = text.str.extract(EXPERIENCE_MINIMUM_PATTERN).astype(float)
+    parsed = parsed.fillna(minimum[0]).fillna(minimum[1]).to_numpy()
+    
+    result = np.full(len(codes), np.nan)
+    answered = codes >= 0
+    result[answered] = parsed[codes[answered]]
+    return pd.Series(result, index=values.index, name=values.name)
+
 def process_numeric_column(df: pd.DataFrame, col: str) -> pd.Series:
     """
     Process a numeric column, handling various formats and errors.
@@ -118,7 +210,7 @@ def process_numeric_column(df: pd.DataFrame, col: str) -> pd.Series:
         Series with processed numeric values
     """
     if col == "How many years of professional experience do you have in IT/software engineering?":
-        return df[col].apply(parse_experience)
+        return parse_experience_column(df[col])
     else:
         return pd.to_numeric(df[col], errors='coerce')
 
@@ -133,10 +225,11 @@ def calculate_completion_rate(df: pd.DataFrame, col: str) -> float:
     Returns:
         Percentage of non-null values
     """
-    total = len(df)
-    if total == 0:
-        return 0.0
-    return (df[col].notna().sum() / total) * 100
+    return get_dataset_aggregates(df).completion_rate(col)
+
+def is_numeric_summary_column(df: pd.DataFrame, col: str) -> bool:
+    """Return True if get_response_summary summarizes the column as numbers rather than answers."""
+    return df[col].dtype in ['int64', 'float64'] or col in NUMERIC_SUMMARY_COLUMNS
 
 def get_response_summary(df: pd.DataFrame, col: str) -> dict:
     """
@@ -149,11 +242,12 @@ def get_response_summary(df: pd.DataFrame, col: str) -> dict:
     Returns:
         Dictionary containing response statistics
     """
-    total_responses = len(df)
-    valid_responses = df[col].notna().sum()
-    completion_rate = calculate_completion_rate(df, col)
+    aggregates = get_dataset_aggregates(df)
+    total_responses = aggregates.total
+    valid_responses = aggregates.non_null_count(col)
+    completion_rate = aggregates.completion_rate(col)
     
-    if df[col].dtype in ['int64', 'float64'] or col in ["years_of_experience", "num_sustainability_trainings"]:
+    if is_numeric_summary_column(df, col):
         numeric_values = process_numeric_column(df, col)
         return {
             "total_responses": total_responses,
@@ -165,24 +259,315 @@ def get_response_summary(df: pd.DataFrame, col: str) -> dict:
             "max": numeric_values.max()
         }
     else:
-        value_counts = df[col].value_counts()
+        value_counts = aggregates.value_counts(col, dropna=True)
         return {
             "total_responses": total_responses,
             "valid_responses": valid_responses,
             "completion_rate": completion_rate,
             "most_common": value_counts.index[0] if not value_counts.empty else None,
             "most_common_count": value_counts.iloc[0] if not value_counts.empty else 0,
-            "unique_values": df[col].nunique()
+            "unique_values": aggregates.nunique(col)
         }
 
-def load_data_file(data_file: str) -> pd.DataFrame:
+def get_file_fingerprint(data_file: str) -> tuple:
     """
-    Load and preprocess the GenAI RE survey data from a CSV file.
-    Cleans column names and handles duplicates.
-    Returns a pandas DataFrame.
+    Build the cache fingerprint of a data file.
+    
+    Args:
+        data_file: Path to the data file
+        
+    Returns:
+        Tuple of (absolute path, size in bytes, modification time in ns)
     """
-    if not os.path.exists(data_file):
-        raise FileNotFoundError(f"Data file not found at {data_file}")
+    stat = os.stat(data_file)
+    return (os.path.abspath(data_file), stat.st_size, stat.st_mtime_ns)
+
+def get_dataset_fingerprint(df: pd.DataFrame) -> Optional[tuple]:
+    """
+    Return the source file fingerprint of a DataFrame loaded by load_data_file, if any.
+
+    Only the frame held in the dataset cache has a fingerprint. pandas copies
+    attrs to derived frames (df[mask], df[cols], head, copy, ...), so those
+    carry the attribute too, but they hold other rows or columns and must not
+    share the caches keyed by the fingerprint.
+    """
+    fingerprint = df.attrs.get(DATASET_FINGERPRINT_ATTR)
+    if fingerprint is None:
+        return None
+    entry = _dataset_cache.peek(fingerprint[0])
+    if entry is None or entry[1] is not df:
+        return None
+    return fingerprint
+
+class DatasetAggregates:
+    """
+    Per-column answer statistics of one survey frame: value counts, non-null
+    counts, distinct answers and completion rates.
+
+    Each column is aggregated once, with a single value_counts pass, on
+    first access (or for every column at once by build); everything else is
+    derived from those counts. Chart builders and stat cards read these
+    aggregates instead of scanning the rows again.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.total: int = len(df)
+        self._df = df
+        self._columns: Dict[str, dict] = {}
+
+    def _column(self, col: str) -> dict:
+        entry = self._columns.get(col)
+        if entry is None:
+            counts = self._df[col].value_counts(dropna=False)
+            answered = counts[counts.index.notna()]
+            entry = {
+                "counts": counts,
+                "non_null": int(answered.sum()),
+                # Categoricals list their unused answers with a count of 0
+                "nunique": int((answered > 0).sum()),
+            }
+            self._columns[col] = entry
+        return entry
+
+    def build(self) -> "DatasetAggregates":
+        """Aggregate every column of the frame, returning self."""
+        for col in self._df.columns:
+            self._column(col)
+        return self
+
+    def value_counts(self, col: str, dropna: bool = False) -> pd.Series:
+        """Return a copy of the answer counts of a column, as Series.value_counts(dropna=dropna)."""
+        entry = self._column(col)
+        if not dropna:
+            return entry["counts"].copy()
+        if "answered_counts" not in entry:
+            # Counted separately: ties are ranked as value_counts ranks them without the NaN row
+            entry["answered_counts"] = self._df[col].value_counts()
+        return entry["answered_counts"].copy()
+
+    def non_null_count(self, col: str) -> int:
+        """Return the number of answers of a column."""
+        return self._column(col)["non_null"]
+
+    def nunique(self, col: str) -> int:
+        """Return the number of distinct answers of a column."""
+        return self._column(col)["nunique"]
+
+    def completion_rate(self, col: str) -> float:
+        """Return the percentage of respondents who answered a column."""
+        if self.total == 0:
+            return 0.0
+        return (self.non_null_count(col) / self.total) * 100
+
+def get_dataset_aggregates(df: pd.DataFrame) -> DatasetAggregates:
+    """
+    Get the aggregate store of a survey DataFrame.
+
+    The store of a frame loaded by load_data_file is built once, at load
+    time, and shared for as long as the dataset stays cached. Other frames
+    get a fresh store that aggregates only the columns asked for.
+
+    Args:
+        df: Survey DataFrame
+
+    Returns:
+        DatasetAggregates of df
+    """
+    fingerprint = get_dataset_fingerprint(df)
+    if fingerprint is not None:
+        entry = _dataset_cache.peek(fingerprint[0])
+        if entry is not None and entry[1] is df:
+            return entry[2]
+    return DatasetAggregates(df)
+
+def get_likert_scale(values) -> Optional[List[str]]:
+    """
+    Find the ordered answer scale that covers all given answers.
+    
+    Args:
+        values: Distinct non-null answers of a column
+        
+    Returns:
+        The matching scale from LIKERT_SCALES, or None if no scale covers the
+        answers other than LIKERT_NON_ANSWERS
+    """
+    answers = set(values).difference(LIKERT_NON_ANSWERS)
+    if not answers:
+        return None
+    for scale in LIKERT_SCALES.values():
+        if answers.issubset(scale):
+            return scale
+    return None
+
+def is_checkbox_column(col: str, values) -> bool:
+    """Return True for a multi-select option column ("Question [Option]") answered with Yes/No."""
+    return '[' in col and set(values).issubset(CHECKBOX_CATEGORIES)
+
+def encode_survey_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Encode the answer columns of a survey DataFrame in place.
+    
+    - Likert-type columns become ordered Categoricals (see LIKERT_SCALES);
+      columns that also hold LIKERT_NON_ANSWERS become unordered Categoricals
+      of the non-answers followed by the scale
+    - Multi-select checkbox columns become Categoricals with CHECKBOX_CATEGORIES,
+      so their int8 codes double as a selection flag (see get_checkbox_flags)
+    - Other columns with at most CATEGORICAL_MAX_UNIQUE answers become
+      Categoricals that keep the order of first appearance, so value counts
+      rank ties as before
+    - Free-text columns (see is_free_text_column) stay plain strings
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        The same DataFrame with encoded answer columns
+    """
+    for col in df.columns:
+        if df[col].dtype != object or is_free_text_column(col):
+            continue
+        values = df[col].dropna().unique()
+        if len(values) > CATEGORICAL_MAX_UNIQUE or not all(isinstance(v, str) for v in values):
+            continue
+        scale = get_likert_scale(values)
+        if is_checkbox_column(col, values):
+            dtype = pd.CategoricalDtype(CHECKBOX_CATEGORIES)
+        elif scale is not None and len(values) > 1:
+            non_answers = [answer for answer in LIKERT_NON_ANSWERS if answer in values]
+            dtype = pd.CategoricalDtype(non_answers + scale, ordered=not non_answers)
+        else:
+            dtype = pd.CategoricalDtype(values)
+        df[col] = pd.Categorical(df[col], dtype=dtype)
+    return df
+
+def get_checkbox_flags(df: pd.DataFrame, cols: List[str]) -> np.ndarray:
+    """
+    Get the selection flags of multi-select checkbox columns as a uint8 matrix.
+    
+    Args:
+        df: DataFrame encoded by encode_survey_frame
+        cols: Checkbox columns to read
+        
+    Returns:
+        Array of shape (rows, len(cols)) with 1 where the option was selected
+    """
+    flags = np.zeros((len(df), len(cols)), dtype=np.uint8)
+    for i, col in enumerate(cols):
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) and list(series.cat.categories) == CHECKBOX_CATEGORIES:
+            flags[:, i] = series.cat.codes.to_numpy() == 1
+        else:
+            flags[:, i] = series.astype(str).str.strip().str.lower().to_numpy() == 'yes'
+    return flags
+
+def get_selection_flags(
+    df: pd.DataFrame,
+    cols: List[str],
+    selected_values: Tuple[str, ...] = MULTI_SELECT_SELECTED_VALUES
+) -> np.ndarray:
+    """
+    Get the selection flags of multi-select option columns as a boolean matrix.
+    
+    A cell counts as selected if str(value).strip().lower() is one of
+    selected_values. The test runs once per distinct value of a column
+    (its categories, or the factorized values of other columns) and is
+    broadcast to the rows through the integer codes; only columns mixing
+    value types are compared cell by cell.
+    
+    Args:
+        df: Survey DataFrame
+        cols: Option columns to read
+        selected_values: Lower-case answers meaning "selected"
+        
+    Returns:
+        Array of shape (rows, len(cols)) with True where the option was selected
+    """
+    flags = np.zeros((len(df), len(cols)), dtype=bool)
+    for i, col in enumerate(cols):
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        elif series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+            # Mixed objects (e.g. 1, 1.0 and True) would factorize together but stringify differently
+            flags[:, i] = series.astype(str).str.strip().str.lower().isin(selected_values).to_numpy()
+            continue
+        else:
+            codes, uniques = pd.factorize(series)
+        # One extra False entry so that the missing-value code -1 reads as not selected
+        is_selected = np.zeros(len(uniques) + 1, dtype=bool)
+        is_selected[:len(uniques)] = [str(value).strip().lower() in selected_values for value in uniques]
+        flags[:, i] = is_selected[codes]
+    return flags
+
+def get_option_label(col: str) -> str:
+    """Return the option text within the brackets of a multi-select column name, or the full name."""
+    if '[' in col and ']' in col:
+        return col[col.find('[') + 1:col.rfind(']')].strip()
+    return col
+
+def count_multi_select(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """
+    Count the selections of every option of a multi-select question at once.
+    
+    Args:
+        df: Survey DataFrame
+        cols: Option columns; columns missing from df are skipped
+        
+    Returns:
+        DataFrame with one row per option (option, count, percentage), in column order
+    """
+    cols = [col for col in cols if col in df]
+    if not cols or len(df) == 0:
+        return pd.DataFrame(columns=['option', 'count', 'percentage'])
+    counts = get_selection_flags(df, cols).sum(axis=0, dtype=np.int64)
+    return pd.DataFrame({
+        'option': [get_option_label(col) for col in cols],
+        'count': counts,
+        'percentage': counts / len(df) * 100,
+    })
+
+def get_memory_report(raw_df: pd.DataFrame, encoded_df: pd.DataFrame) -> dict:
+    """
+    Compare the memory footprint of a survey DataFrame before and after encoding.
+    
+    Args:
+        raw_df: DataFrame as parsed from the CSV file
+        encoded_df: The same data after encode_survey_frame
+        
+    Returns:
+        Dictionary with total bytes before/after, the saving in percent and
+        a per-kind breakdown (likert, checkbox, categorical, free_text, other)
+    """
+    kinds = {}
+    for col in encoded_df.columns:
+        dtype = encoded_df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            if dtype.ordered or get_likert_scale(dtype.categories) is not None:
+                kind = "likert"
+            elif list(dtype.categories) == CHECKBOX_CATEGORIES:
+                kind = "checkbox"
+            else:
+                kind = "categorical"
+        elif is_free_text_column(col):
+            kind = "free_text"
+        else:
+            kind = "other"
+        entry = kinds.setdefault(kind, {"columns": 0, "bytes_before": 0, "bytes_after": 0})
+        entry["columns"] += 1
+        entry["bytes_before"] += int(raw_df[col].memory_usage(deep=True, index=False))
+        entry["bytes_after"] += int(encoded_df[col].memory_usage(deep=True, index=False))
+    before = sum(entry["bytes_before"] for entry in kinds.values())
+    after = sum(entry["bytes_after"] for entry in kinds.values())
+    return {
+        "rows": len(encoded_df),
+        "bytes_before": before,
+        "bytes_after": after,
+        "saving_pct": (1 - after / before) * 100 if before else 0.0,
+        "by_kind": kinds,
+    }
+
+def _read_data_file(data_file: str) -> pd.DataFrame:
+    """Parse a survey CSV file and clean its column names."""
     df = pd.read_csv(
         data_file,
         encoding='utf-8',
@@ -195,6 +580,183 @@ def load_data_file(data_file: str) -> pd.DataFrame:
     # Optionally handle duplicate columns if needed
     return df
 
+def _import_feather():
+    """Import pyarrow's Feather module, or return None if pyarrow is not installed."""
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    return feather
+
+def get_snapshot_path(data_file: str) -> str:
+    """Return the path of the columnar snapshot compiled from a survey CSV file."""
+    return os.path.splitext(data_file)[0] + SNAPSHOT_EXTENSION
+
+def get_snapshot_encoding() -> str:
+    """Return the digest of SNAPSHOT_FORMAT_VERSION and the settings that encode_survey_frame depends on."""
+    settings = [
+        SNAPSHOT_FORMAT_VERSION, LIKERT_SCALES, LIKERT_NON_ANSWERS, CHECKBOX_CATEGORIES,
+        CATEGORICAL_MAX_UNIQUE, OPEN_ENDED_COLS,
+    ]
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def get_snapshot_metadata(fingerprint: tuple) -> bytes:
+    """Return the SNAPSHOT_METADATA_KEY value of a snapshot of the CSV version with a fingerprint."""
+    return json.dumps({
+        "encoding": get_snapshot_encoding(),
+        "source_size": fingerprint[1],
+        "source_mtime_ns": fingerprint[2],
+    }, sort_keys=True).encode("utf-8")
+
+def _read_snapshot_metadata(snapshot_file: str) -> Optional[bytes]:
+    """Return the SNAPSHOT_METADATA_KEY value of a Feather file (None if it has none or pyarrow is missing)."""
+    feather = _import_feather()
+    if feather is None or not os.path.exists(snapshot_file):
+        return None
+    import pyarrow as pa
+    try:
+        with pa.memory_map(snapshot_file) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata
+    except pa.ArrowInvalid:
+        return None
+    return (metadata or {}).get(SNAPSHOT_METADATA_KEY)
+
+def read_snapshot(data_file: str, fingerprint: Optional[tuple] = None) -> Optional[pd.DataFrame]:
+    """
+    Read the columnar snapshot of a survey CSV file.
+    
+    A snapshot is only used if its metadata (see get_snapshot_metadata)
+    matches the current size and mtime of the CSV file and the current
+    encoding. Other .feather files next to the CSV (e.g. synthetic_data
+    output) are ignored with a warning.
+    
+    Args:
+        data_file: Path to the survey CSV file
+        fingerprint: get_file_fingerprint of data_file, if already taken
+        
+    Returns:
+        The snapshot DataFrame, or None if there is no current snapshot or
+        pyarrow is not installed
+    """
+    snapshot_file = get_snapshot_path(data_file)
+    metadata = _read_snapshot_metadata(snapshot_file)
+    if metadata is None:
+        if os.path.exists(snapshot_file) and _import_feather() is not None:
+            logger.warning("Ignoring %s: not a snapshot built by src.utils.build_snapshots", snapshot_file)
+        return None
+    if metadata != get_snapshot_metadata(fingerprint or get_file_fingerprint(data_file)):
+        return None
+    return _import_feather().read_table(snapshot_file, memory_map=True).to_pandas()
+
+def write_snapshot(
+    data_file: str,
+    df: Optional[pd.DataFrame] = None,
+    fingerprint: Optional[tuple] = None
+) -> str:
+    """
+    Compile a survey CSV file into a columnar Feather snapshot.
+    
+    The snapshot holds the cleaned column names and the encoded answer
+    columns (see encode_survey_frame), so loading it skips CSV parsing,
+    column cleaning and encoding. Its schema metadata records the encoding
+    and the size and mtime of the CSV it was compiled from. The file is
+    written next to the CSV under a temporary name and moved into place.
+    
+    Args:
+        data_file: Path to the survey CSV file
+        df: The encoded frame of data_file, if already loaded
+        fingerprint: get_file_fingerprint of data_file taken before df was read
+        
+    Returns:
+        Path of the written snapshot
+    """
+    feather = _import_feather()
+    if feather is None:
+        raise ImportError("pyarrow is required to build data snapshots")
+    import pyarrow as pa
+    if df is None:
+        fingerprint = get_file_fingerprint(data_file)
+        df = encode_survey_frame(_read_data_file(data_file))
+    table = pa.Table.from_pandas(df)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        SNAPSHOT_METADATA_KEY: get_snapshot_metadata(fingerprint or get_file_fingerprint(data_file)),
+    })
+    snapshot_file = get_snapshot_path(data_file)
+    temporary = f"{snapshot_file}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, temporary, compression="uncompressed")
+        os.replace(temporary, snapshot_file)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return snapshot_file
+
+def load_data_file(data_file: str) -> pd.DataFrame:
+    """
+    Load and preprocess the GenAI RE survey data from a CSV file.
+    Cleans column names and handles duplicates.
+    Returns a pandas DataFrame.
+    
+    Parsed files are kept in a process-wide LRU cache keyed by the file's
+    (path, size, mtime) fingerprint, so repeat calls skip the CSV parse and
+    a changed file is picked up automatically. A columnar snapshot built by
+    src.utils.build_snapshots is used instead of the CSV while it matches
+    the CSV (see read_snapshot); an outdated one is rebuilt from the CSV.
+    The corpus indexes of the OPEN_ENDED_COLS (see src.utils.text_index)
+    are built with the dataset, so text views never tokenize on a request.
+    The returned DataFrame is shared between callers and must be treated
+    as read-only.
+    """
+    if not os.path.exists(data_file):
+        raise FileNotFoundError(f"Data file not found at {data_file}")
+    fingerprint = get_file_fingerprint(data_file)
+    path = fingerprint[0]
+
+    def is_current(entry: tuple) -> bool:
+        return entry[0] == fingerprint
+
+    entry = _dataset_cache.get(path, valid=is_current)
+    if entry is not None:
+        return entry[1]
+    
+    df = read_snapshot(data_file, fingerprint)
+    if df is None:
+        df = encode_survey_frame(_read_data_file(data_file))
+        if _read_snapshot_metadata(get_snapshot_path(data_file)) is not None:
+            # An outdated snapshot of this CSV (foreign .feather files are never overwritten)
+            try:
+                write_snapshot(data_file, df, fingerprint)
+            except OSError as e:
+                logger.warning("Outdated snapshot of %s could not be rebuilt: %s", data_file, e)
+    df.attrs[DATASET_FINGERPRINT_ATTR] = fingerprint
+    # Build the column-resolution index and the per-column aggregates once per loaded dataset
+    get_column_index(df.columns)
+    aggregates = DatasetAggregates(df).build()
+    
+    # If another thread parsed the same file version first, share its frame
+    entry = _dataset_cache.setdefault(path, (fingerprint, df, aggregates), valid=is_current)
+    if entry[1] is df:
+        # Imported here: text_index imports this module (for get_dataset_fingerprint)
+        from src.utils.text_index import get_corpus_index
+        for col in OPEN_ENDED_COLS:
+            if col in df.columns:
+                get_corpus_index(df, col)
+    return entry[1]
+
+def get_dataset_cache_stats() -> dict:
+    """
+    Get the counters of the in-process dataset cache.
+    
+    Returns:
+        Dictionary with hits, misses, evictions, current size and max size
+    """
+    return _dataset_cache.stats()
+
+def clear_dataset_cache() -> None:
+    """Drop all cached datasets and reset the cache counters."""
+    _dataset_cache.clear()
+
 def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """Clean column names by removing special characters and standardizing format."""
     # Store original columns for reference
@@ -0,0 +1,29 @@
+"""Configuration of the application log.
+
+Modules log to loggers named after themselves (logging.getLogger(__name__)),
+so the level of one part of the app can be raised on its own, e.g.
+logging.getLogger("src.components.charts").setLevel(logging.DEBUG).
+Messages are formatted lazily: arguments are passed to the logger, and
+expensive diagnostics are guarded with logger.isEnabledFor.
+"""
+
+import logging
+from typing import Optional, Union
+
+from src.config.config import LOG_FORMAT, LOG_LEVEL
+
+def configure_logging(level: Optional[Union[int, str]] = None) -> None:
+    """
+    Send the application log to stderr.
+
+    Does nothing if the root logger already has handlers (e.g. set up by a
+    WSGI server), apart from setting the level.
+
+    Args:
+        level: Level name or number; defaults to LOG_LEVEL
+    """
+    level = LOG_LEVEL if level is None else level
+    if isinstance(level, str):
+        level = level.upper()
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+    logging.getLogger().setLevel(level)
@@ -0,0 +1,33 @@
+"""Report the memory saved by encoding the survey answer columns.
+
+Usage:
+    python -m src.utils.memory_report
+
+Prints, for every year in YEAR_TO_FILE, the resident size of the DataFrame
+as parsed from the CSV next to the size after encode_survey_frame.
+"""
+
+from src.config.config import YEAR_TO_FILE
+from src.utils.data_processing import _read_data_file, encode_survey_frame, get_memory_report
+
+def _format_bytes(n: int) -> str:
+    """Format a byte count as KiB with one decimal."""
+    return f"{n / 1024:.1f} KiB"
+
+def print_memory_report() -> dict:
+    """Print the before/after memory report per year and return the reports keyed by year."""
+    reports = {}
+    for year, data_file in sorted(YEAR_TO_FILE.items()):
+        raw_df = _read_data_file(data_file)
+        encoded_df = encode_survey_frame(raw_df.copy())
+        report = get_memory_report(raw_df, encoded_df)
+        reports[year] = report
+        print(f"{year} ({report['rows']} rows): {_format_bytes(report['bytes_before'])} -> "
+              f"{_format_bytes(report['bytes_after'])} ({report['saving_pct']:.1f}% saved)")
+        for kind, entry in sorted(report["by_kind"].items()):
+            print(f"  {kind:<12} {entry['columns']:>4} cols  "
+                  f"{_format_bytes(entry['bytes_before']):>12} -> {_format_bytes(entry['bytes_after']):>12}")
+    return reports
+
+if __name__ == "__main__":
+    print_memory_report()
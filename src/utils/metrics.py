@@ -0,0 +1,210 @@
+"""Request instrumentation: per-stage wall and CPU time, payload size and figure counts of the callbacks.
+
+Every request handled by the server gets a RequestMetrics in a context
+variable (see install_request_metrics). Code marks its stages with
+`with stage("build"):`, a no-op outside a request. Callbacks name their
+requests (see instrument_callback). When the response of a named request
+is sent, its timings are added as a Server-Timing header and appended to
+a bounded window of recent samples per name. The metrics endpoint
+computes percentiles from those windows on demand, so recording costs a
+few clock reads and one append per request.
+"""
+
+import functools
+import hmac
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Deque, Dict, Optional
+
+import numpy as np
+from flask import abort, current_app, g, jsonify, request
+
+# Percentiles reported by the metrics endpoint
+METRICS_PERCENTILES = (50, 90, 95, 99)
+
+# Recent requests kept per request name
+METRICS_WINDOW = 1000
+
+# Client addresses allowed to read the metrics endpoint of the debug server without a token
+METRICS_LOCAL_ADDRESSES = ("127.0.0.1", "::1")
+
+# Request header carrying the metrics token
+METRICS_TOKEN_HEADER = "X-Metrics-Token"
+
+class RequestMetrics:
+    """Timings and counters of one request."""
+
+    __slots__ = ("name", "start_wall", "start_cpu", "stages", "figures_built", "figures_cached", "callback_end")
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.thread_time()
+        # Stage name -> [wall seconds, CPU seconds], summed over repeated stages
+        self.stages: Dict[str, list] = {}
+        self.figures_built = 0
+        self.figures_cached = 0
+        self.callback_end: Optional[float] = None
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+_samples: Dict[str, Deque[dict]] = {}
+_samples_lock = threading.Lock()
+
+@contextmanager
+def stage(name: str):
+    """Time a stage of the current request (wall and thread CPU time); a no-op outside a request."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        totals = metrics.stages.setdefault(name, [0.0, 0.0])
+        totals[0] += time.perf_counter() - wall
+        totals[1] += time.thread_time() - cpu
+
+def set_request_name(name: str) -> None:
+    """Name the current request; only named requests are recorded."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.name = name
+
+def record_figure(cached: bool) -> None:
+    """Count a figure returned to the current request, built or taken from the figure cache."""
+    metrics = _current.get()
+    if metrics is not None:
+        if cached:
+            metrics.figures_cached += 1
+        else:
+            metrics.figures_built += 1
+
+def instrument_callback(name: str) -> Callable:
+    """
+    Record the requests of a Dash callback under a name.
+
+    The callback body may refine the name with set_request_name. The time
+    from the callback's return to the response being sent (Dash's JSON
+    serialization) is recorded as the "serialize" stage.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _current.get()
+            if metrics is None:
+                return func(*args, **kwargs)
+            metrics.name = name
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.callback_end = time.perf_counter()
+        return wrapper
+    return decorator
+
+def _finish_request(response):
+    """Add the Server-Timing header to a named response and record its sample."""
+    metrics = _current.get()
+    if metrics is None or metrics.name is None:
+        return response
+    now = time.perf_counter()
+    stages = {name: (wall, cpu) for name, (wall, cpu) in metrics.stages.items()}
+    if metrics.callback_end is not None:
+        stages["serialize"] = (now - metrics.callback_end, None)
+    total_ms = (now - metrics.start_wall) * 1000
+    cpu_ms = (time.thread_time() - metrics.start_cpu) * 1000
+    size = response.calculate_content_length()
+    if size is None and not response.direct_passthrough:
+        size = len(response.get_data())
+
+    timing = [f'{name};dur={wall * 1000:.2f}' for name, (wall, _) in stages.items()]
+    timing += [f'cpu;dur={cpu_ms:.2f}', f'total;dur={total_ms:.2f}',
+               f'figures;desc="{metrics.figures_built} built, {metrics.figures_cached} cached"']
+    if size is not None:
+        timing.append(f'payload;desc="{size} B"')
+    response.headers["Server-Timing"] = ", ".join(timing)
+
+    sample = {
+        "total_ms": total_ms,
+        "cpu_ms": cpu_ms,
+        "bytes": size,
+        "figures_built": metrics.figures_built,
+        "figures_cached": metrics.figures_cached,
+    }
+    for name, (wall, cpu) in stages.items():
+        sample[f"{name}_ms"] = wall * 1000
+        if cpu is not None:
+            sample[f"{name}_cpu_ms"] = cpu * 1000
+    with _samples_lock:
+        window = _samples.get(metrics.name)
+        if window is None:
+            window = _samples[metrics.name] = deque(maxlen=METRICS_WINDOW)
+        window.append(sample)
+    return response
+
+def get_metrics_summary() -> dict:
+    """
+    Summarize the recent samples of every request name.
+
+    Returns:
+        Dictionary per request name with the sample count and, per recorded
+        field, the mean and METRICS_PERCENTILES
+    """
+    with _samples_lock:
+        windows = {name: list(window) for name, window in _samples.items()}
+    summary = {}
+    for name, samples in sorted(windows.items()):
+        fields = {}
+        for field in dict.fromkeys(key for sample in samples for key in sample):
+            values = np.array([sample[field] for sample in samples if sample.get(field) is not None], dtype=float)
+            if values.size:
+                fields[field] = {
+                    "mean": float(values.mean()),
+                    **{f"p{p}": float(np.percentile(values, p)) for p in METRICS_PERCENTILES},
+                }
+        summary[name] = {"count": len(samples), "fields": fields}
+    return summary
+
+def clear_metrics() -> None:
+    """Drop all recorded samples."""
+    with _samples_lock:
+        _samples.clear()
+
+def install_request_metrics(server, route: str, token: Optional[str] = None) -> None:
+    """
+    Instrument the requests of a Flask server and serve the metrics summary at route.
+
+    With a token, the summary is served to clients sending it in the
+    METRICS_TOKEN_HEADER header. Without one, it is only served while the
+    server runs in debug mode, to local clients (METRICS_LOCAL_ADDRESSES):
+    behind a reverse proxy every request comes from a local address, so the
+    address alone cannot tell local clients apart. Everyone else gets a 404.
+    """
+    @server.before_request
+    def start_request_metrics():
+        g.request_metrics_token = _current.set(RequestMetrics())
+
+    @server.after_request
+    def finish_request_metrics(response):
+        return _finish_request(response)
+
+    @server.teardown_request
+    def reset_request_metrics(exception=None):
+        token = g.pop("request_metrics_token", None)
+        if token is not None:
+            _current.reset(token)
+
+    def serve_metrics():
+        if token:
+            sent = request.headers.get(METRICS_TOKEN_HEADER, "")
+            allowed = hmac.compare_digest(sent.encode("utf-8"), token.encode("utf-8"))
+        else:
+            allowed = current_app.debug and request.remote_addr in METRICS_LOCAL_ADDRESSES
+        if not allowed:
+            abort(404)
+        return jsonify(get_metrics_summary())
+
+    server.add_url_rule(route, "metrics", serve_metrics)
@@ -0,0 +1,191 @@
+"""Whole-dataset profile: the get_response_summary of every column of a survey year, as one table.
+
+Usage:
+    python -m src.utils.profiling [--year 2025] [--output profile.json]
+
+Prints the completion overview of every year in YEAR_TO_FILE (or of the
+given year) and optionally writes the full profiles as JSON, keyed by year.
+"""
+
+import argparse
+import json
+import warnings
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import YEAR_TO_FILE
+from src.utils.bounded_cache import LRUCache
+from src.utils.data_processing import (
+    NUMERIC_SUMMARY_COLUMNS,
+    get_dataset_aggregates,
+    get_dataset_fingerprint,
+    is_numeric_summary_column,
+    load_data_file,
+    process_numeric_column,
+)
+
+# Maximum number of dataset profiles kept in the profile cache
+PROFILE_CACHE_MAX_ENTRIES = 8
+
+# Columns of a profile, in order; the statistics are the get_response_summary keys
+PROFILE_FIELDS = (
+    "kind",
+    "total_responses",
+    "valid_responses",
+    "completion_rate",
+    "mean",
+    "median",
+    "min",
+    "max",
+    "most_common",
+    "most_common_count",
+    "unique_values",
+)
+
+# Number of least answered columns printed per year by the command line report
+LEAST_ANSWERED_SHOWN = 5
+
+_profile_cache = LRUCache(PROFILE_CACHE_MAX_ENTRIES)
+
+def build_dataset_profile(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize every column of a survey DataFrame at once.
+
+    Counts and completion rates come from the dataset's aggregate store
+    (see get_dataset_aggregates). The numeric statistics are one reduction
+    per statistic over all numeric columns together. Every row holds the
+    values get_response_summary returns for its column.
+
+    Args:
+        df: Survey DataFrame
+
+    Returns:
+        DataFrame indexed by column name with PROFILE_FIELDS as columns;
+        kind is "numeric" or "categorical", and the statistics that do
+        not apply to a kind are NaN
+    """
+    aggregates = get_dataset_aggregates(df)
+    columns = list(df.columns)
+    numeric_cols = [col for col in columns if is_numeric_summary_column(df, col)]
+    profile = pd.DataFrame(index=pd.Index(columns, name="column"), columns=list(PROFILE_FIELDS), dtype=object)
+    profile["kind"] = "categorical"
+    profile.loc[numeric_cols, "kind"] = "numeric"
+    profile["total_responses"] = aggregates.total
+    profile["valid_responses"] = [aggregates.non_null_count(col) for col in columns]
+    profile["completion_rate"] = [aggregates.completion_rate(col) for col in columns]
+
+    if numeric_cols:
+        numbers = pd.concat(
+            [df[[col for col in numeric_cols if col not in NUMERIC_SUMMARY_COLUMNS]]]
+            + [process_numeric_column(df, col) for col in numeric_cols if col in NUMERIC_SUMMARY_COLUMNS],
+            axis=1,
+        )
+        with warnings.catch_warnings():
+            # Unanswered numeric columns have no statistics (NaN), like Series.median() of them
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for stat in ("mean", "median", "min", "max"):
+                profile.loc[numbers.columns, stat] = getattr(numbers, stat)()
+
+    for col in columns:
+        if col in numeric_cols:
+            continue
+        counts = aggregates.value_counts(col, dropna=True)
+        profile.at[col, "most_common"] = counts.index[0] if not counts.empty else None
+        profile.at[col, "most_common_count"] = counts.iloc[0] if not counts.empty else 0
+        profile.at[col, "unique_values"] = aggregates.nunique(col)
+    return profile
+
+def get_dataset_profile(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get the profile of a survey DataFrame (see build_dataset_profile).
+
+    Profiles are cached per dataset fingerprint; frames without a
+    fingerprint are profiled every time.
+
+    Args:
+        df: Survey DataFrame
+
+    Returns:
+        A copy of the profile
+    """
+    fingerprint = get_dataset_fingerprint(df)
+    if fingerprint is not None:
+        profile = _profile_cache.get(fingerprint)
+        if profile is not None:
+            return profile.copy()
+    profile = build_dataset_profile(df)
+    if fingerprint is not None:
+        _profile_cache.put(fingerprint, profile)
+        return profile.copy()
+    return profile
+
+def _to_json_value(value):
+    """Convert a profile cell to a JSON-serializable Python value (NaN becomes None)."""
+    if value is None or (np.ndim(value) == 0 and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+def profile_to_records(profile: pd.DataFrame) -> List[dict]:
+    """
+    Convert a dataset profile to JSON-serializable records.
+
+    Returns:
+        One dictionary per column: the column name under "column", then PROFILE_FIELDS
+    """
+    return [
+        {"column": col, **{field: _to_json_value(value) for field, value in row.items()}}
+        for col, row in profile.iterrows()
+    ]
+
+def get_dataset_profile_records(df: pd.DataFrame) -> List[dict]:
+    """Get the profile of a survey DataFrame as JSON-serializable records (see profile_to_records)."""
+    return profile_to_records(get_dataset_profile(df))
+
+def get_profile_cache_stats() -> dict:
+    """
+    Get the counters of the profile cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, current size and max size
+    """
+    return _profile_cache.stats()
+
+def clear_profile_cache() -> None:
+    """Drop all cached profiles and reset the cache counters."""
+    _profile_cache.clear()
+
+def print_profile_report(years: List[int] = None) -> dict:
+    """Print the completion overview per year and return the profile records keyed by year."""
+    reports = {}
+    for year in sorted(YEAR_TO_FILE if years is None else years):
+        profile = get_dataset_profile(load_data_file(YEAR_TO_FILE[year]))
+        reports[year] = profile_to_records(profile)
+        completion = profile["completion_rate"].astype(float)
+        kinds = profile["kind"].value_counts()
+        print(f"{year} ({profile['total_responses'].iloc[0] if len(profile) else 0} rows, "
+              f"{kinds.get('categorical', 0)} categorical / {kinds.get('numeric', 0)} numeric columns): "
+              f"median completion {completion.median():.1f}%")
+        for col, rate in completion.nsmallest(LEAST_ANSWERED_SHOWN).items():
+            print(f"  {rate:>5.1f}%  {col[:100]}")
+    return reports
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile every column of the survey years.")
+    parser.add_argument("--year", type=int, choices=sorted(YEAR_TO_FILE), help="Profile this year only")
+    parser.add_argument("--output", help="Write the profiles as JSON to this path")
+    args = parser.parse_args()
+
+    reports = print_profile_report(None if args.year is None else [args.year])
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({str(year): records for year, records in reports.items()}, f, indent=2)
+        print(f"Profiles written to {args.output}")
+
+if __name__ == "__main__":
+    main()
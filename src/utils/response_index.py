@@ -0,0 +1,150 @@
+"""Inverted index over the open-ended responses of a survey year, for keyword search."""
+
+import re
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.open_ended import OPEN_ENDED_COLS
+from src.utils.bounded_cache import LRUCache
+from src.utils.data_processing import get_dataset_fingerprint
+from src.utils.text_index import TOKEN_PATTERN, build_corpus_index
+
+# Maximum number of survey years kept in the search index cache
+RESPONSE_INDEX_CACHE_MAX_ENTRIES = 4
+
+# Column name markers of comment columns listed after OPEN_ENDED_COLS
+COMMENT_MARKERS = ("[Comment]", "[Other comment]")
+
+_TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+_response_index_cache = LRUCache(RESPONSE_INDEX_CACHE_MAX_ENTRIES)
+
+def get_open_ended_columns(df: pd.DataFrame) -> List[str]:
+    """Return the OPEN_ENDED_COLS found in df, then the other comment columns, in column order."""
+    comments = [
+        col for col in df.columns
+        if any(marker in col for marker in COMMENT_MARKERS) and col not in OPEN_ENDED_COLS
+    ]
+    return [col for col in OPEN_ENDED_COLS + comments if col in df.columns]
+
+def get_listed_responses(values: pd.Series) -> List[str]:
+    """Return the responses of a column worth listing: non-empty and not "n/a"."""
+    return [r for r in values.dropna().astype(str).tolist() if r.strip() and r.strip().lower() != 'n/a']
+
+class ResponseSearchIndex:
+    """
+    Keyword index over the listed responses of several questions.
+
+    Responses are numbered question after question, in column order.
+    Tokens are those of CorpusIndex. For every term, the positions of the
+    responses containing it are stored in sorted order, in one array
+    (postings) with per-term offsets, so a keyword search is a few
+    array intersections.
+
+    Attributes:
+        columns: The indexed questions (columns)
+        responses: Every listed response
+        questions: Position in columns of the question of every response
+        corpus: CorpusIndex of the responses
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: List[str]):
+        self.columns: List[str] = list(columns)
+        responses = []
+        questions = []
+        for position, col in enumerate(self.columns):
+            listed = get_listed_responses(df[col])
+            responses.extend(listed)
+            questions.extend([position] * len(listed))
+        self.responses: np.ndarray = np.asarray(responses, dtype=object)
+        self.questions: np.ndarray = np.asarray(questions, dtype=np.int32)
+        self.corpus = build_corpus_index(pd.Series(self.responses, dtype=object))
+
+        terms = len(self.corpus.vocabulary)
+        lengths = np.diff(self.corpus.spans)
+        documents = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+        # Unique (term, response) pairs, sorted by term then response
+        pairs = np.unique(self.corpus.token_ids.astype(np.int64) * max(len(lengths), 1) + documents)
+        self._postings: np.ndarray = (pairs % max(len(lengths), 1)).astype(np.int32)
+        self._offsets: np.ndarray = np.concatenate(
+            [[0], np.cumsum(np.bincount(pairs // max(len(lengths), 1), minlength=terms))]
+        ).astype(np.int64)
+        self._question_ranges: np.ndarray = np.searchsorted(self.questions, np.arange(len(self.columns) + 1))
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def get_postings(self, term: str) -> np.ndarray:
+        """Return the sorted positions of the responses containing a (lower-case) term."""
+        term_id = self.corpus.get_term_id(term)
+        if term_id is None:
+            return np.empty(0, dtype=np.int32)
+        return self._postings[self._offsets[term_id]:self._offsets[term_id + 1]]
+
+    def search(self, query: Optional[str] = None, question: Optional[int] = None) -> np.ndarray:
+        """
+        Find the responses containing every keyword of a query.
+
+        Args:
+            query: Keywords, matched as whole words regardless of case; all responses if empty
+            question: Position in columns of a question to restrict the search to;
+                anything but a valid position (e.g. from a tampered request) searches all questions
+
+        Returns:
+            Sorted positions of the matching responses
+        """
+        keywords = list(dict.fromkeys(_TOKEN_RE.findall((query or "").lower())))
+        if not isinstance(question, (int, np.integer)) or isinstance(question, bool) \
+                or not 0 <= question < len(self.columns):
+            question = None
+        if question is not None:
+            start, end = self._question_ranges[question], self._question_ranges[question + 1]
+        else:
+            start, end = 0, len(self.responses)
+        if not keywords:
+            return np.arange(start, end, dtype=np.int32)
+        postings = sorted((self.get_postings(keyword) for keyword in keywords), key=len)
+        matches = postings[0]
+        for other in postings[1:]:
+            if not len(matches):
+                break
+            # Linear intersection of sorted postings: keep the matches marked in a membership mask
+            member = np.zeros(len(self.responses), dtype=bool)
+            member[other] = True
+            matches = matches[member[matches]]
+        if question is not None:
+            matches = matches[np.searchsorted(matches, start):np.searchsorted(matches, end)]
+        return matches
+
+def get_response_search_index(df: pd.DataFrame) -> ResponseSearchIndex:
+    """
+    Get the search index of the open-ended responses of a survey DataFrame.
+
+    Indexes cover get_open_ended_columns and are cached per dataset
+    fingerprint; frames without a fingerprint are indexed every time.
+    The index is shared and must be treated as read-only.
+    """
+    fingerprint = get_dataset_fingerprint(df)
+    if fingerprint is not None:
+        index = _response_index_cache.get(fingerprint)
+        if index is not None:
+            return index
+    index = ResponseSearchIndex(df, get_open_ended_columns(df))
+    if fingerprint is not None:
+        _response_index_cache.put(fingerprint, index)
+    return index
+
+def get_response_index_cache_stats() -> dict:
+    """
+    Get the counters of the search index cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, current size and max size
+    """
+    return _response_index_cache.stats()
+
+def clear_response_index_cache() -> None:
+    """Drop all cached search indexes and reset the cache counters."""
+    _response_index_cache.clear()
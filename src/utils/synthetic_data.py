@@ -0,0 +1,289 @@
+"""Generate synthetic survey files shaped like a real survey year.
+
+Usage:
+    python -m src.utils.synthetic_data --source data/2025.csv --rows 100000 --output data/synthetic.csv
+
+Learns the answer distribution of every column of the source file and
+writes any number of synthetic respondents with the same headers:
+- multi-select "[Option]" groups from GROUPED_QUESTIONS and the Scale 1 /
+  Scale 2 answers of every GROUPED_TASK_SCALES task are sampled jointly,
+  so co-selections and Likert answer pairs keep their observed shape,
+- other choice and numeric columns are sampled from their own distribution,
+- free-text columns (OPEN_ENDED_COLS and "[Comment]"/"[Other]" columns) get
+  text from a word bigram model, at the observed response rate; generated
+  texts equal to a real answer are rejected, so no answer is copied.
+
+Rows are generated and written in chunks, so memory stays bounded by
+--chunk-size whatever --rows is. Files ending in .feather are written as
+an Arrow IPC file (pyarrow required), everything else as a survey CSV.
+"""
+
+import argparse
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import GROUPED_QUESTIONS
+from src.utils.column_index import get_column_index
+from src.utils.data_processing import _import_feather, _read_data_file, is_free_text_column
+from src.utils.task_scales import get_task_scale_columns
+
+# Rows generated and written per chunk
+DEFAULT_CHUNK_SIZE = 50000
+
+# Number of distinct synthetic responses generated per free-text column
+TEXT_POOL_SIZE = 500
+
+# Draws per synthetic response before a text equal to a real answer is given up
+TEXT_ATTEMPTS = 20
+
+# CSV dialect of the survey exports (see _read_data_file)
+CSV_OPTIONS = {"encoding": "utf-8", "quoting": 1, "escapechar": "\\"}
+
+def _distribution(values: pd.Series) -> dict:
+    """Return the observed values of a Series (missing as None) and their probabilities."""
+    counts = values.astype(object).where(values.notna(), None).value_counts(dropna=False, normalize=True, sort=False)
+    return {"values": list(counts.index), "probabilities": counts.to_numpy(dtype=float)}
+
+def _learn_text_model(responses: pd.Series, total: int) -> dict:
+    """Learn a word bigram model and the response rate of a free-text column."""
+    texts = [str(text).split() for text in responses.dropna() if str(text).strip()]
+    starts = []
+    transitions = defaultdict(list)
+    for words in texts:
+        starts.append(words[0])
+        for current, following in zip(words, words[1:]):
+            transitions[current].append(following)
+    return {
+        "kind": "text",
+        "rate": len(texts) / total if total else 0.0,
+        "starts": starts,
+        "transitions": dict(transitions),
+        "lengths": [len(words) for words in texts],
+        # Real answers, which the generated texts must not reproduce
+        "sources": {" ".join(words) for words in texts},
+    }
+
+def _get_joint_groups(df: pd.DataFrame) -> List[List[str]]:
+    """Return the column groups sampled jointly: multi-select groups and task Scale 1/Scale 2 pairs."""
+    column_index = get_column_index(df.columns)
+    groups = []
+    for group in GROUPED_QUESTIONS.values():
+        cols = [column_index.resolve(col) for col in group["columns"]]
+        groups.append([col for col in dict.fromkeys(cols) if col is not None])
+    for phase in get_task_scale_columns(df.columns).values():
+        for scale_cols in phase.values():
+            groups.append([col for col in scale_cols.values() if col is not None])
+    # A column belongs to the first group listing it
+    grouped = set()
+    joint_groups = []
+    for cols in groups:
+        cols = [col for col in cols if col not in grouped and not is_free_text_column(col)]
+        if len(cols) > 1:
+            joint_groups.append(cols)
+            grouped.update(cols)
+    return joint_groups
+
+def learn_survey_model(data_file: str) -> dict:
+    """
+    Learn the per-column answer distributions of a survey file.
+
+    Args:
+        data_file: Survey CSV file to learn from
+
+    Returns:
+        Model with the original headers, the column models and the jointly sampled groups
+    """
+    headers = list(pd.read_csv(data_file, nrows=0, **CSV_OPTIONS).columns)
+    df = _read_data_file(data_file)
+    total = len(df)
+    joint_groups = _get_joint_groups(df)
+    grouped = {col for cols in joint_groups for col in cols}
+
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if col in grouped:
+            continue
+        if is_free_text_column(col):
+            columns[col] = _learn_text_model(series, total)
+        elif pd.api.types.is_integer_dtype(series) and series.is_unique:
+            # Identifiers (e.g. Response ID) stay unique
+            columns[col] = {"kind": "key", "start": int(series.min()) if total else 1}
+        elif pd.api.types.is_numeric_dtype(series):
+            columns[col] = {"kind": "numeric", "dtype": str(series.dtype), **_distribution(series)}
+        else:
+            columns[col] = {"kind": "choice", **_distribution(series)}
+
+    groups = []
+    for cols in joint_groups:
+        patterns = df[cols].astype(object).where(df[cols].notna(), None)
+        counts = patterns.value_counts(dropna=False, normalize=True, sort=False)
+        groups.append({
+            "columns": cols,
+            "patterns": [list(pattern) for pattern in counts.index],
+            "probabilities": counts.to_numpy(dtype=float),
+        })
+    return {"headers": headers, "names": list(df.columns), "columns": columns, "groups": groups}
+
+def _generate_text(model: dict, rng: np.random.Generator, vocabulary: List[str]) -> Optional[str]:
+    """
+    Generate one synthetic free-text response that is not a real answer.
+
+    Texts are drawn from the bigram model first; short answers and columns
+    with few distinct answers often lead the bigrams back to a real answer,
+    so half of the TEXT_ATTEMPTS draws pick their words from the vocabulary
+    alone.
+
+    Returns:
+        The text, or None when every draw reproduced a real answer
+    """
+    for attempt in range(TEXT_ATTEMPTS):
+        length = model["lengths"][rng.integers(len(model["lengths"]))]
+        if attempt < TEXT_ATTEMPTS // 2:
+            words = [model["starts"][rng.integers(len(model["starts"]))]]
+            while len(words) < length:
+                following = model["transitions"].get(words[-1])
+                if not following:
+                    break
+                words.append(following[rng.integers(len(following))])
+        else:
+            words = [vocabulary[i] for i in rng.integers(len(vocabulary), size=max(length, 2))]
+        text = " ".join(words)
+        if text not in model["sources"]:
+            return text
+    return None
+
+def _generate_text_pool(model: dict, rng: np.random.Generator, size: int = TEXT_POOL_SIZE) -> List[str]:
+    """Generate synthetic free-text responses from a bigram text model, none of them a real answer."""
+    if not model["starts"]:
+        return []
+    vocabulary = sorted({word for text in model["sources"] for word in text.split()})
+    pool = [_generate_text(model, rng, vocabulary) for _ in range(size)]
+    return [text for text in pool if text is not None]
+
+def _sample(values: list, probabilities: np.ndarray, rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw rows values with the given probabilities."""
+    choices = np.empty(len(values), dtype=object)
+    choices[:] = values
+    return choices[rng.choice(len(values), size=rows, p=probabilities)]
+
+def generate_chunk(model: dict, rows: int, first_row: int, rng: np.random.Generator,
+                   text_pools: Dict[str, List[str]]) -> pd.DataFrame:
+    """
+    Generate a chunk of synthetic respondents.
+
+    Args:
+        model: Model returned by learn_survey_model
+        rows: Number of respondents to generate
+        first_row: Position of the first respondent in the whole file (for keys)
+        rng: Random generator
+        text_pools: Synthetic responses per free-text column
+
+    Returns:
+        DataFrame with the original headers, in the original column order
+    """
+    data = {}
+    for col, column_model in model["columns"].items():
+        kind = column_model["kind"]
+        if kind == "key":
+            data[col] = np.arange(first_row, first_row + rows, dtype=np.int64) + column_model["start"]
+        elif kind == "text":
+            values = np.full(rows, None, dtype=object)
+            pool = text_pools.get(col)
+            if pool:
+                answered = rng.random(rows) < column_model["rate"]
+                values[answered] = np.asarray(pool, dtype=object)[rng.integers(len(pool), size=int(answered.sum()))]
+            data[col] = values
+        elif kind == "numeric":
+            values = _sample(column_model["values"], column_model["probabilities"], rows, rng)
+            data[col] = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").astype("float64").to_numpy()
+        else:
+            data[col] = _sample(column_model["values"], column_model["probabilities"], rows, rng)
+    for group in model["groups"]:
+        patterns = np.empty((len(group["patterns"]), len(group["columns"])), dtype=object)
+        patterns[:] = group["patterns"]
+        drawn = patterns[rng.choice(len(patterns), size=rows, p=group["probabilities"])]
+        for position, col in enumerate(group["columns"]):
+            data[col] = drawn[:, position]
+    chunk = pd.DataFrame({name: data[name] for name in model["names"]})
+    chunk.columns = model["headers"]
+    return chunk
+
+def _arrow_schema(model: dict):
+    """Arrow schema of the generated chunks, fixed so every chunk is written alike."""
+    import pyarrow as pa
+    fields = []
+    for name, header in zip(model["names"], model["headers"]):
+        column_model = model["columns"].get(name, {"kind": "choice"})
+        if column_model["kind"] == "key":
+            fields.append(pa.field(header, pa.int64()))
+        elif column_model["kind"] == "numeric":
+            fields.append(pa.field(header, pa.float64()))
+        else:
+            fields.append(pa.field(header, pa.string()))
+    return pa.schema(fields)
+
+def generate_survey_file(
+    source_file: str,
+    output_file: str,
+    rows: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: Optional[int] = 0,
+) -> str:
+    """
+    Write a synthetic survey file with the headers and answer distributions of source_file.
+
+    Args:
+        source_file: Survey CSV file to learn the distributions from
+        output_file: Path of the synthetic file (.feather for Arrow IPC, CSV otherwise)
+        rows: Number of synthetic respondents
+        chunk_size: Respondents generated and written at a time
+        seed: Seed of the random generator (None for a random run)
+
+    Returns:
+        Path of the written file
+    """
+    model = learn_survey_model(source_file)
+    rng = np.random.default_rng(seed)
+    text_pools = {
+        col: _generate_text_pool(column_model, rng)
+        for col, column_model in model["columns"].items() if column_model["kind"] == "text"
+    }
+    directory = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(directory, exist_ok=True)
+
+    if output_file.endswith(".feather"):
+        if _import_feather() is None:
+            raise ImportError("pyarrow is required to write .feather files")
+        import pyarrow as pa
+        schema = _arrow_schema(model)
+        with pa.OSFile(output_file, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for first_row in range(0, rows, chunk_size):
+                chunk = generate_chunk(model, min(chunk_size, rows - first_row), first_row, rng, text_pools)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    else:
+        with open(output_file, "w", encoding=CSV_OPTIONS["encoding"], newline="") as f:
+            for first_row in range(0, rows, chunk_size):
+                chunk = generate_chunk(model, min(chunk_size, rows - first_row), first_row, rng, text_pools)
+                chunk.to_csv(f, header=first_row == 0, index=False,
+                             quoting=CSV_OPTIONS["quoting"], escapechar=CSV_OPTIONS["escapechar"])
+    return output_file
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic survey file shaped like a real survey year.")
+    parser.add_argument("--source", default="data/2025.csv", help="Survey CSV file to learn from")
+    parser.add_argument("--rows", type=int, required=True, help="Number of synthetic respondents")
+    parser.add_argument("--output", required=True, help="Output path (.feather for Arrow IPC, CSV otherwise)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Respondents per written chunk")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    output_file = generate_survey_file(args.source, args.output, args.rows, args.chunk_size, args.seed)
+    print(f"Wrote {args.rows} synthetic respondents to {output_file} ({os.path.getsize(output_file)} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Resolution of the GenAI usefulness/harmfulness task scale columns."""
+
+import logging
+import re
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+from src.config.config import GROUPED_TASK_SCALES, PHASE_KEY_TO_COLUMN_PHASE
+from src.utils.column_index import get_column_index
+
+SCALE_TAGS = ['Scale 1', 'Scale 2']
+
+logger = logging.getLogger(__name__)
+
+def normalize_string(s):
+    if pd.isna(s):
+        return ""
+    s = str(s)
+    s = s.replace('and goals ', '')
+    s = s.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&#39;', "'")
+    s = re.sub(r'\s+', ' ', s)
+    s = re.sub(r'[^\w\s]', '', s)
+    return s.strip().lower()
+
+def _resolve_task_scale_columns(columns: list) -> Dict[str, Dict[str, Dict[str, Optional[str]]]]:
+    """Match every (phase, task, scale tag) in GROUPED_TASK_SCALES against the given columns."""
+    norm_cols = [normalize_string(col) for col in columns]
+    resolved = {}
+    unresolved = []
+    for phase_key, phase in GROUPED_TASK_SCALES.items():
+        norm_phase = normalize_string(PHASE_KEY_TO_COLUMN_PHASE.get(phase_key, phase_key))
+        task_scale_cols = {task: {scale_tag: None for scale_tag in SCALE_TAGS} for task in phase['tasks']}
+        for task in phase['tasks']:
+            norm_task = normalize_string(task)
+            task_words = [word for word in norm_task.split() if len(word) > 3]
+            for scale_tag in SCALE_TAGS:
+                norm_scale = normalize_string(scale_tag)
+                candidates = [
+                    (col, norm_col) for col, norm_col in zip(columns, norm_cols)
+                    if norm_phase in norm_col and norm_scale in norm_col
+                ]
+                match = next((col for col, norm_col in candidates if norm_task in norm_col), None)
+                if match is None:
+                    # Partial match: any significant word of the task is enough
+                    match = next(
+                        (col for col, norm_col in candidates if any(word in norm_col for word in task_words)),
+                        None
+                    )
+                task_scale_cols[task][scale_tag] = match
+                if match is None:
+                    unresolved.append(f"{phase_key} / {task} / {scale_tag}")
+        resolved[phase_key] = task_scale_cols
+    if unresolved:
+        logger.warning("%d task scale columns not found in dataset: %s", len(unresolved), '; '.join(unresolved))
+    return resolved
+
+def get_task_scale_columns(columns: Iterable[str]) -> Dict[str, Dict[str, Dict[str, Optional[str]]]]:
+    """
+    Get the task -> scale column mapping for every phase in GROUPED_TASK_SCALES.
+    
+    The mapping is resolved once per dataset schema and cached on its column
+    index; tasks without a matching column map to None and are reported once.
+    
+    Args:
+        columns: Column names of the dataset, e.g. df.columns
+        
+    Returns:
+        Dictionary phase key -> task -> {'Scale 1': column, 'Scale 2': column}
+    """
+    index = get_column_index(columns)
+    task_scale_cols = index.derived.get("task_scale_columns")
+    if task_scale_cols is None:
+        task_scale_cols = _resolve_task_scale_columns(index.columns)
+        index.derived["task_scale_columns"] = task_scale_cols
+    return task_scale_cols
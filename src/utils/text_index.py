@@ -0,0 +1,159 @@
+"""Tokenized corpus index of the free-text responses to a survey question."""
+
+import functools
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.bounded_cache import LRUCache
+from src.utils.data_processing import get_dataset_fingerprint
+
+# Words are lower-cased runs of word characters
+TOKEN_PATTERN = r'\b\w+\b'
+
+# Words shorter than this are left out of the word statistics (like stop words)
+MIN_WORD_LENGTH = 3
+
+# Maximum number of (dataset, column) corpus indexes kept in the index cache
+CORPUS_INDEX_CACHE_MAX_ENTRIES = 128
+
+_corpus_index_cache = LRUCache(CORPUS_INDEX_CACHE_MAX_ENTRIES)
+
+@functools.lru_cache(maxsize=None)
+def get_stopwords() -> frozenset:
+    """Return the stop words left out of the word statistics (those of the word clouds)."""
+    # Imported on first use: the wordcloud package loads matplotlib
+    from wordcloud import STOPWORDS
+    return frozenset(STOPWORDS)
+
+class CorpusIndex:
+    """
+    Tokens of a list of text responses, encoded once for all text views.
+
+    Every non-empty response is a document. Its lower-cased tokens are stored
+    as ids into the vocabulary, all documents back to back in token_ids, with
+    document i spanning token_ids[spans[i]:spans[i + 1]]. Term ids follow the
+    order of first occurrence, so ranking terms by count with ties by id
+    matches collections.Counter.most_common over the joined text.
+
+    Attributes:
+        documents: The responses, as strings
+        rows: Row labels of the responses in the source column
+        vocabulary: Term of every term id
+        token_ids: Term ids of all tokens, document after document
+        spans: Start offset of every document in token_ids, plus the end
+        term_counts: Occurrences of every term
+        document_frequencies: Number of documents containing every term
+        analyzed: Terms counted in word statistics (not a stop word, at least
+            MIN_WORD_LENGTH long); computed on first use
+    """
+
+    def __init__(self, responses: Iterable):
+        series = responses if isinstance(responses, pd.Series) else pd.Series(list(responses), dtype=object)
+        series = series.astype(object)
+        is_text = series.map(lambda r: isinstance(r, str) and bool(r.strip())).to_numpy(dtype=bool)
+        texts = series[is_text]
+        self.documents: np.ndarray = texts.to_numpy(dtype=object)
+        self.rows: pd.Index = texts.index
+        tokens = texts.str.lower().str.findall(TOKEN_PATTERN)
+        lengths = tokens.str.len().to_numpy(dtype=np.int64)
+        self.spans: np.ndarray = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        # explode turns an empty token list into one NaN row, which is dropped
+        flat = tokens.explode().dropna().to_numpy(dtype=object)
+        codes, vocabulary = pd.factorize(flat, sort=False)
+        self.token_ids: np.ndarray = codes.astype(np.int32)
+        self.vocabulary: np.ndarray = np.asarray(vocabulary, dtype=object)
+        terms = len(self.vocabulary)
+        self.term_counts: np.ndarray = np.bincount(self.token_ids, minlength=terms)
+        documents = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+        unique_pairs = np.unique(documents * max(terms, 1) + self.token_ids)
+        self.document_frequencies: np.ndarray = np.bincount(unique_pairs % max(terms, 1), minlength=terms)
+        self._analyzed: Optional[np.ndarray] = None
+        self._term_ids: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def analyzed(self) -> np.ndarray:
+        """Mask of the terms counted in word statistics, built (and the stop words loaded) on first use."""
+        if self._analyzed is None:
+            stopwords = get_stopwords()
+            self._analyzed = np.array(
+                [term not in stopwords and len(term) >= MIN_WORD_LENGTH for term in self.vocabulary], dtype=bool
+            )
+        return self._analyzed
+
+    def get_term_id(self, term: str) -> Optional[int]:
+        """Return the id of a (lower-case) term, or None if no response contains it."""
+        if self._term_ids is None:
+            self._term_ids = {term: i for i, term in enumerate(self.vocabulary)}
+        return self._term_ids.get(term)
+
+    def get_document_terms(self, position: int) -> np.ndarray:
+        """Return the term ids of the tokens of the document at a position."""
+        return self.token_ids[self.spans[position]:self.spans[position + 1]]
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Rank the analyzed terms by count, like Counter.most_common over the joined responses.
+
+        Args:
+            n: Number of terms to return; all analyzed terms if None
+
+        Returns:
+            List of (term, count), most frequent first
+        """
+        ids = np.flatnonzero(self.analyzed)
+        order = ids[np.argsort(-self.term_counts[ids], kind="stable")]
+        if n is not None:
+            order = order[:n]
+        return [(self.vocabulary[i], int(self.term_counts[i])) for i in order]
+
+    def frequencies(self) -> Dict[str, int]:
+        """Return the counts of the analyzed terms, most frequent first."""
+        return dict(self.most_common())
+
+def build_corpus_index(responses: Iterable) -> CorpusIndex:
+    """Tokenize a list (or Series) of text responses into a CorpusIndex."""
+    return CorpusIndex(responses)
+
+def get_corpus_index(df: pd.DataFrame, col: str) -> CorpusIndex:
+    """
+    Get the corpus index of the responses to a column.
+
+    Indexes are cached per dataset fingerprint and column, so a column of a
+    loaded survey year is tokenized once; frames without a fingerprint are
+    indexed every time. The index is shared and must be treated as read-only.
+
+    Args:
+        df: Survey DataFrame
+        col: Free-text column
+
+    Returns:
+        CorpusIndex of df[col]
+    """
+    fingerprint = get_dataset_fingerprint(df)
+    key = (fingerprint, col)
+    if fingerprint is not None:
+        index = _corpus_index_cache.get(key)
+        if index is not None:
+            return index
+    index = build_corpus_index(df[col])
+    if fingerprint is not None:
+        _corpus_index_cache.put(key, index)
+    return index
+
+def get_corpus_index_cache_stats() -> dict:
+    """
+    Get the counters of the corpus index cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, current size and max size
+    """
+    return _corpus_index_cache.stats()
+
+def clear_corpus_index_cache() -> None:
+    """Drop all cached corpus indexes and reset the cache counters."""
+    _corpus_index_cache.clear()
@@ -0,0 +1,56 @@
+"""Production WSGI entry point for multi-worker servers.
+
+Usage:
+    gunicorn --config gunicorn.conf.py wsgi:server
+
+Importing this module preloads every survey year: the data is loaded and
+encoded, every page and chart figure is built into the page and figure
+caches, and the open-ended search indexes are built. With preload_app (see
+gunicorn.conf.py) this happens once in the master process, and the workers
+forked from it share the loaded data copy-on-write instead of each loading
+its own copy.
+"""
+
+import gc
+import time
+
+from app import PAGE_BUILDERS, PROGRESSIVE_ROUTES, app, get_page_content, prepare_text_views
+from src.components.figure_cache import get_figure_cache_stats
+from src.components.wordclouds import shutdown_wordcloud_workers
+from src.config.config import PROGRESSIVE_LOADING, YEAR_TO_FILE
+from src.utils.data_processing import load_data_file
+
+# The Flask server the WSGI server calls
+server = app.server
+
+def preload() -> dict:
+    """
+    Load every year in YEAR_TO_FILE and warm the caches served by the callbacks.
+
+    Every page is built for the page cache; progressive pages are also
+    built in full, so that the figures of their charts are in the figure
+    cache. A word-cloud worker pool started by a page (see make_wordcloud)
+    is stopped once its renders are done: threads do not survive a fork,
+    and the workers start their own pool on first use. Finally the loaded
+    objects are moved out of the garbage collector's generations
+    (gc.freeze), so collections in the workers do not write to, and
+    thereby copy, the shared pages.
+
+    Returns:
+        Dictionary with the preload duration in seconds and the figure cache counters
+    """
+    start = time.perf_counter()
+    prepare_text_views()
+    for year, data_file in YEAR_TO_FILE.items():
+        df = load_data_file(data_file)
+        for pathname, build_page in PAGE_BUILDERS.items():
+            get_page_content(year, pathname)
+            if PROGRESSIVE_LOADING and pathname in PROGRESSIVE_ROUTES:
+                build_page(df)
+    # Waits for any queued word-cloud renders
+    shutdown_wordcloud_workers()
+    gc.collect()
+    gc.freeze()
+    return {"seconds": time.perf_counter() - start, "figure_cache": get_figure_cache_stats()}
+
+preload_report = preload()